@@ -0,0 +1,203 @@
+"""
+SQLite Connection Pool for Lateral Entry Portal API
+Keeps read-only, pragma-tuned connections alive across requests
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+
+
+class PooledConnection(sqlite3.Connection):
+    """Connection whose close() leaves it open for the pool to reuse"""
+
+    cursor_factory = sqlite3.Cursor
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or self.cursor_factory)
+
+    def close(self):
+        """Handlers still call close(); the pool owns the real lifetime"""
+
+    def discard(self):
+        """Really close the underlying SQLite handle"""
+        sqlite3.Connection.close(self)
+
+
+class ConnectionPool:
+    """
+    Per-worker pool of read-only SQLite connections with thread affinity.
+
+    Each thread keeps the same connection for its whole life, so the page
+    cache and prepared statements stay warm between requests. When a thread
+    exits its connection goes back to an idle list for the next thread.
+    Connections are recycled when the database file is replaced on disk
+    (new inode), and dropped after a fork so workers never share handles.
+    """
+
+    def __init__(
+        self,
+        db_path,
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-32768,
+        busy_timeout=5000,
+        max_idle=16,
+        row_factory=sqlite3.Row,
+        cursor_factory=sqlite3.Cursor,
+        on_connect=None,
+    ):
+        self.db_path = str(db_path)
+        self.mmap_size = mmap_size
+        self.cache_size = cache_size  # negative = KiB, as in PRAGMA cache_size
+        self.busy_timeout = busy_timeout
+        self.max_idle = max_idle
+        self.row_factory = row_factory
+        self.cursor_factory = cursor_factory
+        self.on_connect = on_connect  # called with every new connection
+
+        self.connections_opened = 0
+        self._data_version = 0
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._idle = []
+        self._file_id = None
+        self._generation = 0
+
+    def _stat_file(self):
+        try:
+            st = os.stat(self.db_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    def _enable_wal(self):
+        """Switch the file to WAL once; journal_mode is persistent in the file"""
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout / 1000)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            # Read-only mount or locked by a writer - readers still work
+            pass
+
+    def _open(self):
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            factory=PooledConnection,
+            timeout=self.busy_timeout / 1000,
+        )
+        conn.row_factory = self.row_factory
+        conn.cursor_factory = self.cursor_factory
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout)}")
+        conn.execute("PRAGMA query_only = ON")
+        if self.on_connect is not None:
+            self.on_connect(conn)
+        self.connections_opened += 1
+        return conn
+
+    def _check_file(self):
+        file_id = self._stat_file()
+        if file_id == self._file_id:
+            return
+        with self._lock:
+            if file_id == self._file_id:
+                return
+            self._file_id = file_id
+            self._generation += 1
+            for conn, _ in self._idle:
+                conn.discard()
+            self._idle = []
+            if file_id is not None:
+                self._enable_wal()
+
+    def _checkin(self, conn, generation):
+        with self._lock:
+            if generation == self._generation and len(self._idle) < self.max_idle:
+                self._idle.append((conn, generation))
+                return
+        conn.discard()
+
+    def _checkout(self):
+        with self._lock:
+            while self._idle:
+                conn, generation = self._idle.pop()
+                if generation == self._generation:
+                    return conn
+                conn.discard()
+        return self._open()
+
+    def connection(self):
+        """Return the calling thread's connection, opening one if needed"""
+        if os.getpid() != self._pid:
+            # Forked worker: never touch handles inherited from the parent
+            self._reset()
+        self._check_file()
+
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is not None:
+            if local.generation == self._generation:
+                return conn
+            conn.discard()
+
+        conn = self._checkout()
+        local.conn = conn
+        local.generation = self._generation
+        weakref.finalize(
+            threading.current_thread(), self._checkin, conn, self._generation
+        )
+        return conn
+
+    def open_connection(self):
+        """
+        A standalone connection configured like the pooled ones, for callers
+        that need one handle shared across threads. The caller owns it and
+        closes it with discard().
+        """
+        self._check_file()
+        return self._open()
+
+    def data_version(self, conn):
+        """
+        Process-wide counter that moves whenever the database changes.
+
+        PRAGMA data_version is only comparable within one connection, so each
+        connection remembers the last value it saw and bumps the shared
+        counter when its own value moves (or the first time it is asked).
+        A plain sqlite3.Connection has nowhere to remember it, so, like a
+        connection asked for the first time, every call counts as a change.
+        """
+        current = conn.execute("PRAGMA data_version").fetchone()[0]
+        if getattr(conn, "seen_data_version", None) != current:
+            try:
+                conn.seen_data_version = current
+            except AttributeError:
+                pass
+            with self._lock:
+                self._data_version += 1
+        return self._data_version
+
+    def close_all(self):
+        """Close idle connections and the calling thread's connection"""
+        with self._lock:
+            for conn, _ in self._idle:
+                conn.discard()
+            self._idle = []
+            self._generation += 1
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.discard()
+            self._local.conn = None
@@ -0,0 +1,154 @@
+"""
+Typo-tolerant name search for the Lateral Entry Portal
+Inverted trigram index over the words of entrant names, ranked by
+trigram similarity
+"""
+
+import heapq
+import math
+import threading
+from array import array
+
+from suggest import normalize
+
+FUZZY_THRESHOLD = 0.3
+
+
+def trigrams(word):
+    """Trigrams of a word padded as pg_trgm does: 'ravi' -> '  r', ' ra', ..., 'vi '"""
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Immutable two-level index over distinct normalized names.
+
+    Names share a small vocabulary of words, so typos are resolved per
+    word: each trigram maps to the vocabulary words containing it, and a
+    query word finds the words whose trigram sets have Jaccard similarity
+    of at least `threshold` with its own. Such a word shares at least
+    threshold * len(query trigrams) of them, so it must contain one of the
+    query's rarest (len - needed + 1) trigrams and only those posting lists
+    are read. Matched words then lead to names through per-word name lists;
+    a name scores the mean, over query words, of its best matching word.
+    Nothing is ever scanned linearly: the cost follows the posting lists of
+    the words that actually match.
+    """
+
+    __slots__ = (
+        "data_version",
+        "keys",
+        "key_rows",
+        "key_words",
+        "words",
+        "word_grams",
+        "word_names",
+        "postings",
+    )
+
+    def __init__(self, data_version, names):
+        self.data_version = data_version
+
+        by_key = {}
+        for entrant_id, name, batch_year in names:
+            key = normalize(name)
+            if key:
+                by_key.setdefault(key, []).append((entrant_id, name, batch_year))
+        self.keys = sorted(by_key)
+        self.key_rows = [by_key[key] for key in self.keys]
+        self.key_words = array("l", (len(key.split()) for key in self.keys))
+
+        word_names = {}
+        for i, key in enumerate(self.keys):
+            for word in set(key.split()):
+                word_names.setdefault(word, []).append(i)
+        self.words = sorted(word_names)
+        self.word_names = [array("l", word_names[word]) for word in self.words]
+        self.word_grams = array("l")
+
+        postings = {}
+        for i, word in enumerate(self.words):
+            grams = trigrams(word)
+            self.word_grams.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+        self.postings = {gram: array("l", rows) for gram, rows in postings.items()}
+
+    @classmethod
+    def load(cls, conn, data_version):
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, name, batch_year FROM lateral_entrants")
+        return cls(data_version, [tuple(row) for row in cursor.fetchall()])
+
+    def similar_words(self, word, threshold):
+        """{vocabulary position: Jaccard similarity} for words like `word`"""
+        query_grams = trigrams(word)
+        needed = max(1, math.ceil(threshold * len(query_grams)))
+        empty = array("l")
+        rare = sorted(query_grams, key=lambda gram: len(self.postings.get(gram, empty)))
+
+        similar = {}
+        for gram in rare[: len(query_grams) - needed + 1]:
+            for i in self.postings.get(gram, empty):
+                if i in similar:
+                    continue
+                shared = len(query_grams & trigrams(self.words[i]))
+                similarity = shared / (len(query_grams) + self.word_grams[i] - shared)
+                similar[i] = similarity if similarity >= threshold else 0
+        return {i: similarity for i, similarity in similar.items() if similarity}
+
+    def search(self, query, limit=50, threshold=FUZZY_THRESHOLD):
+        """
+        [(similarity, entrant_id, name, batch_year), ...] best first, at most
+        `limit` entrants. similarity is the mean best word similarity over
+        the query's words, rounded to three places; ties go to names with
+        fewer words, then alphabetically.
+        """
+        query_words = list(dict.fromkeys(normalize(query).split()))
+        if not query_words or limit <= 0:
+            return []
+
+        scores = {}
+        for word in query_words:
+            best = {}
+            for i, similarity in self.similar_words(word, threshold).items():
+                for key in self.word_names[i]:
+                    if similarity > best.get(key, 0):
+                        best[key] = similarity
+            for key, similarity in best.items():
+                scores[key] = scores.get(key, 0) + similarity
+
+        ranked = heapq.nsmallest(
+            limit,
+            scores,
+            key=lambda key: (-scores[key], self.key_words[key], self.keys[key]),
+        )
+        results = []
+        for key in ranked:
+            similarity = round(scores[key] / len(query_words), 3)
+            for entrant_id, name, batch_year in self.key_rows[key]:
+                results.append((similarity, entrant_id, name, batch_year))
+        return results[:limit]
+
+
+class FuzzyStore:
+    """The TrigramIndex for the pool's current data version, rebuilt on change"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.builds = 0
+        self._lock = threading.Lock()
+        self._index = None
+
+    def current(self, conn):
+        version = self.pool.data_version(conn)
+        index = self._index
+        if index is not None and index.data_version == version:
+            return index
+        with self._lock:
+            index = self._index
+            if index is None or index.data_version != version:
+                index = self._index = TrigramIndex.load(conn, version)
+                self.builds += 1
+        return index
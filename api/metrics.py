@@ -0,0 +1,230 @@
+"""
+Request metrics for the Lateral Entry Portal API
+Histograms and counters rendered in the Prometheus text exposition format
+"""
+
+import bisect
+import sqlite3
+import threading
+import time
+
+# Latency buckets in seconds; most API requests finish well under 10 ms
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def format_labels(names, values, extra=""):
+    pairs = [
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with one series per label tuple"""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield self.name, format_labels(self.labelnames, labels), value
+
+
+class Histogram:
+    """Fixed-bucket histogram with one series per label tuple"""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # Per-bucket counts (the last slot is +Inf), then sum
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self):
+        with self._lock:
+            series = sorted(
+                (labels, list(values)) for labels, values in self._series.items()
+            )
+        for labels, values in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), values):
+                cumulative += count
+                le = f'le="{bound}"'
+                yield (
+                    self.name + "_bucket",
+                    format_labels(self.labelnames, labels, le),
+                    cumulative,
+                )
+            label_text = format_labels(self.labelnames, labels)
+            yield self.name + "_sum", label_text, values[-1]
+            yield self.name + "_count", label_text, cumulative
+
+
+class CallbackMetric:
+    """Metric read at scrape time from counters kept elsewhere (e.g. caches)"""
+
+    def __init__(self, name, documentation, kind, labelnames, read):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.read = read
+
+    def samples(self):
+        for labels, value in self.read():
+            yield self.name, format_labels(self.labelnames, labels), value
+
+
+class Registry:
+    """Named collection of metrics rendered together for /api/metrics"""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(self, name, documentation, kind, labelnames, read):
+        return self.register(
+            CallbackMetric(name, documentation, kind, labelnames, read)
+        )
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class RequestStats:
+    """Timings and counts gathered while one request is handled"""
+
+    __slots__ = ("start", "sql_seconds", "serialize_seconds", "rows", "cache_hit")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.sql_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.rows = 0
+        self.cache_hit = False
+
+
+_local = threading.local()
+
+
+def start_request():
+    _local.stats = RequestStats()
+    return _local.stats
+
+
+def finish_request():
+    stats = getattr(_local, "stats", None)
+    _local.stats = None
+    return stats
+
+
+def current():
+    """The calling thread's RequestStats, or None outside a request"""
+    return getattr(_local, "stats", None)
+
+
+class TimedCursor(sqlite3.Cursor):
+    """
+    Cursor that charges statement and fetch time, and rows fetched, to the
+    current request. SQLite does most of its work while rows are stepped,
+    so fetches are timed as well as execute().
+    """
+
+    def execute(self, *args):
+        stats = current()
+        if stats is None:
+            return super().execute(*args)
+        start = time.perf_counter()
+        try:
+            return super().execute(*args)
+        finally:
+            stats.sql_seconds += time.perf_counter() - start
+
+    def _fetch(self, fetch, *args):
+        stats = current()
+        if stats is None:
+            return fetch(*args)
+        start = time.perf_counter()
+        try:
+            rows = fetch(*args)
+        finally:
+            stats.sql_seconds += time.perf_counter() - start
+        if isinstance(rows, list):
+            stats.rows += len(rows)
+        elif rows is not None:
+            stats.rows += 1
+        return rows
+
+    def fetchone(self):
+        return self._fetch(super().fetchone)
+
+    def fetchmany(self, *args):
+        return self._fetch(super().fetchmany, *args)
+
+    def fetchall(self):
+        return self._fetch(super().fetchall)
@@ -4,24 +4,95 @@ Provides RESTful endpoints for all portal data
 """
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import sqlite3
+import atexit
+import base64
+import csv
+import functools
+import hashlib
+import io
+import json
+import operator
 import os
+import re
+import sqlite3
+import time
 from datetime import datetime
 
+import metrics
+from db_pool import ConnectionPool
+from facets import FACET_COLUMNS, FacetStore, entrant_rows
+from fuzzy import FUZZY_THRESHOLD, FuzzyStore
+from snapshot import SnapshotStore
+from sql_trace import SqlTracer, TracingCursor
+from suggest import SuggestStore
+from versioned_cache import VersionedLRUCache
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Default JSON provider that charges encoding time to the current request"""
+
+    def dumps(self, obj, **kwargs):
+        stats = metrics.current()
+        if stats is None:
+            return super().dumps(obj, **kwargs)
+        start = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            stats.serialize_seconds += time.perf_counter() - start
+
+
 app = Flask(__name__)
+app.json = TimedJSONProvider(app)
 CORS(app)  # Enable CORS for frontend access
 
-DB_PATH = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), "database", "lateral_entry.db"
+# Per-route request metrics at /api/metrics; LATERAL_ENTRY_METRICS=0 turns them off
+METRICS_ENABLED = os.environ.get("LATERAL_ENTRY_METRICS", "1") != "0"
+
+DB_PATH = os.environ.get(
+    "LATERAL_ENTRY_DB",
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "database",
+        "lateral_entry.db",
+    ),
+)
+
+# Opt-in SQL trace (LATERAL_ENTRY_SQL_TRACE=1): slow-query log with query
+# plans, plus a per-statement report written on shutdown
+sql_tracer = None
+if os.environ.get("LATERAL_ENTRY_SQL_TRACE") == "1":
+    sql_tracer = SqlTracer(
+        threshold_ms=float(os.environ.get("LATERAL_ENTRY_SLOW_QUERY_MS", 50)),
+        report_path=os.environ.get("LATERAL_ENTRY_SQL_REPORT"),
+    )
+    atexit.register(sql_tracer.write_report)
+
+if sql_tracer:
+    cursor_factory = TracingCursor
+elif METRICS_ENABLED:
+    cursor_factory = metrics.TimedCursor
+else:
+    cursor_factory = sqlite3.Cursor
+
+# One pool per worker process; connections are opened lazily per thread
+db_pool = ConnectionPool(
+    DB_PATH,
+    cursor_factory=cursor_factory,
+    on_connect=sql_tracer.install if sql_tracer else None,
 )
+atexit.register(db_pool.close_all)
+
+
+# Filtered totals for /api/entrants, keyed by the normalized filter set
+count_cache = VersionedLRUCache(maxsize=512)
 
 
 def get_db():
-    """Create database connection"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-    return conn
+    """Get this thread's pooled, read-only database connection"""
+    return db_pool.connection()
 
 
 def dict_from_row(row):
@@ -29,6 +100,424 @@ def dict_from_row(row):
     return dict(zip(row.keys(), row)) if row else None
 
 
+# Rendered GET responses, valid until the database changes
+response_cache = VersionedLRUCache(maxsize=1024)
+RESPONSE_CACHE_MAX_BYTES = 1024 * 1024
+
+
+def cached_response(view):
+    """
+    Serve a read endpoint from response_cache while the data is unchanged.
+
+    The key is the endpoint plus its view args and normalized query args;
+    entries are tagged with the pool's data version. Responses carry a strong
+    ETag (hash of the body) so a client sending it back gets 304 Not Modified
+    without a query or serialization. Only 200 responses are cached.
+    """
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not response_cache.maxsize or request.method != "GET":
+            # A zero-size cache turns caching off; bodies are not part of the key
+            return view(*args, **kwargs)
+
+        version = db_pool.data_version(get_db())
+        key = (
+            request.endpoint,
+            tuple(sorted(kwargs.items())),
+            tuple(sorted(request.args.items(multi=True))),
+        )
+        entry = response_cache.get(key, version)
+        if entry is None:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200 or response.is_streamed:
+                return response
+            body = response.get_data()
+            etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+            entry = (body, response.mimetype, etag)
+            if len(body) <= RESPONSE_CACHE_MAX_BYTES:
+                response_cache.set(key, version, entry)
+        else:
+            stats = metrics.current()
+            if stats is not None:
+                stats.cache_hit = True
+
+        body, mimetype, etag = entry
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.response_class(body, mimetype=mimetype)
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    return wrapper
+
+
+metrics_registry = metrics.Registry()
+REQUEST_SECONDS = metrics_registry.histogram(
+    "lateral_entry_request_duration_seconds",
+    "Wall time to produce a response",
+    ["route", "method"],
+)
+SQL_SECONDS = metrics_registry.histogram(
+    "lateral_entry_sql_duration_seconds",
+    "Time spent executing statements and fetching rows, per request",
+    ["route"],
+)
+SERIALIZE_SECONDS = metrics_registry.histogram(
+    "lateral_entry_serialization_duration_seconds",
+    "Time spent encoding JSON, per request",
+    ["route"],
+)
+REQUESTS = metrics_registry.counter(
+    "lateral_entry_requests_total", "Requests handled", ["route", "method", "status"]
+)
+ROWS_RETURNED = metrics_registry.counter(
+    "lateral_entry_rows_returned_total", "Rows fetched from SQLite", ["route"]
+)
+BYTES_SENT = metrics_registry.counter(
+    "lateral_entry_response_bytes_total", "Response body bytes sent", ["route"]
+)
+CACHE_HITS = metrics_registry.counter(
+    "lateral_entry_response_cache_hits_total",
+    "Requests answered from the response cache",
+    ["route"],
+)
+metrics_registry.callback(
+    "lateral_entry_cache_lookups_total",
+    "Lookups in the in-process caches",
+    "counter",
+    ["cache", "result"],
+    lambda: [
+        (("response", "hit"), response_cache.hits),
+        (("response", "miss"), response_cache.misses),
+        (("count", "hit"), count_cache.hits),
+        (("count", "miss"), count_cache.misses),
+    ],
+)
+
+
+def count_streamed_bytes(chunks, route):
+    """Pass a streamed body through, adding its size to BYTES_SENT at the end"""
+    sent = 0
+    try:
+        for chunk in chunks:
+            sent += len(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+            yield chunk
+    finally:
+        BYTES_SENT.inc((route,), sent)
+
+
+@app.before_request
+def start_request_metrics():
+    if METRICS_ENABLED:
+        metrics.start_request()
+
+
+@app.after_request
+def record_request_metrics(response):
+    stats = metrics.finish_request()
+    if stats is None:
+        return response
+
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    REQUEST_SECONDS.observe((route, request.method), time.perf_counter() - stats.start)
+    SQL_SECONDS.observe((route,), stats.sql_seconds)
+    SERIALIZE_SECONDS.observe((route,), stats.serialize_seconds)
+    REQUESTS.inc((route, request.method, str(response.status_code)))
+    ROWS_RETURNED.inc((route,), stats.rows)
+    if stats.cache_hit:
+        CACHE_HITS.inc((route,))
+    if response.is_streamed:
+        response.response = count_streamed_bytes(response.response, route)
+    else:
+        BYTES_SENT.inc((route,), response.content_length or 0)
+    return response
+
+
+# Full-text search: columns of lateral_entrants_fts and their BM25 weights
+SEARCH_FIELDS = ["name", "ministry", "department", "position"]
+SEARCH_WEIGHTS = {"name": 10.0, "ministry": 4.0, "department": 3.0, "position": 2.0}
+SEARCH_RANK = "bm25(lateral_entrants_fts, {})".format(
+    ", ".join(str(SEARCH_WEIGHTS[field]) for field in SEARCH_FIELDS)
+)
+
+
+def fts_match_expression(text, fields):
+    """
+    Build an FTS5 MATCH expression from free text.
+    Every word must match (as a prefix) in one of the given columns.
+    Returns None when the text has no searchable words.
+    """
+    terms = re.findall(r"\w+", text)
+    if not terms:
+        return None
+    phrase = " ".join(f'"{term}"*' for term in terms)
+    return f"{{{' '.join(fields)}}} : ({phrase})"
+
+
+# PRAGMA user_version database/migrate.py sets once it has backfilled the
+# search index, summary and dimension tables. The schema script alone
+# creates those tables empty on an older database, so their existence
+# says nothing about their contents.
+MIGRATED_VERSION = 1
+
+
+def is_migrated(cursor):
+    """Check whether database/migrate.py has run on this database"""
+    cursor.execute("PRAGMA user_version")
+    return cursor.fetchone()[0] >= MIGRATED_VERSION
+
+
+def has_search_index(cursor):
+    """Check whether database/migrate.py has built the full-text index"""
+    return is_migrated(cursor)
+
+
+def name_search_filter(cursor, search):
+    """
+    WHERE fragment and parameter for the listing's name search: prefix
+    match through the full-text index, or LIKE before it is built
+    """
+    search_match = fts_match_expression(search, ["name"])
+    if search_match and has_search_index(cursor):
+        return (
+            " AND id IN (SELECT rowid FROM lateral_entrants_fts"
+            " WHERE lateral_entrants_fts MATCH ?)",
+            search_match,
+        )
+    return " AND name LIKE ?", f"%{search}%"
+
+
+# Canonical dimension tables behind the ministry and department columns
+# (see database/migrate.py): lateral_entrants column -> (alias table, key)
+DIMENSIONS = {
+    "ministry": ("ministry_aliases", "ministry_id"),
+    "department": ("department_aliases", "department_id"),
+}
+
+
+def has_dimensions(cursor):
+    """Check whether database/migrate.py has normalized ministries and departments"""
+    return is_migrated(cursor)
+
+
+def dimension_filter(cursor, column, value):
+    """
+    WHERE fragment and parameter for the listing's ministry / department
+    filter: every spelling of the matching canonical rows through the
+    indexed id column, or LIKE on the text before migration
+    """
+    if has_dimensions(cursor):
+        aliases, key = DIMENSIONS[column]
+        return (
+            f" AND {key} IN (SELECT {key} FROM {aliases} WHERE alias LIKE ?)",
+            f"%{value}%",
+        )
+    return f" AND {column} LIKE ?", f"%{value}%"
+
+
+# Trigger-maintained summary tables (see lateral_entry_schema.sql) and the
+# lateral_entrants columns each one counts by
+STATS_TABLES = {
+    "stats_by_batch": ["batch_year"],
+    "stats_by_ministry": ["ministry"],
+    "stats_by_position": ["position"],
+    "stats_by_department": ["department"],
+    "stats_by_state": ["state"],
+    "stats_by_batch_position": ["batch_year", "position"],
+    "stats_by_batch_ministry": ["batch_year", "ministry"],
+    "stats_by_ministry_position": ["ministry", "position"],
+}
+
+
+def stats_tables(cursor):
+    """
+    FROM-clause source for each summary table: the table itself, or an
+    equivalent GROUP BY over lateral_entrants on a database that has not
+    been migrated yet (run database/migrate.py)
+    """
+    if is_migrated(cursor):
+        return {table: table for table in STATS_TABLES}
+    return {
+        table: (
+            f"(SELECT {', '.join(keys)}, COUNT(*) as count"
+            f" FROM lateral_entrants GROUP BY {', '.join(keys)})"
+        )
+        for table, keys in STATS_TABLES.items()
+    }
+
+
+# Named column sets for ?fields=; "card" is what createEntrantCard renders
+FIELD_PRESETS = {
+    "card": [
+        "id",
+        "name",
+        "batch_year",
+        "position",
+        "department",
+        "ministry",
+        "date_of_appointment",
+    ],
+}
+
+# lateral_entrants columns for the current schema_version
+_entrant_columns_cache = {}
+
+
+def entrant_columns(cursor):
+    """Column names of lateral_entrants, the whitelist for projections"""
+    cursor.execute("PRAGMA schema_version")
+    schema_version = cursor.fetchone()[0]
+    columns = _entrant_columns_cache.get(schema_version)
+    if columns is None:
+        cursor.execute("PRAGMA table_info(lateral_entrants)")
+        columns = [row["name"] for row in cursor.fetchall()]
+        _entrant_columns_cache.clear()
+        _entrant_columns_cache[schema_version] = columns
+    return columns
+
+
+def split_param(name):
+    return [part for part in request.args.get(name, "").split(",") if part]
+
+
+def entrant_projection(cursor, fields_param="fields"):
+    """
+    Validate ?fields= / ?exclude= / ?include= for an entrant listing.
+
+    fields lists columns (or presets) to return, exclude drops columns, and
+    include names child tables to embed. Returns (columns, include, error);
+    columns is None when the full row is wanted. id is kept whenever
+    children are included, since they are attached by entrant id.
+    """
+    columns = entrant_columns(cursor)
+    children = [key for key, _, _ in PROFILE_CHILDREN]
+
+    selected = []
+    for name in split_param(fields_param):
+        selected += FIELD_PRESETS.get(name, [name])
+    excluded = split_param("exclude")
+    include = list(dict.fromkeys(split_param("include")))
+
+    unknown = [name for name in selected + excluded if name not in columns]
+    unknown += [name for name in include if name not in children]
+    if unknown:
+        return None, None, f"Unknown fields: {', '.join(unknown)}"
+
+    if not selected and not excluded:
+        return None, include, None
+
+    required = ["id"] if include else []
+    selected = [
+        name
+        for name in dict.fromkeys(required + (selected or columns))
+        if name in required or name not in excluded
+    ]
+    if not selected:
+        return None, None, "No fields left to return after exclude"
+    return selected, include, None
+
+
+def select_list(columns, alias=None):
+    """SQL select list for a projection (None = every column)"""
+    prefix = f"{alias}." if alias else ""
+    if columns is None:
+        return f"{prefix}*"
+    return ", ".join(f'{prefix}"{column}"' for column in columns)
+
+
+# Listing order for /api/entrants, served by idx_entrants_listing.
+# NULL appointment dates sort last, as they did with plain DESC ordering.
+LISTING_DATE = "COALESCE(date_of_appointment, '')"
+LISTING_COLUMNS = ["batch_year", "date_of_appointment", "id"]
+LISTING_ORDER = f"batch_year DESC, {LISTING_DATE} DESC, id DESC"
+
+
+def listing_limit():
+    """The limit param of a listing (default 50), or None unless a positive integer"""
+    try:
+        limit = int(request.args.get("limit", 50))
+    except ValueError:
+        return None
+    return limit if limit >= 1 else None
+
+
+def listing_offset():
+    """The offset param of a listing (default 0, negatives count as 0), or None"""
+    try:
+        offset = int(request.args.get("offset", 0))
+    except ValueError:
+        return None
+    return max(offset, 0)
+
+
+def encode_cursor(entrant):
+    """Opaque keyset cursor for the position just after this entrant"""
+    key = [entrant["batch_year"], entrant["date_of_appointment"] or "", entrant["id"]]
+    token = base64.urlsafe_b64encode(json.dumps(key, separators=(",", ":")).encode())
+    return token.decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """Return the (batch_year, date, id) key of a cursor, or None if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        batch_year, date, entrant_id = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    if not (
+        isinstance(batch_year, int)
+        and isinstance(date, str)
+        and isinstance(entrant_id, int)
+    ):
+        return None
+    return batch_year, date, entrant_id
+
+
+def keyset_page_query(where, params, after, limit, columns="*"):
+    """
+    Build the SELECT for the page that follows `after` in LISTING_ORDER.
+
+    SQLite cannot seek on the rowid tail of a row-value comparison, so the
+    "after" condition is split into three index range scans: same batch and
+    date with a smaller id, same batch with an earlier date, earlier batches.
+    Each reads at most `limit` rows, so every page costs the same as the first.
+    """
+    base = f"SELECT {columns} FROM lateral_entrants WHERE 1=1{where}"
+    if after is None:
+        return f"{base} ORDER BY {LISTING_ORDER} LIMIT ?", params + [limit]
+
+    batch_year, date, entrant_id = after
+    # (condition, params, order) - the first range orders by id alone so
+    # SQLite walks the index backwards instead of sorting the tie group
+    ranges = [
+        (
+            f" AND batch_year = ? AND {LISTING_DATE} = ? AND id < ?",
+            [batch_year, date, entrant_id],
+            "id DESC",
+        ),
+        (
+            f" AND batch_year = ? AND {LISTING_DATE} < ?",
+            [batch_year, date],
+            LISTING_ORDER,
+        ),
+        (" AND batch_year < ?", [batch_year], LISTING_ORDER),
+    ]
+    parts = []
+    query_params = []
+    for condition, range_params, order in ranges:
+        parts.append(f"SELECT * FROM ({base}{condition} ORDER BY {order} LIMIT ?)")
+        query_params += params + range_params + [limit]
+
+    query = (
+        f"SELECT * FROM ({' UNION ALL '.join(parts)})"
+        f" ORDER BY {LISTING_ORDER} LIMIT ?"
+    )
+    return query, query_params + [limit]
+
+
 @app.route("/api/health", methods=["GET"])
 def health_check():
     """Health check endpoint"""
@@ -37,59 +526,73 @@ def health_check():
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "database": os.path.exists(DB_PATH),
+            "response_cache": {
+                "entries": len(response_cache),
+                "hits": response_cache.hits,
+                "misses": response_cache.misses,
+            },
+            "snapshot": (
+                {"entrants": len(current_snapshot()), "loads": snapshot_store.loads}
+                if snapshot_store
+                else None
+            ),
         }
     )
 
 
+@app.route("/api/metrics", methods=["GET"])
+def get_metrics():
+    """Request metrics in the Prometheus text exposition format"""
+    return app.response_class(
+        metrics_registry.render(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @app.route("/api/stats", methods=["GET"])
+@cached_response
 def get_stats():
-    """Get comprehensive portal statistics"""
+    """Get comprehensive portal statistics (read from the stats_by_* tables)"""
     conn = get_db()
     cursor = conn.cursor()
+    tables = stats_tables(cursor)
 
     # Total count
-    cursor.execute("SELECT COUNT(*) as total FROM lateral_entrants")
+    cursor.execute(
+        f"SELECT COALESCE(SUM(count), 0) as total FROM {tables['stats_by_batch']}"
+    )
     total = cursor.fetchone()["total"]
 
     # By batch
-    cursor.execute("""
-        SELECT batch_year, COUNT(*) as count 
-        FROM lateral_entrants 
-        GROUP BY batch_year 
+    cursor.execute(f"""
+        SELECT batch_year, count
+        FROM {tables['stats_by_batch']}
         ORDER BY batch_year
     """)
     by_batch = [dict_from_row(row) for row in cursor.fetchall()]
 
     # By position
-    cursor.execute("""
-        SELECT position, COUNT(*) as count 
-        FROM lateral_entrants 
-        GROUP BY position 
-        ORDER BY count DESC
+    cursor.execute(f"""
+        SELECT position, count
+        FROM {tables['stats_by_position']}
+        ORDER BY count DESC, position
     """)
     by_position = [dict_from_row(row) for row in cursor.fetchall()]
 
     # By ministry (all ministries)
-    cursor.execute("""
-        SELECT ministry, COUNT(*) as count 
-        FROM lateral_entrants 
+    cursor.execute(f"""
+        SELECT ministry, count
+        FROM {tables['stats_by_ministry']}
         WHERE ministry IS NOT NULL
-        GROUP BY ministry 
-        ORDER BY count DESC
+        ORDER BY count DESC, ministry
     """)
     by_ministry = [dict_from_row(row) for row in cursor.fetchall()]
 
-    # Count distinct ministries
-    cursor.execute(
-        "SELECT COUNT(DISTINCT ministry) as count FROM lateral_entrants WHERE ministry IS NOT NULL"
-    )
-    ministry_count = cursor.fetchone()["count"]
-
-    # Recent appointments (last 10)
+    # Recent appointments (last 10), served by idx_appointment_recent
     cursor.execute("""
         SELECT name, position, ministry, date_of_appointment
-        FROM lateral_entrants 
-        ORDER BY date_of_appointment DESC 
+        FROM lateral_entrants
+        ORDER BY date_of_appointment DESC, id
         LIMIT 10
     """)
     recent = [dict_from_row(row) for row in cursor.fetchall()]
@@ -99,7 +602,7 @@ def get_stats():
     return jsonify(
         {
             "total_appointees": total,
-            "total_ministries": ministry_count,
+            "total_ministries": len(by_ministry),
             "total_positions": len(by_position),
             "total_batches": len(by_batch),
             "by_batch": by_batch,
@@ -111,64 +614,349 @@ def get_stats():
     )
 
 
+def facet_rows(cursor):
+    """Facet index rows, counting each ministry under its canonical name"""
+    if not has_dimensions(cursor):
+        return entrant_rows(cursor)
+    columns = ", ".join(
+        (
+            "COALESCE(m.ministry_name, e.ministry)"
+            if column == "ministry"
+            else f"e.{column}"
+        )
+        for column in FACET_COLUMNS
+    )
+    cursor.execute(
+        f"SELECT e.id, {columns} FROM lateral_entrants e"
+        " LEFT JOIN ministries m ON m.id = e.ministry_id ORDER BY e.id"
+    )
+    return cursor.fetchall()
+
+
+# Bitmap facet counts for the listing filters, rebuilt when the data changes
+facet_store = FacetStore(db_pool, facet_rows)
+
+
+def entrant_facets():
+    """Facet counts for the current request's /api/entrants filters"""
+    conn = get_db()
+    cursor = conn.cursor()
+    index = facet_store.current(conn)
+
+    filters = {}
+    if request.args.get("batch_year"):
+        try:
+            batch_year = int(request.args["batch_year"])
+        except ValueError:
+            batch_year = None
+        filters["batch_year"] = index.equal("batch_year", batch_year)
+    if request.args.get("position"):
+        filters["position"] = index.equal("position", request.args["position"])
+    if request.args.get("ministry"):
+        pattern = f"%{request.args['ministry']}%"
+        if has_dimensions(cursor):
+            cursor.execute(
+                "SELECT ministry_name FROM ministries WHERE id IN"
+                " (SELECT ministry_id FROM ministry_aliases WHERE alias LIKE ?)",
+                (pattern,),
+            )
+            filters["ministry"] = functools.reduce(
+                operator.or_,
+                (index.equal("ministry", name) for (name,) in cursor.fetchall()),
+                0,
+            )
+        else:
+            filters["ministry"] = index.like("ministry", pattern)
+
+    # Filters that are not facets narrow every count
+    restrict = None
+    restrictions = []
+    if request.args.get("department"):
+        restrictions.append(
+            dimension_filter(cursor, "department", request.args["department"])
+        )
+    if request.args.get("search"):
+        restrictions.append(name_search_filter(cursor, request.args["search"]))
+    for where, param in restrictions:
+        cursor.execute(f"SELECT id FROM lateral_entrants WHERE 1=1{where}", (param,))
+        bits = index.from_ids(row[0] for row in cursor.fetchall())
+        restrict = bits if restrict is None else restrict & bits
+
+    return index.counts(filters, restrict)
+
+
+def listing_response(payload):
+    """jsonify a listing, adding facet counts for facets=1 and /api/facets"""
+    if request.endpoint == "get_facets" or request.args.get("facets") == "1":
+        payload.update(entrant_facets())
+    return jsonify(payload)
+
+
 @app.route("/api/entrants", methods=["GET"])
+@cached_response
 def get_entrants():
     """
     Get all lateral entrants with optional filters
-    Query params: batch_year, position, ministry, limit, offset
+    Query params: batch_year, position, ministry, department, search, limit,
+                  offset (offset pagination) or cursor (keyset pagination;
+                  pass an empty cursor for the first page, then next_cursor),
+                  fields / exclude / include (see entrant_projection),
+                  facets=1 (add counts per batch_year, position, ministry
+                  and state, see /api/facets)
     """
     conn = get_db()
     cursor = conn.cursor()
 
-    # Build query with filters
-    query = "SELECT * FROM lateral_entrants WHERE 1=1"
+    columns, include, error = entrant_projection(cursor)
+    if error:
+        conn.close()
+        return jsonify({"error": error}), 400
+
+    # A page needs at least one row: keyset pages build next_cursor from it
+    limit = listing_limit()
+    if limit is None:
+        conn.close()
+        return jsonify({"error": "limit must be a positive integer"}), 400
+    offset = listing_offset()
+    if offset is None:
+        conn.close()
+        return jsonify({"error": "offset must be an integer"}), 400
+
+    snapshot = current_snapshot()
+    if snapshot is not None and not request.args.get("search"):
+        conn.close()
+        return snapshot_entrants(snapshot, columns, include, limit, offset)
+
+    # Build filters
+    where = ""
     params = []
 
     if request.args.get("batch_year"):
-        query += " AND batch_year = ?"
+        where += " AND batch_year = ?"
         params.append(request.args.get("batch_year"))
 
     if request.args.get("position"):
-        query += " AND position = ?"
+        where += " AND position = ?"
         params.append(request.args.get("position"))
 
-    if request.args.get("ministry"):
-        query += " AND ministry LIKE ?"
-        params.append(f"%{request.args.get('ministry')}%")
+    for column in DIMENSIONS:
+        if request.args.get(column):
+            dimension_where, dimension_param = dimension_filter(
+                cursor, column, request.args.get(column)
+            )
+            where += dimension_where
+            params.append(dimension_param)
 
-    # Search by name
+    # Search by name (prefix match through the full-text index)
     if request.args.get("search"):
-        query += " AND name LIKE ?"
-        params.append(f"%{request.args.get('search')}%")
-
-    # Add ordering
-    query += " ORDER BY batch_year DESC, date_of_appointment DESC"
+        search_where, search_param = name_search_filter(
+            cursor, request.args.get("search")
+        )
+        where += search_where
+        params.append(search_param)
+
+    # Keyset pagination
+    if "cursor" in request.args:
+        after = None
+        if request.args["cursor"]:
+            after = decode_cursor(request.args["cursor"])
+            if after is None:
+                conn.close()
+                return jsonify({"error": "Invalid cursor"}), 400
+
+        # The sort key is always selected so the next cursor can be built
+        selected = columns
+        if columns is not None:
+            selected = list(dict.fromkeys(columns + LISTING_COLUMNS))
+        query, query_params = keyset_page_query(
+            where, params, after, limit + 1, select_list(selected)
+        )
+        cursor.execute(query, query_params)
+        rows = cursor.fetchall()
+
+        entrants = [dict_from_row(row) for row in rows[:limit]]
+        has_more = len(rows) > limit
+        next_cursor = encode_cursor(entrants[-1]) if has_more else None
+        if columns is not None:
+            for entrant in entrants:
+                for name in selected[len(columns) :]:
+                    del entrant[name]
+        attach_children(cursor, entrants, include)
+        conn.close()
+        return listing_response(
+            {
+                "entrants": entrants,
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "has_more": has_more,
+            }
+        )
 
-    # Add pagination
-    limit = int(request.args.get("limit", 50))
-    offset = int(request.args.get("offset", 0))
-    query += f" LIMIT {limit} OFFSET {offset}"
+    # Offset pagination
+    data_version = db_pool.data_version(conn)
+    query = (
+        f"SELECT {select_list(columns)} FROM lateral_entrants WHERE 1=1{where}"
+        f" ORDER BY {LISTING_ORDER} LIMIT {limit} OFFSET {offset}"
+    )
 
     cursor.execute(query, params)
     entrants = [dict_from_row(row) for row in cursor.fetchall()]
+    attach_children(cursor, entrants, include)
+
+    # Total for pagination: a short page gives it for free, otherwise reuse
+    # the count for this filter set until the database changes
+    if len(entrants) < limit and (entrants or offset == 0):
+        total = offset + len(entrants)
+    else:
+        count_key = (where, tuple(params))
+        total = count_cache.get(count_key, data_version)
+        if total is None:
+            count_query = (
+                f"SELECT COUNT(*) as total FROM lateral_entrants WHERE 1=1{where}"
+            )
+            cursor.execute(count_query, params)
+            total = cursor.fetchone()["total"]
+            count_cache.set(count_key, data_version, total)
 
-    # Get total count for pagination
-    count_query = "SELECT COUNT(*) as total FROM lateral_entrants WHERE 1=1"
-    if request.args.get("batch_year"):
-        count_query += " AND batch_year = ?"
-    if request.args.get("position"):
-        count_query += " AND position = ?"
-    if request.args.get("ministry"):
-        count_query += " AND ministry LIKE ?"
-    if request.args.get("search"):
-        count_query += " AND name LIKE ?"
+    conn.close()
 
-    cursor.execute(count_query, params)
-    total = cursor.fetchone()["total"]
+    return listing_response(
+        {
+            "entrants": entrants,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "has_more": (offset + limit) < total,
+        }
+    )
 
-    conn.close()
 
-    return jsonify(
+# Child tables embedded in a full profile: (response key, table, order)
+PROFILE_CHILDREN = [
+    ("professional_details", "professional_details", "id"),
+    ("education", "education_details", "id"),
+    ("media_coverage", "media_coverage", "publication_date DESC"),
+    ("achievements", "achievements", "id"),
+]
+
+# Optional in-memory copy of the entrant tables (LATERAL_ENTRY_SNAPSHOT=1);
+# listings without search, profiles and batch pages are then served from it
+snapshot_store = None
+if os.environ.get("LATERAL_ENTRY_SNAPSHOT") == "1":
+    snapshot_store = SnapshotStore(db_pool, LISTING_ORDER, PROFILE_CHILDREN, DIMENSIONS)
+    atexit.register(snapshot_store.close)
+
+
+def current_snapshot():
+    """The snapshot for the current data, or None when snapshot mode is off"""
+    return snapshot_store.current() if snapshot_store else None
+
+
+# Profile SELECT for the current schema_version (column lists are baked in)
+_profile_query_cache = {}
+
+
+def json_object_sql(cursor, table, alias):
+    """json_object(...) expression over every column of a table"""
+    cursor.execute(f"PRAGMA table_info({table})")
+    columns = [row["name"] for row in cursor.fetchall()]
+    pairs = ", ".join(f"'{column}', {alias}.\"{column}\"" for column in columns)
+    return f"json_object({pairs})"
+
+
+def profile_query(cursor):
+    """
+    SELECT that assembles an entrant and its child tables as one JSON
+    document with JSON1 aggregation. Rebuilt when the schema changes.
+    """
+    cursor.execute("PRAGMA schema_version")
+    schema_version = cursor.fetchone()[0]
+    query = _profile_query_cache.get(schema_version)
+    if query is not None:
+        return query
+
+    fields = [
+        json_object_sql(cursor, "lateral_entrants", "e")[len("json_object(") : -1]
+    ]
+    for key, table, order in PROFILE_CHILDREN:
+        # json() keeps the array as JSON rather than a string across the subquery
+        fields.append(
+            f"'{key}', json((SELECT json_group_array({json_object_sql(cursor, table, 'c')})"
+            f" FROM (SELECT * FROM {table} WHERE entrant_id = e.id ORDER BY {order}) c))"
+        )
+    query = (
+        f"SELECT json_object({', '.join(fields)}) AS profile"
+        " FROM lateral_entrants e WHERE e.id = ?"
+    )
+    _profile_query_cache.clear()
+    _profile_query_cache[schema_version] = query
+    return query
+
+
+def attach_children(cursor, entrants, keys):
+    """
+    Embed child-table rows into entrant dicts (in place): one IN (...)
+    query per child table, grouped in memory by entrant_id.
+    """
+    if not keys:
+        return
+    by_id = {entrant["id"]: entrant for entrant in entrants}
+    for entrant in entrants:
+        for key in keys:
+            entrant[key] = []
+    if not by_id:
+        return
+
+    ids = list(by_id)
+    placeholders = ", ".join("?" * len(ids))
+    for key, table, order in PROFILE_CHILDREN:
+        if key not in keys:
+            continue
+        cursor.execute(
+            f"SELECT * FROM {table} WHERE entrant_id IN ({placeholders})"
+            f" ORDER BY entrant_id, {order}",
+            ids,
+        )
+        for row in cursor.fetchall():
+            by_id[row["entrant_id"]][key].append(dict_from_row(row))
+
+
+def snapshot_entrants(snapshot, columns, include, limit, offset):
+    """/api/entrants (without search) answered from the in-memory snapshot"""
+    positions = snapshot.select(
+        batch_year=request.args.get("batch_year"),
+        position=request.args.get("position"),
+        ministry=request.args.get("ministry"),
+        department=request.args.get("department"),
+    )
+
+    if "cursor" in request.args:
+        start = 0
+        if request.args["cursor"]:
+            after = decode_cursor(request.args["cursor"])
+            if after is None:
+                return jsonify({"error": "Invalid cursor"}), 400
+            start = snapshot.seek(positions, after)
+
+        page = positions[start : start + limit]
+        has_more = start + limit < len(positions)
+        entrants = snapshot.entrants(page, columns)
+        snapshot.attach(entrants, include)
+        return listing_response(
+            {
+                "entrants": entrants,
+                "limit": limit,
+                "next_cursor": (
+                    encode_cursor(snapshot.entrant(page[-1])) if has_more else None
+                ),
+                "has_more": has_more,
+            }
+        )
+
+    entrants = snapshot.entrants(positions[offset : offset + limit], columns)
+    snapshot.attach(entrants, include)
+    total = len(positions)
+    return listing_response(
         {
             "entrants": entrants,
             "total": total,
@@ -179,70 +967,131 @@ def get_entrants():
     )
 
 
+@app.route("/api/facets", methods=["GET"])
+@cached_response
+def get_facets():
+    """
+    The /api/entrants page for the same query params, plus "facets": counts
+    per batch_year, position, ministry and state. Each facet counts the rows
+    matching every filter except its own, so a filter UI can show all of its
+    options; "total" counts rows matching all filters.
+    """
+    return get_entrants.__wrapped__()
+
+
 @app.route("/api/entrants/<int:entrant_id>", methods=["GET"])
+@cached_response
 def get_entrant(entrant_id):
-    """Get detailed information for a specific entrant"""
+    """Get detailed information for a specific entrant (one query, JSON1)"""
+    snapshot = current_snapshot()
+    if snapshot is not None:
+        profile = snapshot.profile(entrant_id)
+        if profile is None:
+            return jsonify({"error": "Entrant not found"}), 404
+        return jsonify(profile)
+
     conn = get_db()
     cursor = conn.cursor()
 
-    # Get basic info
-    cursor.execute("SELECT * FROM lateral_entrants WHERE id = ?", (entrant_id,))
-    entrant = dict_from_row(cursor.fetchone())
+    cursor.execute(profile_query(cursor), (entrant_id,))
+    row = cursor.fetchone()
+    conn.close()
 
-    if not entrant:
-        conn.close()
+    if not row:
         return jsonify({"error": "Entrant not found"}), 404
 
-    # Get professional details
-    cursor.execute(
-        "SELECT * FROM professional_details WHERE entrant_id = ?", (entrant_id,)
-    )
-    professional = [dict_from_row(row) for row in cursor.fetchall()]
+    # SQLite already produced the JSON document; send it as-is
+    return app.response_class(row["profile"], mimetype="application/json")
 
-    # Get education details
-    cursor.execute(
-        "SELECT * FROM education_details WHERE entrant_id = ?", (entrant_id,)
-    )
-    education = [dict_from_row(row) for row in cursor.fetchall()]
 
-    # Get media coverage
-    cursor.execute(
-        "SELECT * FROM media_coverage WHERE entrant_id = ? ORDER BY publication_date DESC",
-        (entrant_id,),
-    )
-    media = [dict_from_row(row) for row in cursor.fetchall()]
+# Most profiles /api/entrants/bulk returns in one response
+BULK_PROFILE_MAX_IDS = int(os.environ.get("LATERAL_ENTRY_BULK_MAX_IDS", 100))
 
-    # Get achievements
-    cursor.execute("SELECT * FROM achievements WHERE entrant_id = ?", (entrant_id,))
-    achievements = [dict_from_row(row) for row in cursor.fetchall()]
 
-    conn.close()
+@app.route("/api/entrants/bulk", methods=["GET", "POST"])
+@cached_response
+def get_entrants_bulk():
+    """
+    Get full profiles, with child tables, for many entrants at once
+    GET: ids (comma-separated)   POST: JSON body {"ids": [...]}
+    Runs one query for the entrants and one per child table.
+    """
+    if request.method == "POST":
+        raw_ids = (request.get_json(silent=True) or {}).get("ids", [])
+    else:
+        raw_ids = [part for part in request.args.get("ids", "").split(",") if part]
+
+    try:
+        ids = list(dict.fromkeys(int(entrant_id) for entrant_id in raw_ids))
+    except (TypeError, ValueError):
+        return jsonify({"error": "ids must be integers"}), 400
+
+    if not ids:
+        return jsonify({"error": 'Parameter "ids" is required'}), 400
+    if len(ids) > BULK_PROFILE_MAX_IDS:
+        return (
+            jsonify({"error": f"At most {BULK_PROFILE_MAX_IDS} ids per request"}),
+            400,
+        )
 
-    entrant["professional_details"] = professional
-    entrant["education"] = education
-    entrant["media_coverage"] = media
-    entrant["achievements"] = achievements
+    snapshot = current_snapshot()
+    if snapshot is not None:
+        profiles = {i: snapshot.profile(i) for i in ids}
+        profiles = {i: profile for i, profile in profiles.items() if profile}
+        return jsonify(
+            {
+                "entrants": [profiles[i] for i in ids if i in profiles],
+                "missing": [i for i in ids if i not in profiles],
+                "count": len(profiles),
+            }
+        )
 
-    return jsonify(entrant)
+    conn = get_db()
+    cursor = conn.cursor()
+    placeholders = ", ".join("?" * len(ids))
+
+    cursor.execute(f"SELECT * FROM lateral_entrants WHERE id IN ({placeholders})", ids)
+    profiles = {row["id"]: dict_from_row(row) for row in cursor.fetchall()}
+    attach_children(
+        cursor, list(profiles.values()), [key for key, _, _ in PROFILE_CHILDREN]
+    )
+
+    conn.close()
+
+    return jsonify(
+        {
+            "entrants": [profiles[i] for i in ids if i in profiles],
+            "missing": [i for i in ids if i not in profiles],
+            "count": len(profiles),
+        }
+    )
 
 
 @app.route("/api/batches", methods=["GET"])
+@cached_response
 def get_batches():
     """Get summary of all batches"""
     conn = get_db()
     cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT 
-            batch_year,
-            COUNT(*) as total_appointees,
-            COUNT(DISTINCT position) as positions_filled,
-            COUNT(DISTINCT ministry) as ministries_involved,
-            MIN(date_of_appointment) as first_appointment,
-            MAX(date_of_appointment) as last_appointment
-        FROM lateral_entrants
-        GROUP BY batch_year
-        ORDER BY batch_year
+    tables = stats_tables(cursor)
+
+    # Counts come from the summary tables; first/last dates are MIN/MAX
+    # seeks on idx_batch_appointment
+    cursor.execute(f"""
+        SELECT
+            b.batch_year,
+            b.count as total_appointees,
+            (SELECT COUNT(*) FROM {tables['stats_by_batch_position']}
+             WHERE batch_year = b.batch_year) as positions_filled,
+            (SELECT COUNT(*) FROM {tables['stats_by_batch_ministry']}
+             WHERE batch_year = b.batch_year AND ministry IS NOT NULL)
+                as ministries_involved,
+            (SELECT MIN(date_of_appointment) FROM lateral_entrants
+             WHERE batch_year = b.batch_year) as first_appointment,
+            (SELECT MAX(date_of_appointment) FROM lateral_entrants
+             WHERE batch_year = b.batch_year) as last_appointment
+        FROM {tables['stats_by_batch']} b
+        ORDER BY b.batch_year
     """)
 
     batches = [dict_from_row(row) for row in cursor.fetchall()]
@@ -252,16 +1101,30 @@ def get_batches():
 
 
 @app.route("/api/batches/<int:batch_year>", methods=["GET"])
+@cached_response
 def get_batch_detail(batch_year):
-    """Get detailed information for a specific batch"""
+    """
+    Get detailed information for a specific batch
+    Query params: fields / exclude / include (see entrant_projection)
+    """
     conn = get_db()
     cursor = conn.cursor()
 
+    columns, include, error = entrant_projection(cursor)
+    if error:
+        conn.close()
+        return jsonify({"error": error}), 400
+
+    snapshot = current_snapshot()
+    if snapshot is not None:
+        conn.close()
+        return snapshot_batch_detail(snapshot, batch_year, columns, include)
+
     # Get all entrants in batch
     cursor.execute(
-        """
-        SELECT * FROM lateral_entrants 
-        WHERE batch_year = ? 
+        f"""
+        SELECT {select_list(columns)} FROM lateral_entrants
+        WHERE batch_year = ?
         ORDER BY position, name
     """,
         (batch_year,),
@@ -271,29 +1134,31 @@ def get_batch_detail(batch_year):
     if not entrants:
         conn.close()
         return jsonify({"error": "Batch not found"}), 404
+    attach_children(cursor, entrants, include)
 
-    # Get batch statistics
+    # Batch statistics and positions from the summary tables
+    tables = stats_tables(cursor)
     cursor.execute(
-        """
-        SELECT 
-            COUNT(*) as total,
-            COUNT(DISTINCT position) as positions,
-            COUNT(DISTINCT ministry) as ministries
-        FROM lateral_entrants
-        WHERE batch_year = ?
+        f"""
+        SELECT
+            b.count as total,
+            (SELECT COUNT(*) FROM {tables['stats_by_batch_position']}
+             WHERE batch_year = b.batch_year AND position IS NOT NULL) as positions,
+            (SELECT COUNT(*) FROM {tables['stats_by_batch_ministry']}
+             WHERE batch_year = b.batch_year AND ministry IS NOT NULL) as ministries
+        FROM {tables['stats_by_batch']} b
+        WHERE b.batch_year = ?
     """,
         (batch_year,),
     )
     stats = dict_from_row(cursor.fetchone())
 
-    # Group by position
     cursor.execute(
-        """
-        SELECT position, COUNT(*) as count
-        FROM lateral_entrants
+        f"""
+        SELECT position, count
+        FROM {tables['stats_by_batch_position']}
         WHERE batch_year = ?
-        GROUP BY position
-        ORDER BY count DESC
+        ORDER BY count DESC, position
     """,
         (batch_year,),
     )
@@ -311,20 +1176,58 @@ def get_batch_detail(batch_year):
     )
 
 
+def snapshot_batch_detail(snapshot, batch_year, columns, include):
+    """/api/batches/<year> answered from the in-memory snapshot"""
+    positions = snapshot.batch_order.get(batch_year)
+    if not positions:
+        return jsonify({"error": "Batch not found"}), 404
+
+    entrants = snapshot.entrants(positions, columns)
+    snapshot.attach(entrants, include)
+
+    records = snapshot.entrants(positions, ["position", "ministry"])
+    position_counts = {}
+    for record in records:
+        position_counts[record["position"]] = (
+            position_counts.get(record["position"], 0) + 1
+        )
+    ministries = {record["ministry"] for record in records} - {None}
+
+    return jsonify(
+        {
+            "batch_year": batch_year,
+            "statistics": {
+                "total": len(positions),
+                "positions": len(position_counts),
+                "ministries": len(ministries),
+            },
+            "by_position": [
+                {"position": position, "count": count}
+                for position, count in sorted(
+                    sorted(position_counts.items()), key=lambda item: -item[1]
+                )
+            ],
+            "entrants": entrants,
+        }
+    )
+
+
 @app.route("/api/ministries", methods=["GET"])
+@cached_response
 def get_ministries():
     """Get list of all ministries with appointee counts"""
     conn = get_db()
     cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT 
-            ministry,
-            COUNT(*) as appointee_count,
-            GROUP_CONCAT(DISTINCT position) as positions
-        FROM lateral_entrants
-        GROUP BY ministry
-        ORDER BY appointee_count DESC
+    tables = stats_tables(cursor)
+
+    cursor.execute(f"""
+        SELECT
+            m.ministry,
+            m.count as appointee_count,
+            (SELECT GROUP_CONCAT(position) FROM {tables['stats_by_ministry_position']}
+             WHERE ministry IS m.ministry) as positions
+        FROM {tables['stats_by_ministry']} m
+        ORDER BY appointee_count DESC, m.ministry
     """)
 
     ministries = [dict_from_row(row) for row in cursor.fetchall()]
@@ -334,19 +1237,21 @@ def get_ministries():
 
 
 @app.route("/api/positions", methods=["GET"])
+@cached_response
 def get_positions():
     """Get list of all positions with counts"""
     conn = get_db()
     cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT 
-            position,
-            COUNT(*) as count,
-            GROUP_CONCAT(DISTINCT batch_year) as batches
-        FROM lateral_entrants
-        GROUP BY position
-        ORDER BY count DESC
+    tables = stats_tables(cursor)
+
+    cursor.execute(f"""
+        SELECT
+            p.position,
+            p.count,
+            (SELECT GROUP_CONCAT(batch_year) FROM {tables['stats_by_batch_position']}
+             WHERE position = p.position) as batches
+        FROM {tables['stats_by_position']} p
+        ORDER BY p.count DESC, p.position
     """)
 
     positions = [dict_from_row(row) for row in cursor.fetchall()]
@@ -355,93 +1260,280 @@ def get_positions():
     return jsonify({"positions": positions})
 
 
+SUGGEST_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+SUGGEST_KINDS = ["name", "ministry", "department", "position"]
+
+
+def suggest_entries(cursor):
+    """Names and (kind, text, appointee count) terms for the suggest index"""
+    tables = stats_tables(cursor)
+    cursor.execute("SELECT id, name, batch_year FROM lateral_entrants")
+    names = [tuple(row) for row in cursor.fetchall()]
+    terms = []
+    for kind in SUGGEST_KINDS[1:]:
+        cursor.execute(
+            f"SELECT {kind}, count FROM {tables['stats_by_' + kind]}"
+            f" WHERE {kind} IS NOT NULL"
+        )
+        terms.extend((kind, text, count) for text, count in cursor.fetchall())
+    return names, terms
+
+
+# Typeahead index, built on the first /api/suggest request (current() starts
+# the builder thread, so importing this module opens no connection) and
+# rebuilt in the background when the data changes (polled every
+# LATERAL_ENTRY_SUGGEST_REFRESH seconds)
+suggest_store = SuggestStore(
+    db_pool,
+    suggest_entries,
+    interval=float(os.environ.get("LATERAL_ENTRY_SUGGEST_REFRESH", 2)),
+)
+atexit.register(suggest_store.close)
+
+
+@app.route("/api/suggest", methods=["GET"])
+def get_suggestions():
+    """
+    Typeahead completions from the in-memory prefix index (no SQL)
+    Query params: q (prefix; every word of a name or term can match),
+                  limit (default 8, at most 20),
+                  types (comma-separated: name,ministry,department,position)
+    """
+    query = request.args.get("q", "")
+    try:
+        limit = min(int(request.args.get("limit", SUGGEST_LIMIT)), SUGGEST_MAX_LIMIT)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    kinds = None
+    if request.args.get("types"):
+        kinds = set(request.args["types"].split(","))
+        if not kinds <= set(SUGGEST_KINDS):
+            return jsonify({"error": "Invalid suggestion types"}), 400
+
+    index = suggest_store.current()
+    if index is None:
+        return jsonify({"error": "Suggestions are not available yet"}), 503
+
+    response = jsonify(
+        {"query": query, "suggestions": index.suggest(query, limit, kinds)}
+    )
+    # Keystrokes repeat prefixes; let the browser reuse answers briefly
+    response.cache_control.max_age = 30
+    return response
+
+
+# Trigram index over names for mode=fuzzy, rebuilt when the data changes
+fuzzy_store = FuzzyStore(db_pool)
+
+SEARCH_MODES = ["prefix", "fuzzy"]
+FUZZY_LIMIT = 50
+
+
+def fuzzy_search(conn, cursor, query, columns, include):
+    """Names similar to query (typos, variant spellings), best match first"""
+    try:
+        limit = int(request.args.get("limit") or FUZZY_LIMIT)
+        threshold = float(request.args.get("threshold", FUZZY_THRESHOLD))
+    except ValueError:
+        return None, "limit and threshold must be numbers"
+    if not 0 < threshold <= 1:
+        return None, "threshold must be between 0 and 1"
+
+    matches = fuzzy_store.current(conn).search(query, limit, threshold)
+    if not matches:
+        return [], None
+
+    ids = [entrant_id for _, entrant_id, _, _ in matches]
+    wanted = None if columns is None else list(dict.fromkeys(["id"] + columns))
+    cursor.execute(
+        f"SELECT {select_list(wanted)} FROM lateral_entrants"
+        f" WHERE id IN ({', '.join('?' * len(ids))})",
+        ids,
+    )
+    rows = {row["id"]: dict_from_row(row) for row in cursor.fetchall()}
+
+    results = []
+    for similarity, entrant_id, _, _ in matches:
+        row = rows.get(entrant_id)
+        if row is not None:
+            if columns is not None and "id" not in columns:
+                del row["id"]
+            row["similarity"] = similarity
+            results.append(row)
+    attach_children(cursor, results, include)
+    return results, None
+
+
 @app.route("/api/search", methods=["GET"])
+@cached_response
 def search():
     """
-    Search across all entrants
-    Query params: q (search term), fields (comma-separated: name,ministry,department,position)
+    Search across all entrants, ranked by BM25 with per-field weights
+    Query params: q (search term, words match as prefixes),
+                  fields (comma-separated: name,ministry,department,position),
+                  limit (optional cap on results),
+                  select / exclude / include (result projection; select takes
+                  the place of fields, see entrant_projection),
+                  mode (prefix, the default, or fuzzy: names only, tolerant
+                  of typos and spelling variants, ranked by trigram
+                  similarity; limit defaults to 50 and threshold, 0-1,
+                  to 0.3)
     """
     query = request.args.get("q", "")
     if not query:
         return jsonify({"error": 'Query parameter "q" is required'}), 400
 
-    fields = request.args.get("fields", "name,ministry,department,position").split(",")
+    mode = request.args.get("mode", "prefix")
+    if mode not in SEARCH_MODES:
+        return jsonify({"error": "Invalid search mode"}), 400
+
+    fields = [
+        field
+        for field in request.args.get("fields", ",".join(SEARCH_FIELDS)).split(",")
+        if field in SEARCH_FIELDS
+    ]
+    if not fields:
+        return jsonify({"error": "Invalid search fields"}), 400
 
     conn = get_db()
     cursor = conn.cursor()
 
-    # Build search query
-    conditions = []
-    params = []
-    for field in fields:
-        if field in ["name", "ministry", "department", "position"]:
-            conditions.append(f"{field} LIKE ?")
-            params.append(f"%{query}%")
+    columns, include, error = entrant_projection(cursor, fields_param="select")
+    if error:
+        conn.close()
+        return jsonify({"error": error}), 400
 
-    if not conditions:
+    if mode == "fuzzy":
+        results, error = fuzzy_search(conn, cursor, query, columns, include)
         conn.close()
-        return jsonify({"error": "Invalid search fields"}), 400
+        if error:
+            return jsonify({"error": error}), 400
+        return jsonify(
+            {"query": query, "mode": mode, "results": results, "count": len(results)}
+        )
 
-    search_query = f"""
-        SELECT * FROM lateral_entrants
-        WHERE {" OR ".join(conditions)}
-        ORDER BY batch_year DESC
-    """
+    match = fts_match_expression(query, fields)
+    if match and has_search_index(cursor):
+        # Ranked lookup through the FTS5 index
+        search_query = f"""
+            SELECT {select_list(columns, "e")} FROM lateral_entrants_fts
+            JOIN lateral_entrants e ON e.id = lateral_entrants_fts.rowid
+            WHERE lateral_entrants_fts MATCH ?
+            ORDER BY {SEARCH_RANK}, e.batch_year DESC
+        """
+        params = [match]
+    else:
+        # No index yet (run database/migrate.py) or no searchable words
+        conditions = [f"{field} LIKE ?" for field in fields]
+        params = [f"%{query}%"] * len(fields)
+        search_query = f"""
+            SELECT {select_list(columns)} FROM lateral_entrants
+            WHERE {" OR ".join(conditions)}
+            ORDER BY batch_year DESC
+        """
+
+    limit = request.args.get("limit", type=int)
+    if limit:
+        search_query += " LIMIT ?"
+        params.append(limit)
 
     cursor.execute(search_query, params)
     results = [dict_from_row(row) for row in cursor.fetchall()]
+    attach_children(cursor, results, include)
 
     conn.close()
 
     return jsonify({"query": query, "results": results, "count": len(results)})
 
 
+EXPORT_CHUNK_ROWS = 500
+
+
+def export_rows(cursor):
+    """Yield export rows from an executed cursor without buffering the table"""
+    while True:
+        rows = cursor.fetchmany(EXPORT_CHUNK_ROWS)
+        if not rows:
+            return
+        yield rows
+
+
+def stream_csv(cursor):
+    columns = [column[0] for column in cursor.description]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in export_rows(cursor):
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_ndjson(cursor):
+    columns = [column[0] for column in cursor.description]
+    for rows in export_rows(cursor):
+        yield "".join(
+            json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n"
+            for row in rows
+        )
+
+
+def stream_json(cursor):
+    """Same document as the old buffered export, written incrementally"""
+    columns = [column[0] for column in cursor.description]
+    count = 0
+    yield '{"data": ['
+    for rows in export_rows(cursor):
+        yield ("," if count else "") + ",".join(
+            json.dumps(dict(zip(columns, row)), ensure_ascii=False) for row in rows
+        )
+        count += len(rows)
+    yield '], "count": %d, "exported_at": %s}' % (
+        count,
+        json.dumps(datetime.now().isoformat()),
+    )
+
+
+EXPORT_FORMATS = {
+    "csv": (stream_csv, "text/csv", "lateral_entrants.csv"),
+    "ndjson": (stream_ndjson, "application/x-ndjson", "lateral_entrants.ndjson"),
+    "json": (stream_json, "application/json", None),
+}
+
+
 @app.route("/api/export", methods=["GET"])
 def export_data():
     """
-    Export data in various formats
-    Query param: format (json, csv)
+    Export data in various formats, streamed row by row from the cursor
+    Query param: format (json, csv, ndjson)
     """
     export_format = request.args.get("format", "json")
+    stream, mimetype, filename = EXPORT_FORMATS.get(
+        export_format, EXPORT_FORMATS["json"]
+    )
 
     conn = get_db()
     cursor = conn.cursor()
 
+    # idx_export_order serves this ORDER BY, so the first row arrives
+    # without sorting the whole table
     cursor.execute("SELECT * FROM lateral_entrants ORDER BY batch_year, name")
-    entrants = [dict_from_row(row) for row in cursor.fetchall()]
-    conn.close()
 
-    if export_format == "csv":
-        # Convert to CSV format
-        import io
-        import csv
-
-        output = io.StringIO()
-        if entrants:
-            writer = csv.DictWriter(output, fieldnames=entrants[0].keys())
-            writer.writeheader()
-            writer.writerows(entrants)
-
-        response = app.response_class(
-            response=output.getvalue(),
-            mimetype="text/csv",
-            headers={
-                "Content-Disposition": "attachment; filename=lateral_entrants.csv"
-            },
-        )
-        return response
+    headers = {}
+    if filename:
+        headers["Content-Disposition"] = f"attachment; filename={filename}"
 
-    # Default: JSON
-    return jsonify(
-        {
-            "data": entrants,
-            "count": len(entrants),
-            "exported_at": datetime.now().isoformat(),
-        }
-    )
+    # No Content-Length: the server sends the body with chunked encoding
+    return app.response_class(stream(cursor), mimetype=mimetype, headers=headers)
 
 
 @app.route("/api/timeline", methods=["GET"])
+@cached_response
 def get_timeline():
     """Get chronological timeline of all appointments"""
     conn = get_db()
@@ -465,6 +1557,125 @@ def get_timeline():
     return jsonify({"timeline": timeline})
 
 
+# Tables recorded in change_log (see lateral_entry_schema.sql): the entrants
+# and the child tables profiles embed
+CHANGE_TABLES = ["lateral_entrants"] + [table for _, table, _ in PROFILE_CHILDREN]
+CHANGES_LIMIT = 500
+CHANGES_MAX_LIMIT = 5000
+
+
+def has_change_log(cursor):
+    """Check whether database/migrate.py has created the change log"""
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'change_log'"
+    )
+    return cursor.fetchone() is not None
+
+
+@app.route("/api/changes", methods=["GET"])
+@cached_response
+def get_changes():
+    """
+    Incremental sync feed from the change log
+    Query params: since (last seq the client has applied; 0 = from the start),
+                  limit (changed rows per page, default 500, at most 5000)
+    One entry per changed row, in order of its latest change: "upsert" with
+    the row as it is now, or "delete". Apply the page, then ask again with
+    since=next until has_more is false. 410 means the log no longer reaches
+    back to since (or belongs to another database): reload everything, then
+    continue from latest.
+    """
+    try:
+        since = int(request.args["since"])
+        limit = min(int(request.args.get("limit", CHANGES_LIMIT)), CHANGES_MAX_LIMIT)
+    except KeyError:
+        return jsonify({"error": 'Query parameter "since" is required'}), 400
+    except ValueError:
+        return jsonify({"error": "since and limit must be integers"}), 400
+    if since < 0 or limit <= 0:
+        return jsonify({"error": "since and limit must be positive"}), 400
+
+    conn = get_db()
+    cursor = conn.cursor()
+    if not has_change_log(cursor):
+        conn.close()
+        return (
+            jsonify({"error": "Change log not available (run database/migrate.py)"}),
+            503,
+        )
+
+    # One read transaction, so rows match the log position reported as next
+    cursor.execute("BEGIN")
+    try:
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'change_log'")
+        row = cursor.fetchone()
+        latest = row[0] if row else 0
+        cursor.execute("SELECT MIN(seq) FROM change_log")
+        oldest = cursor.fetchone()[0] or latest + 1
+        if since > latest or since < oldest - 1:
+            return (
+                jsonify(
+                    {"error": "Changes since this point are gone", "latest": latest}
+                ),
+                410,
+            )
+
+        cursor.execute(
+            """
+            SELECT table_name, row_id, entrant_id, MAX(seq) as seq
+            FROM change_log WHERE seq > ?
+            GROUP BY table_name, row_id
+            ORDER BY seq LIMIT ?
+            """,
+            (since, limit),
+        )
+        changed = cursor.fetchall()
+
+        current = {}
+        for table in CHANGE_TABLES:
+            ids = [
+                change["row_id"] for change in changed if change["table_name"] == table
+            ]
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                cursor.execute(
+                    f"SELECT * FROM {table} WHERE id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                current.update(
+                    ((table, row["id"]), dict_from_row(row))
+                    for row in cursor.fetchall()
+                )
+    finally:
+        cursor.execute("COMMIT")
+        conn.close()
+
+    changes = []
+    for change in changed:
+        row = current.get((change["table_name"], change["row_id"]))
+        entry = {
+            "seq": change["seq"],
+            "table": change["table_name"],
+            "id": change["row_id"],
+            "entrant_id": change["entrant_id"],
+            "op": "upsert" if row is not None else "delete",
+        }
+        if row is not None:
+            entry["row"] = row
+        changes.append(entry)
+
+    next_seq = changed[-1]["seq"] if changed else latest
+    return jsonify(
+        {
+            "since": since,
+            "next": next_seq,
+            "latest": latest,
+            "has_more": next_seq < latest,
+            "changes": changes,
+        }
+    )
+
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({"error": "Endpoint not found"}), 404
@@ -481,19 +1692,26 @@ if __name__ == "__main__":
     print("=" * 70)
     print(f"Database: {DB_PATH}")
     print(f"Database exists: {os.path.exists(DB_PATH)}")
+    print(f"Snapshot mode: {'on' if snapshot_store else 'off'}")
     print("=" * 70)
     print("\nAvailable endpoints:")
     print("  GET  /api/health              - Health check")
+    print("  GET  /api/metrics             - Request metrics (Prometheus format)")
     print("  GET  /api/stats               - Portal statistics")
     print("  GET  /api/entrants            - List all entrants (with filters)")
+    print("  GET  /api/facets              - Entrant page plus filter counts")
     print("  GET  /api/entrants/<id>       - Get entrant details")
+    print("  GET  /api/entrants/bulk?ids=  - Get many entrant profiles (or POST)")
     print("  GET  /api/batches             - List all batches")
     print("  GET  /api/batches/<year>      - Get batch details")
     print("  GET  /api/ministries          - List all ministries")
     print("  GET  /api/positions           - List all positions")
     print("  GET  /api/search?q=<query>    - Search entrants")
+    print("  GET  /api/search?mode=fuzzy   - Typo-tolerant name search")
+    print("  GET  /api/suggest?q=<prefix>  - Typeahead completions")
     print("  GET  /api/export?format=csv   - Export data")
     print("  GET  /api/timeline            - Appointment timeline")
+    print("  GET  /api/changes?since=<seq> - Incremental change feed")
     print("=" * 70)
     print("\nStarting server on http://localhost:5000")
     print("=" * 70 + "\n")
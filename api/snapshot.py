@@ -0,0 +1,291 @@
+"""
+In-memory read snapshot of lateral_entrants and its child tables
+Loaded in one read transaction and swapped wholesale when the data changes
+"""
+
+import bisect
+import os
+import re
+import threading
+from array import array
+
+# Filter sets whose matching row positions each snapshot remembers
+SELECTION_CACHE_SIZE = 64
+
+
+def like_matcher(pattern):
+    """Compile a SQL LIKE pattern (ASCII case-insensitive, % and _ wildcards)"""
+    regex = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char)
+        for char in pattern
+    )
+    return re.compile(regex, re.ASCII | re.IGNORECASE | re.DOTALL).fullmatch
+
+
+class Snapshot:
+    """
+    Immutable copy of the entrant tables, indexed for the API read paths.
+
+    Entrants are tuples in listing order; every index maps a value to an
+    ascending array of row positions, so index lookups come back already
+    in listing order. Child rows are grouped by entrant id.
+    """
+
+    __slots__ = (
+        "data_version",
+        "columns",
+        "rows",
+        "by_id",
+        "by_batch",
+        "by_position",
+        "filters",
+        "batch_order",
+        "children",
+        "_column_index",
+        "_keys",
+        "_selections",
+    )
+
+    def __init__(self, data_version, columns, rows, children, aliases=None):
+        self.data_version = data_version
+        self.columns = columns
+        self.rows = rows
+        self.children = children
+        self._column_index = {name: i for i, name in enumerate(columns)}
+        self._selections = {}
+
+        entrant_id = self._column_index["id"]
+        batch_year = self._column_index["batch_year"]
+        date = self._column_index["date_of_appointment"]
+        self._keys = [
+            (row[batch_year], row[date] or "", row[entrant_id]) for row in rows
+        ]
+
+        self.by_id = {row[entrant_id]: i for i, row in enumerate(rows)}
+        self.by_batch = self._index("batch_year")
+        self.by_position = self._index("position")
+
+        # ministry / department filters: (spelling -> canonical id pairs,
+        # index by id column) once migrated, else (None, index by text)
+        aliases = aliases or {}
+        self.filters = {}
+        for column in ("ministry", "department"):
+            if column in aliases:
+                pairs, key = aliases[column]
+                self.filters[column] = (pairs, self._index(key))
+            else:
+                self.filters[column] = (None, self._index(column))
+
+        # /api/batches/<year> order: position, name
+        position = self._column_index["position"]
+        name = self._column_index["name"]
+        self.batch_order = {
+            year: array(
+                "l",
+                sorted(positions, key=lambda i: (rows[i][position], rows[i][name])),
+            )
+            for year, positions in self.by_batch.items()
+        }
+
+    def _index(self, column):
+        index = {}
+        column = self._column_index[column]
+        for i, row in enumerate(self.rows):
+            index.setdefault(row[column], array("l")).append(i)
+        return index
+
+    @classmethod
+    def load(cls, conn, data_version, listing_order, children, dimensions=None):
+        """
+        Read every table inside one transaction so the copy is consistent.
+        dimensions maps ministry/department to (alias table, id column).
+        """
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute(f"SELECT * FROM lateral_entrants ORDER BY {listing_order}")
+            columns = tuple(column[0] for column in cursor.description)
+            rows = [tuple(row) for row in cursor.fetchall()]
+
+            groups = {}
+            for key, table, order in children:
+                cursor.execute(f"SELECT * FROM {table} ORDER BY entrant_id, {order}")
+                child_columns = tuple(column[0] for column in cursor.description)
+                entrant_id = child_columns.index("entrant_id")
+                by_entrant = {}
+                for row in cursor.fetchall():
+                    by_entrant.setdefault(row[entrant_id], []).append(tuple(row))
+                groups[key] = (child_columns, by_entrant)
+
+            aliases = {}
+            for column, (table, key) in (dimensions or {}).items():
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (table,),
+                )
+                if cursor.fetchone() is not None and key in columns:
+                    cursor.execute(f"SELECT alias, {key} FROM {table}")
+                    aliases[column] = ([tuple(row) for row in cursor.fetchall()], key)
+        finally:
+            cursor.execute("COMMIT")
+        return cls(data_version, columns, rows, groups, aliases)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def select(self, batch_year=None, position=None, ministry=None, department=None):
+        """
+        Row positions matching the /api/entrants filters, in listing order.
+        batch_year and position are equality filters; ministry and department
+        a LIKE substring match on any spelling of the canonical row (or on
+        the text itself before migration), mirroring the SQL handler. The
+        snapshot never changes, so results are memoized per filter set.
+        """
+        key = (batch_year, position, ministry, department)
+        positions = self._selections.get(key)
+        if positions is None:
+            positions = self._select(batch_year, position, ministry, department)
+            if len(self._selections) >= SELECTION_CACHE_SIZE:
+                self._selections.clear()
+            self._selections[key] = positions
+        return positions
+
+    def _select(self, batch_year, position, ministry, department):
+        indexed = []
+        if batch_year:
+            try:
+                indexed.append(self.by_batch.get(int(batch_year), ()))
+            except ValueError:
+                return []
+        if position:
+            indexed.append(self.by_position.get(position, ()))
+        for column, value in (("ministry", ministry), ("department", department)):
+            if not value:
+                continue
+            match = like_matcher(f"%{value}%")
+            aliases, index = self.filters[column]
+            if aliases is None:
+                keys = {text for text in index if text is not None and match(text)}
+            else:
+                keys = {key for alias, key in aliases if match(alias)}
+            indexed.append(sorted(i for key in keys for i in index.get(key, ())))
+
+        if not indexed:
+            return range(len(self.rows))
+
+        # Walk the smallest index entry, keeping rows present in the others
+        indexed.sort(key=len)
+        positions = indexed[0]
+        for other in indexed[1:]:
+            other = set(other)
+            positions = [i for i in positions if i in other]
+        return array("l", positions)
+
+    def seek(self, positions, after):
+        """Index into positions of the first row sorting after a cursor key"""
+        first = bisect.bisect_left(
+            range(len(self.rows)), True, key=lambda i: self._keys[i] < after
+        )
+        return bisect.bisect_left(positions, first)
+
+    def entrant(self, position, columns=None):
+        """One entrant as a dict, optionally projected to some columns"""
+        row = self.rows[position]
+        if columns is None:
+            return dict(zip(self.columns, row))
+        return {name: row[self._column_index[name]] for name in columns}
+
+    def entrants(self, positions, columns=None):
+        return [self.entrant(i, columns) for i in positions]
+
+    def attach(self, entrants, keys):
+        """Embed child rows into entrant dicts (in place), like attach_children"""
+        for key in keys:
+            child_columns, by_entrant = self.children[key]
+            for entrant in entrants:
+                entrant[key] = [
+                    dict(zip(child_columns, row))
+                    for row in by_entrant.get(entrant["id"], ())
+                ]
+
+    def profile(self, entrant_id):
+        """Full profile with every child table, or None if the id is unknown"""
+        position = self.by_id.get(entrant_id)
+        if position is None:
+            return None
+        profile = self.entrant(position)
+        self.attach([profile], list(self.children))
+        return profile
+
+
+class SnapshotStore:
+    """
+    Holds the current Snapshot and replaces it when the database changes.
+
+    A dedicated connection watches PRAGMA data_version (only comparable
+    within one connection), so the snapshot reloads once per change no
+    matter how many threads serve requests. Handlers take a reference to
+    the current snapshot and use it for the whole request; a reload builds
+    a new snapshot and swaps the reference, so readers never see a mix.
+    """
+
+    def __init__(self, pool, listing_order, children, dimensions=None):
+        self.pool = pool
+        self.listing_order = listing_order
+        self.children = children
+        self.dimensions = dimensions
+        self.loads = 0
+        self._lock = threading.Lock()
+        self._pid = None
+        self._conn = None
+        self._file_id = None
+        self._version = 0
+        self._seen = None
+        self._snapshot = None
+
+    def _stat_file(self):
+        try:
+            st = os.stat(self.pool.db_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    def _watch(self):
+        """Bump the snapshot version if the database changed since last look"""
+        file_id = self._stat_file()
+        if self._conn is None or self._pid != os.getpid() or file_id != self._file_id:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.discard()
+            self._conn = self.pool.open_connection()
+            self._pid = os.getpid()
+            self._file_id = file_id
+            self._seen = None
+
+        current = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if current != self._seen:
+            self._seen = current
+            self._version += 1
+
+    def current(self):
+        """The snapshot for the database as it is now, loading it if needed"""
+        with self._lock:
+            self._watch()
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.data_version != self._version:
+                snapshot = Snapshot.load(
+                    self._conn,
+                    self._version,
+                    self.listing_order,
+                    self.children,
+                    self.dimensions,
+                )
+                self._snapshot = snapshot
+                self.loads += 1
+        return snapshot
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.discard()
+            self._conn = None
+            self._snapshot = None
@@ -0,0 +1,253 @@
+"""
+Opt-in SQL tracing for the Lateral Entry Portal API
+Slow-query log with EXPLAIN QUERY PLAN capture and a per-statement report
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+from metrics import TimedCursor
+
+logger = logging.getLogger("lateral_entry.sql")
+
+# Frames from these files are skipped when looking for a statement's call site
+_INTERNAL_FILES = {
+    os.path.abspath(__file__),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "metrics.py"),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "db_pool.py"),
+}
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """Collapse literals, placeholder lists and whitespace: one key per query shape"""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("?, ...", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def is_full_scan(plan):
+    """True if the plan reads a whole table without an index"""
+    # Subqueries the plan builds itself are scanned by name too; skip those
+    derived = {"CONSTANT", "sqlite_master", "sqlite_schema"}
+    for detail in plan:
+        if detail.startswith(("CO-ROUTINE ", "MATERIALIZE ")):
+            derived.add(detail.split(" ", 1)[1])
+    return any(
+        detail.startswith("SCAN ")
+        and detail.split(" ")[1] not in derived
+        and " USING " not in detail
+        and "VIRTUAL TABLE" not in detail
+        for detail in plan
+    )
+
+
+def call_site():
+    """file:line function of the first frame outside the tracing layers"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename not in _INTERNAL_FILES:
+            return (
+                f"{os.path.basename(filename)}:{frame.f_lineno}"
+                f" {frame.f_code.co_name}"
+            )
+        frame = frame.f_back
+    return "?"
+
+
+class StatementStats:
+    """Totals for one normalized statement"""
+
+    __slots__ = ("calls", "seconds", "max_seconds", "rows", "plan", "sites")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.plan = None
+        self.sites = set()
+
+
+class StatementRun:
+    """One execution of a statement: execute() plus every fetch after it"""
+
+    __slots__ = ("key", "sql", "params", "site", "seconds", "logged")
+
+    def __init__(self, key, sql, params, site):
+        self.key = key
+        self.sql = sql
+        self.params = params
+        self.site = site
+        self.seconds = 0.0
+        self.logged = False
+
+
+class SqlTracer:
+    """
+    Collects per-statement timings from TracingCursor and the connection
+    trace callback.
+
+    Cursor statements are timed from execute() through their last fetch,
+    since SQLite does its work while rows are stepped. The first time a
+    statement shape is seen its EXPLAIN QUERY PLAN is captured, so the
+    report can flag full table scans. A run that passes the threshold is
+    logged once with its plan, normalized SQL, expanded SQL and call site.
+    Statements that never go through a cursor (conn.execute, trigger
+    bodies) are seen only by the trace callback and counted without timing.
+    """
+
+    def __init__(self, threshold_ms=50.0, report_path=None):
+        self.threshold = threshold_ms / 1000
+        self.report_path = report_path
+        self.statements = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def install(self, conn):
+        """Attach to a connection (the pool's on_connect hook)"""
+        conn.sql_tracer = self
+        conn.set_trace_callback(self._traced)
+
+    def _traced(self, sql):
+        # Called by SQLite as each statement starts, with parameters expanded.
+        # Statements run internally (FTS5 shadow tables, triggers) start "--".
+        if sql.startswith("--"):
+            return
+        key = normalize_sql(sql)
+        local = self._local
+        if getattr(local, "in_cursor", False):
+            # Keep the expanded text of the cursor's own statement only
+            if local.expanded is None and key == local.key:
+                local.expanded = sql
+            return
+        with self._lock:
+            self._stats(key).calls += 1
+
+    def _stats(self, key):
+        # Caller holds self._lock
+        stats = self.statements.get(key)
+        if stats is None:
+            stats = self.statements[key] = StatementStats()
+        return stats
+
+    def _plan(self, conn, sql, params):
+        try:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        except sqlite3.Error as e:
+            return [f"(no plan: {e})"]
+        return [row[3] for row in rows]
+
+    def begin(self, cursor, sql, params):
+        local = self._local
+        key = normalize_sql(sql)
+        local.in_cursor = True
+        local.key = key
+        local.expanded = None
+        site = call_site()
+        with self._lock:
+            stats = self._stats(key)
+            stats.calls += 1
+            stats.sites.add(site)
+            needs_plan = stats.plan is None
+        if needs_plan and key.split(" ", 1)[0].upper() in ("SELECT", "WITH"):
+            stats.plan = self._plan(cursor.connection, sql, params)
+        return StatementRun(key, sql, params, site)
+
+    def executed(self, run):
+        local = self._local
+        local.in_cursor = False
+        run.sql = local.expanded or run.sql
+
+    def charge(self, cursor, run, seconds, rows=0):
+        stats = self.statements[run.key]
+        run.seconds += seconds
+        with self._lock:
+            stats.seconds += seconds
+            stats.rows += rows
+            stats.max_seconds = max(stats.max_seconds, run.seconds)
+        if not run.logged and run.seconds >= self.threshold:
+            run.logged = True
+            plan = stats.plan or self._plan(cursor.connection, run.sql, ())
+            logger.warning(
+                "slow query %.1f ms at %s\n  normalized: %s\n  sql: %s\n  plan:\n%s",
+                run.seconds * 1000,
+                run.site,
+                run.key,
+                _WHITESPACE.sub(" ", run.sql).strip(),
+                "\n".join(f"    {detail}" for detail in plan),
+            )
+
+    def report(self):
+        """Per-statement summary, slowest total first"""
+        lines = [
+            "=" * 70,
+            "SQL TRACE REPORT",
+            "=" * 70,
+        ]
+        with self._lock:
+            ordered = sorted(
+                self.statements.items(), key=lambda item: item[1].seconds, reverse=True
+            )
+        for key, stats in ordered:
+            mean_ms = stats.seconds * 1000 / stats.calls if stats.calls else 0.0
+            flag = "  ✗ FULL SCAN" if stats.plan and is_full_scan(stats.plan) else ""
+            lines.append(
+                f"{stats.calls:>7} calls  {stats.seconds * 1000:>9.1f} ms total"
+                f"  {mean_ms:>7.2f} ms mean  {stats.max_seconds * 1000:>7.2f} ms max"
+                f"  {stats.rows:>8} rows{flag}"
+            )
+            lines.append(f"  {key}")
+            for site in sorted(stats.sites):
+                lines.append(f"    at {site}")
+            for detail in stats.plan or ():
+                lines.append(f"    plan: {detail}")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self):
+        """Write report() to report_path, or stderr when none is set"""
+        if not self.statements:
+            return
+        text = self.report()
+        if self.report_path:
+            with open(self.report_path, "w", encoding="utf-8") as f:
+                f.write(text)
+        else:
+            sys.stderr.write(text)
+
+
+class TracingCursor(TimedCursor):
+    """TimedCursor that also reports each statement to its connection's tracer"""
+
+    _run = None
+
+    def execute(self, sql, parameters=()):
+        tracer = self.connection.sql_tracer
+        self._run = run = tracer.begin(self, sql, parameters)
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            tracer.executed(run)
+            tracer.charge(self, run, time.perf_counter() - start)
+
+    def _fetch(self, fetch, *args):
+        start = time.perf_counter()
+        rows = super()._fetch(fetch, *args)
+        if self._run is not None:
+            count = len(rows) if isinstance(rows, list) else int(rows is not None)
+            self.connection.sql_tracer.charge(
+                self, self._run, time.perf_counter() - start, count
+            )
+        return rows
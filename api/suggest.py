@@ -0,0 +1,238 @@
+"""
+Typeahead suggestions for the Lateral Entry Portal search box
+Sorted-array prefix index over names, ministries, departments and positions,
+rebuilt in the background so lookups never touch SQLite
+"""
+
+import bisect
+import logging
+import os
+import re
+import sqlite3
+import threading
+from array import array
+
+logger = logging.getLogger("lateral_entry.suggest")
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text):
+    """Lowercase words separated by single spaces; punctuation is dropped"""
+    return " ".join(_WORD.findall(text.casefold()))
+
+
+def word_suffixes(key):
+    """'ravi kumar singh' -> ['kumar singh', 'singh']"""
+    return [key[i + 1 :] for i, char in enumerate(key) if char == " "]
+
+
+class SuggestIndex:
+    """
+    Immutable prefix index.
+
+    Names live in two sorted key arrays with parallel arrays of row
+    positions: one keyed by the whole name, one by every later word, so
+    "kum" finds "Ravi Kumar". A prefix is a bisect plus a scan that stops
+    after k distinct names, so lookups cost O(log n + k) whatever the size.
+    Ministries, departments and positions are few (hundreds at most) and
+    are indexed the same way; all of a prefix's matches are ranked by
+    appointee count.
+    """
+
+    __slots__ = (
+        "data_version",
+        "names",
+        "name_keys",
+        "name_rows",
+        "word_keys",
+        "word_rows",
+        "terms",
+        "term_keys",
+        "term_rows",
+        "term_whole",
+    )
+
+    def __init__(self, data_version, names, terms):
+        self.data_version = data_version
+        self.names = names
+
+        whole, words = [], []
+        for i, (_, name, _) in enumerate(names):
+            key = normalize(name)
+            whole.append((key, i))
+            words.extend((suffix, i) for suffix in word_suffixes(key))
+        self.name_keys, self.name_rows = self._sorted(whole)
+        self.word_keys, self.word_rows = self._sorted(words)
+
+        # Terms: whole text and every later word in one array; a term that
+        # matches at its start is told apart when ranking
+        self.terms = terms
+        keyed = []
+        self.term_whole = [normalize(text) for _, text, _ in terms]
+        for i, key in enumerate(self.term_whole):
+            keyed.append((key, i))
+            keyed.extend((suffix, i) for suffix in word_suffixes(key))
+        self.term_keys, self.term_rows = self._sorted(keyed)
+
+    @staticmethod
+    def _sorted(pairs):
+        pairs.sort()
+        return [key for key, _ in pairs], array("l", (i for _, i in pairs))
+
+    @classmethod
+    def load(cls, conn, data_version, loader):
+        """Read names and terms inside one transaction so they agree"""
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            names, terms = loader(cursor)
+        finally:
+            cursor.execute("COMMIT")
+        return cls(data_version, names, terms)
+
+    def _scan(self, keys, rows, prefix, limit, seen):
+        found = []
+        i = bisect.bisect_left(keys, prefix)
+        while i < len(keys) and len(found) < limit and keys[i].startswith(prefix):
+            row = rows[i]
+            if row not in seen:
+                seen.add(row)
+                found.append(row)
+            i += 1
+        return found
+
+    def _term(self, row):
+        kind, text, count = self.terms[row]
+        return {"type": kind, "text": text, "count": count}
+
+    def _name(self, row):
+        entrant_id, name, batch_year = self.names[row]
+        return {
+            "type": "name",
+            "text": name,
+            "id": entrant_id,
+            "batch_year": batch_year,
+        }
+
+    def suggest(self, query, limit=8, kinds=None):
+        """
+        Up to `limit` completions for query. Matches at the start of the
+        text rank before matches at a later word; within each group terms
+        come first by appointee count, then names alphabetically.
+        """
+        prefix = normalize(query)
+        if not prefix or limit <= 0:
+            return []
+
+        term_starts, term_words = [], []
+        for row in self._scan(
+            self.term_keys, self.term_rows, prefix, len(self.terms), set()
+        ):
+            if kinds and self.terms[row][0] not in kinds:
+                continue
+            starts = self.term_whole[row].startswith(prefix)
+            (term_starts if starts else term_words).append(row)
+        by_count = lambda row: (-self.terms[row][2], self.terms[row][1])
+        term_starts.sort(key=by_count)
+        term_words.sort(key=by_count)
+
+        name_starts, name_words = [], []
+        if not kinds or "name" in kinds:
+            seen = set()
+            name_starts = self._scan(
+                self.name_keys, self.name_rows, prefix, limit, seen
+            )
+            if len(term_starts) + len(name_starts) < limit:
+                name_words = self._scan(
+                    self.word_keys, self.word_rows, prefix, limit, seen
+                )
+
+        ranked = (
+            [self._term(row) for row in term_starts]
+            + [self._name(row) for row in name_starts]
+            + [self._term(row) for row in term_words]
+            + [self._name(row) for row in name_words]
+        )
+        return ranked[:limit]
+
+
+class SuggestStore:
+    """
+    Keeps the current SuggestIndex, rebuilt by a background thread.
+
+    The thread has its own connection and polls PRAGMA data_version every
+    `interval` seconds; when the data moves it builds a new index and swaps
+    the reference. Request threads only read that reference, so typeahead
+    traffic never reaches SQLite. The first lookup waits for the first build.
+    """
+
+    def __init__(self, pool, loader, interval=2.0):
+        self.pool = pool
+        self.loader = loader
+        self.interval = interval
+        self.builds = 0
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._index = None
+
+    def start(self):
+        """Start the builder thread (again, in a forked worker)"""
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="suggest-index", daemon=True
+            )
+            self._thread.start()
+
+    def _stat_file(self):
+        try:
+            st = os.stat(self.pool.db_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    def _run(self):
+        conn = None
+        file_id = None
+        seen = None
+        version = 0
+        while not self._stop.is_set():
+            try:
+                current_file = self._stat_file()
+                if conn is None or current_file != file_id:
+                    if conn is not None:
+                        conn.discard()
+                    conn = self.pool.open_connection()
+                    file_id = current_file
+                    seen = None
+                current = conn.execute("PRAGMA data_version").fetchone()[0]
+                if current != seen:
+                    version += 1
+                    self._index = SuggestIndex.load(conn, version, self.loader)
+                    self.builds += 1
+                    seen = current
+                    self._ready.set()
+            except sqlite3.Error as e:
+                logger.warning("suggest index build failed: %s", e)
+                if conn is not None:
+                    conn.discard()
+                conn = None
+            self._stop.wait(self.interval)
+        if conn is not None:
+            conn.discard()
+
+    def current(self, timeout=30):
+        """The latest index, or None if the first build has not finished"""
+        self.start()
+        self._ready.wait(timeout)
+        return self._index
+
+    def close(self):
+        self._stop.set()
@@ -42,21 +42,62 @@ const API = {
         }
     },
     
+    // data/index.json (written by export_static_json.py) maps each file to
+    // its content-hashed name, which can be cached forever; without an index
+    // the plain names are used
+    staticIndex: null,
+    
+    loadStaticIndex() {
+        if (!this.staticIndex) {
+            this.staticIndex = fetch(`${BASE_PATH}data/index.json`, { cache: 'no-cache' })
+                .then(response => response.ok ? response.json() : {})
+                .catch(() => ({}));
+        }
+        return this.staticIndex;
+    },
+    
+    async staticUrl(file) {
+        const files = (await this.loadStaticIndex()).files || {};
+        return `${BASE_PATH}data/${files[file] || file}`;
+    },
+    
+    // Parsed data file, or null when it does not exist (an export without
+    // the batches/, entrants/ and pages/ shards)
+    async fetchStatic(file) {
+        const response = await fetch(await this.staticUrl(file));
+        if (!response.ok) return null;
+        return await response.json();
+    },
+    
     async getStatic(endpoint) {
         try {
             // Map API endpoints to static JSON files
             let staticFile = null;
             
             if (endpoint === '/stats') {
-                staticFile = `${BASE_PATH}data/stats.json`;
+                staticFile = await this.staticUrl('stats.json');
             } else if (endpoint === '/batches') {
-                staticFile = `${BASE_PATH}data/batches.json`;
+                staticFile = await this.staticUrl('batches.json');
             } else if (endpoint.startsWith('/batches/')) {
                 // For batch detail, we'll fetch entrants and filter
                 const year = parseInt(endpoint.split('/')[2]);
                 return await this.getBatchDetailStatic(year);
+            } else if (endpoint.startsWith('/search')) {
+                const params = new URLSearchParams(endpoint.split('?')[1] || '');
+                const limit = parseInt(params.get('limit') || '0') || this.STATIC_SEARCH_LIMIT;
+                return await this.searchStatic(params.get('q') || '', limit);
+            } else if (/^\/entrants\/\d+/.test(endpoint)) {
+                return await this.getEntrantStatic(parseInt(endpoint.split('/')[2]));
             } else if (endpoint.startsWith('/entrants')) {
-                staticFile = `${BASE_PATH}data/entrants.json`;
+                // A limited listing only needs the pages/ shards it overlaps
+                const params = new URLSearchParams(endpoint.split('?')[1] || '');
+                if (params.has('limit')) {
+                    const page = await this.getEntrantsPageStatic(
+                        parseInt(params.get('limit')), parseInt(params.get('offset') || '0')
+                    );
+                    if (page) return page;
+                }
+                staticFile = await this.staticUrl('entrants.json');
             }
             
             if (!staticFile) {
@@ -90,10 +131,157 @@ const API = {
         }
     },
     
+    // Static search over data/search/ (export_search_index in
+    // export_static_json.py): every query word must match the start of a
+    // term; documents rank by field weight times term rarity, best first
+    STATIC_SEARCH_LIMIT: 100,
+    searchMeta: null,
+    searchFiles: new Map(),
+    
+    searchTokens(text) {
+        // Same tokens as search_tokens() in export_static_json.py
+        return text.toLowerCase().normalize('NFKD').replace(/\p{M}/gu, '')
+            .match(/[\p{L}\p{N}_]+/gu) || [];
+    },
+    
+    searchFile(kind, key, version) {
+        const file = `search/${kind}/${encodeURIComponent(key)}.json?v=${version}`;
+        if (!this.searchFiles.has(file)) {
+            this.searchFiles.set(file, this.fetchStatic(file));
+        }
+        return this.searchFiles.get(file);
+    },
+    
+    async searchStatic(query, limit) {
+        try {
+            if (!this.searchMeta) this.searchMeta = this.fetchStatic('search/meta.json');
+            const meta = await this.searchMeta;
+            if (!meta) return await this.searchEntrantsStatic(query, limit);
+            
+            const words = [...new Set(this.searchTokens(query))];
+            const fieldSpan = 2 ** meta.field_bits;
+            let scores = null;
+            for (const word of words) {
+                // One shard holds every term this word prefixes; a word
+                // shorter than the shard key needs each shard it prefixes
+                const keys = word.length >= meta.prefix_length
+                    ? [word.slice(0, meta.prefix_length)].filter(key => key in meta.terms)
+                    : Object.keys(meta.terms).filter(key => key.startsWith(word));
+                const shards = await Promise.all(
+                    keys.map(key => this.searchFile('terms', key, meta.terms[key]))
+                );
+                
+                // Best score per document over the terms the word prefixes
+                const wordScores = new Map();
+                for (const shard of shards.filter(Boolean)) {
+                    for (const [term, deltas] of Object.entries(shard.terms)) {
+                        if (!term.startsWith(word)) continue;
+                        const df = deltas.length;
+                        const idf = Math.log(1 + (meta.documents - df + 0.5) / (df + 0.5));
+                        let posting = 0;
+                        for (const delta of deltas) {
+                            posting += delta;
+                            const doc = Math.floor(posting / fieldSpan);
+                            const fields = posting % fieldSpan;
+                            let weight = 0;
+                            meta.weights.forEach((w, bit) => {
+                                if (fields & (1 << bit)) weight = Math.max(weight, w);
+                            });
+                            const score = weight * idf;
+                            if (score > (wordScores.get(doc) || 0)) wordScores.set(doc, score);
+                        }
+                    }
+                }
+                
+                if (scores === null) {
+                    scores = wordScores;
+                } else {
+                    const both = new Map();
+                    wordScores.forEach((score, doc) => {
+                        if (scores.has(doc)) both.set(doc, scores.get(doc) + score);
+                    });
+                    scores = both;
+                }
+                if (scores.size === 0) break;
+            }
+            
+            const ranked = [...(scores || [])]
+                .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+                .slice(0, limit)
+                .map(([doc]) => doc);
+            const chunkIds = [...new Set(ranked.map(doc => Math.floor(doc / meta.doc_chunk)))];
+            const chunks = new Map(await Promise.all(
+                chunkIds.map(async n => [n, await this.searchFile('docs', n, meta.docs[n])])
+            ));
+            const results = ranked.map(doc => {
+                const row = chunks.get(Math.floor(doc / meta.doc_chunk))[doc % meta.doc_chunk];
+                return Object.fromEntries(meta.doc_fields.map((field, i) => [field, row[i]]));
+            });
+            return { query, results, count: results.length, total: scores ? scores.size : 0 };
+        } catch (error) {
+            console.error(`Static search failed (${query}):`, error);
+            return null;
+        }
+    },
+    
+    async searchEntrantsStatic(query, limit) {
+        // Exports without data/search/: substring scan of entrants.json
+        const response = await fetch(await this.staticUrl('entrants.json'));
+        if (!response.ok) throw new Error('Failed to load entrants.json');
+        const data = await response.json();
+        const allEntrants = Array.isArray(data) ? data : (data.entrants || []);
+        const lowerQuery = query.toLowerCase();
+        const matches = allEntrants.filter(e =>
+            ['name', 'ministry', 'department', 'position'].some(field =>
+                e[field] && e[field].toLowerCase().includes(lowerQuery))
+        );
+        const results = matches.slice(0, limit);
+        return { query, results, count: results.length, total: matches.length };
+    },
+    
+    async getEntrantsPageStatic(limit, offset) {
+        // pages/<n>.json holds entrants.json in pages of index.json's page_size
+        const pageSize = (await this.loadStaticIndex()).page_size;
+        if (!pageSize) return null;
+        
+        const first = Math.floor(offset / pageSize) + 1;
+        const last = Math.floor((offset + Math.max(limit, 1) - 1) / pageSize) + 1;
+        const files = [];
+        for (let page = first; page <= last; page++) {
+            files.push(this.fetchStatic(`pages/${page}.json`));
+        }
+        const pages = (await Promise.all(files)).filter(Boolean);
+        if (pages.length === 0) return null;
+        
+        const start = offset - (first - 1) * pageSize;
+        return pages.flatMap(page => page.entrants).slice(start, start + limit);
+    },
+    
+    async getEntrantStatic(id) {
+        try {
+            // entrants/<id>.json is the full profile, as /api/entrants/<id>
+            const profile = await this.fetchStatic(`entrants/${id}.json`);
+            if (profile) return profile;
+            
+            const response = await fetch(await this.staticUrl('entrants.json'));
+            if (!response.ok) throw new Error('Failed to load entrants.json');
+            const data = await response.json();
+            const allEntrants = Array.isArray(data) ? data : (data.entrants || []);
+            return allEntrants.find(e => e.id === id) || null;
+        } catch (error) {
+            console.error(`Failed to load profile ${id} from static files:`, error);
+            return null;
+        }
+    },
+    
     async getBatchDetailStatic(year) {
         try {
-            // Load entrants.json and filter by year
-            const response = await fetch(`${BASE_PATH}data/entrants.json`);
+            // batches/<year>.json is the same document as /api/batches/<year>
+            const detail = await this.fetchStatic(`batches/${year}.json`);
+            if (detail) return detail;
+            
+            // Older exports: load entrants.json and filter by year
+            const response = await fetch(await this.staticUrl('entrants.json'));
             if (!response.ok) throw new Error('Failed to load entrants.json');
             let data = await response.json();
             
@@ -151,8 +339,9 @@ const API = {
         return await API.get('/batches');
     },
     
-    batch: async (year) => {
-        return await API.get(`/batches/${year}`);
+    batch: async (year, params = {}) => {
+        const query = new URLSearchParams(params).toString();
+        return await API.get(`/batches/${year}${query ? '?' + query : ''}`);
     },
     
     ministries: async () => {
@@ -163,8 +352,9 @@ const API = {
         return await API.get('/positions');
     },
     
-    search: async (query) => {
-        return await API.get(`/search?q=${encodeURIComponent(query)}`);
+    search: async (query, params = {}) => {
+        const extra = new URLSearchParams(params).toString();
+        return await API.get(`/search?q=${encodeURIComponent(query)}${extra ? '&' + extra : ''}`);
     },
     
     timeline: async () => {
@@ -230,11 +420,135 @@ function initMobileNav() {
     });
 }
 
+// Typeahead suggestions from /api/suggest (API only; static hosting has none)
+function initSuggest(input, onPick) {
+    const container = input.parentElement;
+    container.style.position = 'relative';
+
+    const list = document.createElement('ul');
+    list.className = 'suggest-list hidden';
+    list.setAttribute('role', 'listbox');
+    container.appendChild(list);
+
+    const icons = {
+        name: 'fa-user',
+        ministry: 'fa-landmark',
+        department: 'fa-building',
+        position: 'fa-briefcase',
+    };
+    let suggestions = [];
+    let active = -1;
+    let timer = null;
+    let controller = null;
+
+    const close = () => {
+        list.classList.add('hidden');
+        active = -1;
+    };
+
+    const render = () => {
+        if (!suggestions.length) return close();
+        // Suggestion text comes from the database: set it as text, never as HTML
+        list.replaceChildren(...suggestions.map((s, i) => {
+            const item = document.createElement('li');
+            item.setAttribute('role', 'option');
+            item.dataset.index = i;
+            item.className = `suggest-item${i === active ? ' active' : ''}`;
+            const icon = document.createElement('i');
+            icon.className = `fas ${icons[s.type] || 'fa-search'}`;
+            const text = document.createElement('span');
+            text.textContent = s.text;
+            const detail = document.createElement('small');
+            detail.textContent = s.type === 'name' ? s.batch_year : `${s.type} · ${s.count}`;
+            item.append(icon, text, detail);
+            return item;
+        }));
+        list.classList.remove('hidden');
+    };
+
+    const fetchSuggestions = async (query) => {
+        if (controller) controller.abort();
+        controller = new AbortController();
+        try {
+            const response = await fetch(
+                `${API_BASE_URL}/suggest?q=${encodeURIComponent(query)}&limit=8`,
+                { signal: controller.signal }
+            );
+            if (!response.ok) return;
+            suggestions = (await response.json()).suggestions || [];
+            active = -1;
+            render();
+        } catch (error) {
+            if (error.name !== 'AbortError') close();
+        }
+    };
+
+    input.addEventListener('input', (e) => {
+        clearTimeout(timer);
+        // Skip the event pickSuggestion dispatches itself
+        if (!e.isTrusted) return close();
+        const query = input.value.trim();
+        if (!query || !API_BASE_URL || API.useStaticFallback) {
+            suggestions = [];
+            return close();
+        }
+        timer = setTimeout(() => fetchSuggestions(query), 80);
+    });
+
+    input.addEventListener('keydown', (e) => {
+        if (list.classList.contains('hidden')) return;
+        if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+            e.preventDefault();
+            const step = e.key === 'ArrowDown' ? 1 : -1;
+            active = (active + step + suggestions.length) % suggestions.length;
+            render();
+        } else if (e.key === 'Enter' && active >= 0) {
+            e.preventDefault();
+            e.stopImmediatePropagation();
+            onPick(suggestions[active]);
+            close();
+        } else if (e.key === 'Escape') {
+            close();
+        }
+    });
+
+    // mousedown fires before the input's blur, so the pick is not lost
+    list.addEventListener('mousedown', (e) => {
+        const item = e.target.closest('[data-index]');
+        if (!item) return;
+        e.preventDefault();
+        onPick(suggestions[Number(item.dataset.index)]);
+        close();
+    });
+    input.addEventListener('blur', close);
+}
+
+// Open a picked suggestion: a name goes to the profile, anything else
+// becomes the search text
+function pickSuggestion(input, suggestion, search) {
+    if (suggestion.type === 'name') {
+        const isInPagesDir = window.location.pathname.includes('/pages/');
+        window.location.href = isInPagesDir
+            ? `./profile-detail.html?id=${suggestion.id}`
+            : `./pages/profile-detail.html?id=${suggestion.id}`;
+        return;
+    }
+    input.value = suggestion.text;
+    input.dispatchEvent(new Event('input'));
+    if (search) search();
+}
+
 // Search functionality
 function initSearch() {
     const searchInput = document.getElementById('search-input');
     const searchBtn = document.getElementById('search-btn');
-    
+
+    if (searchInput) {
+        initSuggest(searchInput, (suggestion) => pickSuggestion(
+            searchInput, suggestion, searchBtn ? () => searchBtn.click() : null
+        ));
+    }
+
     if (!searchInput || !searchBtn) return;
     
     const performSearch = async () => {
@@ -75,7 +75,9 @@ create_backup() {
     # 1. Backup Database (most critical)
     log_info "📦 Backing up database..."
     if [ -f "${PROJECT_ROOT}/database/lateral_entry.db" ]; then
-        cp "${PROJECT_ROOT}/database/lateral_entry.db" "${backup_dir}/lateral_entry.db"
+        # The API server keeps the database in WAL mode: committed pages can
+        # still be in lateral_entry.db-wal, so copy through SQLite, not cp
+        sqlite3 "${PROJECT_ROOT}/database/lateral_entry.db" ".backup '${backup_dir}/lateral_entry.db'"
         sqlite3 "${PROJECT_ROOT}/database/lateral_entry.db" ".backup '${backup_dir}/lateral_entry.db.sqlite3backup'"
         log_success "Database backed up (2 formats for safety)"
     else
@@ -207,9 +209,18 @@ fi
 
 echo "🔄 Restoring from backup..."
 
-# Restore database
-cp -f "${BACKUP_DIR}/lateral_entry.db" "${PROJECT_ROOT}/database/"
-cp -rf "${BACKUP_DIR}/database/"* "${PROJECT_ROOT}/database/"
+# Restore database: through the SQLite backup API, which a running API
+# server (WAL mode, open -wal/-shm files) sees as an ordinary write; copying
+# over the file under it corrupts the database
+IMAGE="${BACKUP_DIR}/lateral_entry.db.sqlite3backup"
+[ -f "$IMAGE" ] || IMAGE="${BACKUP_DIR}/lateral_entry.db"
+sqlite3 "${PROJECT_ROOT}/database/lateral_entry.db" ".restore '${IMAGE}'"
+for path in "${BACKUP_DIR}/database/"*; do
+    case "$(basename "$path")" in
+        lateral_entry.db|lateral_entry.db-wal|lateral_entry.db-shm|lateral_entry.db-journal) ;;
+        *) cp -rf "$path" "${PROJECT_ROOT}/database/" ;;
+    esac
+done
 
 # Restore data
 cp -rf "${BACKUP_DIR}/data/"* "${PROJECT_ROOT}/data/"
@@ -253,6 +264,34 @@ EOF
     log_success "=========================================="
 }
 
+# Restore lateral_entry.db from a backup directory. Goes through the SQLite
+# backup API: the API server keeps the database open in WAL mode, and copying
+# a file over it (leaving its -wal/-shm behind) corrupts the database. The
+# restore is an ordinary write to a running server, which sees the new data.
+restore_database() {
+    local backup_dir=$1
+    local db="${PROJECT_ROOT}/database/lateral_entry.db"
+    local image="${backup_dir}/lateral_entry.db.sqlite3backup"
+
+    [ -f "$image" ] || image="${backup_dir}/lateral_entry.db"
+    sqlite3 "$db" ".restore '${image}'"
+    if [ "$(sqlite3 "$db" "PRAGMA integrity_check;")" != "ok" ]; then
+        log_error "Restored database failed its integrity check!"
+        exit 1
+    fi
+
+    # The rest of database/ (schema, scripts); the copies of the database
+    # file in there are skipped, lateral_entry.db was restored above
+    local path
+    for path in "${backup_dir}/database/"*; do
+        case "$(basename "$path")" in
+            lateral_entry.db|lateral_entry.db-wal|lateral_entry.db-shm|lateral_entry.db-journal) ;;
+            *) cp -rf "$path" "${PROJECT_ROOT}/database/" ;;
+        esac
+    done
+    log_success "Database restored"
+}
+
 # Restore from backup
 restore_backup() {
     local backup_name=$1
@@ -303,8 +342,7 @@ restore_backup() {
     
     # Restore database
     log_info "🔄 Restoring database..."
-    cp -f "${backup_dir}/lateral_entry.db" "${PROJECT_ROOT}/database/"
-    cp -rf "${backup_dir}/database/"* "${PROJECT_ROOT}/database/"
+    restore_database "$backup_dir"
     
     # Restore data
     log_info "🔄 Restoring data directory..."
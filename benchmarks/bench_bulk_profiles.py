@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Benchmark fetching N full profiles: N x /api/entrants/<id> vs /api/entrants/bulk
+Usage: python benchmarks/bench_bulk_profiles.py [rows]
+"""
+
+import random
+import sqlite3
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    db_path = scaled_db_copy(rows)
+    conn = sqlite3.connect(db_path)
+    ids = [row[0] for row in conn.execute("SELECT id FROM lateral_entrants")]
+    conn.close()
+    server = load_server(db_path)
+    client = server.app.test_client()
+    rng = random.Random(11)
+
+    print("=" * 70)
+    print(f"BULK PROFILE BENCHMARK ({rows} entrants with synthetic child rows)")
+    print("=" * 70)
+
+    for n in [10, 50, 100]:
+        print(f"\n{n} profiles")
+        batches = [rng.sample(ids, n) for _ in range(50)]
+        it = iter(batches * 10)
+
+        def one_by_one():
+            for entrant_id in next(it):
+                client.get(f"/api/entrants/{entrant_id}")
+
+        def bulk():
+            client.get(f"/api/entrants/bulk?ids={','.join(map(str, next(it)))}")
+
+        print_result(f"{n} x GET /api/entrants/<id>", measure(one_by_one, 40, 5))
+        it = iter(batches * 10)
+        print_result("GET /api/entrants/bulk", measure(bulk, 40, 5))
+
+
+if __name__ == "__main__":
+    main()
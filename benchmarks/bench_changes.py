@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark incremental sync: /api/changes?since= after a batch of edits vs
+re-downloading everything through /api/export, as the table grows
+Usage: python benchmarks/bench_changes.py [rows ...]
+"""
+
+import random
+import sqlite3
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+EDITS = [10, 100, 1000]
+
+
+def apply_edits(db_path, count, seed=42):
+    """Update `count` random entrants and add one education row for each"""
+    conn = sqlite3.connect(db_path)
+    rng = random.Random(seed)
+    ids = [row[0] for row in conn.execute("SELECT id FROM lateral_entrants")]
+    for entrant_id in rng.sample(ids, min(count, len(ids))):
+        conn.execute(
+            "UPDATE lateral_entrants SET state = ? WHERE id = ?",
+            (rng.choice(["Goa", "Kerala", "Punjab"]), entrant_id),
+        )
+        conn.execute(
+            "INSERT INTO education_details (entrant_id, degree_name) VALUES (?, ?)",
+            (entrant_id, "Executive MBA"),
+        )
+    conn.commit()
+    conn.close()
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+
+    print("=" * 70)
+    print("CHANGE FEED BENCHMARK")
+    print("=" * 70)
+
+    for rows in sizes:
+        db_path = scaled_db_copy(rows)
+        server = load_server(db_path)
+        client = server.app.test_client()
+        export_bytes = len(client.get("/api/export").get_data())
+
+        since = client.get("/api/changes?since=0").get_json()["latest"]
+        for count in EDITS:
+            apply_edits(db_path, count)
+            feed = client.get(f"/api/changes?since={since}&limit=5000")
+            changes = feed.get_json()
+            print(
+                f"\n{count} edits ({rows} entrants): {len(changes['changes'])} changed"
+                f" rows, {len(feed.get_data()) / 1024:.0f} KB vs"
+                f" {export_bytes / 1024:.0f} KB full export"
+            )
+            print_result(
+                "/api/changes",
+                measure(
+                    lambda: client.get(f"/api/changes?since={since}&limit=5000"), 50, 5
+                ),
+            )
+            print_result(
+                "/api/export (full reload)",
+                measure(lambda: client.get("/api/export").get_data(), 5, 1),
+            )
+            since = changes["latest"]
+
+
+if __name__ == "__main__":
+    main()
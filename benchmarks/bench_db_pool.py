@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark pooled connections against a fresh sqlite3.connect() per request
+Usage: python benchmarks/bench_db_pool.py [iterations]
+"""
+
+import sqlite3
+import sys
+
+from bench_utils import load_server, measure, print_result, temp_db_copy
+
+ENDPOINTS = [
+    "/api/stats",
+    "/api/entrants?limit=20",
+    "/api/batches/2021",
+    "/api/search?q=Kumar",
+]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    db_path = temp_db_copy()
+    server = load_server(db_path)
+    client = server.app.test_client()
+
+    def connect_per_request():
+        """The pre-pool get_db(): new connection for every request"""
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    pooled_get_db = server.get_db
+
+    print("=" * 70)
+    print(f"CONNECTION POOL BENCHMARK ({iterations} requests per endpoint)")
+    print("=" * 70)
+
+    def request(endpoint):
+        # A failing request is fast; timing it would make the comparison meaningless
+        response = client.get(endpoint)
+        assert response.status_code == 200, (endpoint, response.status_code)
+
+    for endpoint in ENDPOINTS:
+        print(f"\n{endpoint}")
+        server.get_db = connect_per_request
+        fresh = measure(lambda: request(endpoint), iterations)
+        print_result("connect per request", fresh)
+
+        server.get_db = pooled_get_db
+        pooled = measure(lambda: request(endpoint), iterations)
+        print_result("pooled", pooled)
+        print(f"  speedup at p50: {fresh['p50_ms'] / pooled['p50_ms']:.2f}x")
+
+    print(f"\nPool connections opened: {server.db_pool.connections_opened}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark ministry / department filters: canonical id lookups through the
+alias tables vs the old LIKE '%x%' scan over the text columns
+Usage: python benchmarks/bench_dimensions.py [rows ...]
+"""
+
+import sqlite3
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+FILTERS = [
+    ("ministry", "Finance"),
+    ("ministry", "Health and Family Welfare"),
+    ("department", "Statistics & Programme Implementation"),
+]
+
+LISTING = (
+    "SELECT * FROM lateral_entrants WHERE {} ORDER BY batch_year DESC,"
+    " COALESCE(date_of_appointment, '') DESC, id DESC LIMIT 50"
+)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+
+    print("=" * 70)
+    print("DIMENSION FILTER BENCHMARK")
+    print("=" * 70)
+
+    for rows in sizes:
+        db_path = scaled_db_copy(rows)
+        server = load_server(db_path)
+        client = server.app.test_client()
+        conn = sqlite3.connect(db_path)
+        for column, value in FILTERS:
+            aliases, key = server.DIMENSIONS[column]
+            by_id = (
+                f"{key} IN (SELECT {key} FROM {aliases} WHERE alias LIKE ?)",
+                f"%{value}%",
+            )
+            by_text = (f"{column} LIKE ?", f"%{value}%")
+            matched = {
+                label: conn.execute(
+                    f"SELECT COUNT(*) FROM lateral_entrants WHERE {where}", (param,)
+                ).fetchone()[0]
+                for label, (where, param) in (("id", by_id), ("text", by_text))
+            }
+            print(
+                f"\n{column}={value} ({rows} entrants;"
+                f" {matched['id']} rows by id, {matched['text']} by text)"
+            )
+            for label, (where, param) in (("id IN aliases", by_id), ("LIKE", by_text)):
+                print_result(
+                    f"page of 50, {label}",
+                    measure(
+                        lambda: conn.execute(
+                            LISTING.format(where), (param,)
+                        ).fetchall(),
+                        100,
+                        5,
+                    ),
+                )
+                print_result(
+                    f"COUNT(*), {label}",
+                    measure(
+                        lambda: conn.execute(
+                            f"SELECT COUNT(*) FROM lateral_entrants WHERE {where}",
+                            (param,),
+                        ).fetchone(),
+                        100,
+                        5,
+                    ),
+                )
+            print_result(
+                "/api/entrants",
+                measure(
+                    lambda: client.get(
+                        f"/api/entrants?{column}={value.replace('&', '%26')}&limit=50"
+                    ),
+                    100,
+                    5,
+                ),
+            )
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+Endpoint benchmark suite: every API route, through the Flask test client
+and a real WSGI server, against generated databases of several sizes.
+Writes latency percentiles and throughput to JSON, and with --baseline
+fails (exit 1) when a case got slower than the threshold allows.
+Usage: python benchmarks/bench_endpoints.py [--sizes 1000,10000]
+           [--output results.json] [--baseline previous.json]
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlencode
+
+from werkzeug.serving import make_server
+
+from bench_utils import PROJECT_DIR, load_server, percentiles, scaled_db_copy
+
+DEFAULT_OUTPUT = PROJECT_DIR / "benchmarks" / "results" / "bench_endpoints.json"
+
+# Streams the whole table; run a fraction of the iterations
+HEAVY_ROUTES = {"/api/export"}
+
+
+def sample_values(db_path, seed=7):
+    """Ids, batches and names from the database to build request paths"""
+    conn = sqlite3.connect(db_path)
+    rng = random.Random(seed)
+    ids = [row[0] for row in conn.execute("SELECT id FROM lateral_entrants")]
+    batch = conn.execute(
+        "SELECT batch_year FROM lateral_entrants GROUP BY batch_year"
+        " ORDER BY COUNT(*) DESC LIMIT 1"
+    ).fetchone()[0]
+    name = conn.execute(
+        "SELECT name FROM lateral_entrants WHERE id = ?", (rng.choice(ids),)
+    ).fetchone()[0]
+    conn.close()
+    return {
+        "id": rng.choice(ids),
+        "ids": rng.sample(ids, min(50, len(ids))),
+        "batch": batch,
+        "surname": name.split()[-1],
+    }
+
+
+def build_cases(sample):
+    """(route rule, label, method, path, JSON body) for every case"""
+    ids = ",".join(map(str, sample["ids"]))
+    return [
+        ("/api/health", "health", "GET", "/api/health", None),
+        ("/api/metrics", "metrics", "GET", "/api/metrics", None),
+        ("/api/stats", "stats", "GET", "/api/stats", None),
+        ("/api/entrants", "entrants", "GET", "/api/entrants?limit=50", None),
+        (
+            "/api/entrants",
+            "entrants filtered",
+            "GET",
+            f"/api/entrants?batch_year={sample['batch']}&position=Director"
+            "&ministry=Finance&limit=50",
+            None,
+        ),
+        (
+            "/api/entrants",
+            "entrants department",
+            "GET",
+            "/api/entrants?"
+            + urlencode({"department": "Health & Family Welfare", "limit": 50}),
+            None,
+        ),
+        (
+            "/api/entrants",
+            "entrants keyset card",
+            "GET",
+            "/api/entrants?cursor=&limit=50&fields=card",
+            None,
+        ),
+        (
+            "/api/entrants",
+            "entrants name search",
+            "GET",
+            f"/api/entrants?search={sample['surname']}&limit=50",
+            None,
+        ),
+        (
+            "/api/entrants/<int:entrant_id>",
+            "entrant detail",
+            "GET",
+            f"/api/entrants/{sample['id']}",
+            None,
+        ),
+        (
+            "/api/entrants/bulk",
+            "bulk GET 50",
+            "GET",
+            f"/api/entrants/bulk?ids={ids}",
+            None,
+        ),
+        (
+            "/api/entrants/bulk",
+            "bulk POST 50",
+            "POST",
+            "/api/entrants/bulk",
+            {"ids": sample["ids"]},
+        ),
+        (
+            "/api/facets",
+            "facets filtered",
+            "GET",
+            f"/api/facets?batch_year={sample['batch']}&ministry=Finance&limit=50",
+            None,
+        ),
+        ("/api/batches", "batches", "GET", "/api/batches", None),
+        (
+            "/api/batches/<int:batch_year>",
+            "batch detail",
+            "GET",
+            f"/api/batches/{sample['batch']}",
+            None,
+        ),
+        ("/api/ministries", "ministries", "GET", "/api/ministries", None),
+        ("/api/positions", "positions", "GET", "/api/positions", None),
+        ("/api/search", "search", "GET", "/api/search?q=finance&limit=20", None),
+        (
+            "/api/search",
+            "search name",
+            "GET",
+            f"/api/search?q={sample['surname']}&fields=name&limit=20",
+            None,
+        ),
+        (
+            "/api/search",
+            "search fuzzy",
+            "GET",
+            f"/api/search?q={sample['surname'][:-1]}x&mode=fuzzy&limit=20",
+            None,
+        ),
+        (
+            "/api/suggest",
+            "suggest",
+            "GET",
+            f"/api/suggest?q={sample['surname'][:3]}",
+            None,
+        ),
+        ("/api/export", "export json", "GET", "/api/export", None),
+        ("/api/export", "export csv", "GET", "/api/export?format=csv", None),
+        ("/api/timeline", "timeline", "GET", "/api/timeline", None),
+        ("/api/changes", "changes", "GET", "/api/changes?since=0", None),
+    ]
+
+
+def api_routes(app):
+    return sorted(
+        {rule.rule for rule in app.url_map.iter_rules() if rule.endpoint != "static"}
+    )
+
+
+def run_case(request, iterations, warmup, concurrency=1):
+    """
+    Call request() iterations times across `concurrency` threads.
+    request returns the HTTP status; anything >= 400 counts as an error.
+    """
+    for _ in range(warmup):
+        request()
+    samples = []
+    errors = []
+    lock = threading.Lock()
+
+    def worker(count):
+        local_samples = []
+        local_errors = 0
+        for _ in range(count):
+            start = time.perf_counter()
+            status = request()
+            local_samples.append((time.perf_counter() - start) * 1000)
+            local_errors += status >= 400
+        with lock:
+            samples.extend(local_samples)
+            errors.append(local_errors)
+
+    shares = [
+        iterations // concurrency + (n < iterations % concurrency)
+        for n in range(concurrency)
+    ]
+    threads = [threading.Thread(target=worker, args=(share,)) for share in shares]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    result = percentiles(samples)
+    result["throughput_rps"] = len(samples) / elapsed
+    result["errors"] = sum(errors)
+    return result
+
+
+def test_client_request(client, method, path, body):
+    def request():
+        response = client.open(path, method=method, json=body)
+        response.get_data()
+        return response.status_code
+
+    return request
+
+
+class WSGIServer:
+    """The app behind werkzeug's threaded WSGI server on a free local port"""
+
+    def __init__(self, app):
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        self.server = make_server("127.0.0.1", 0, app, threaded=True)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.thread.join()
+
+    def request_factory(self, method, path, body):
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+
+        def request():
+            conn = http.client.HTTPConnection("127.0.0.1", self.server.port)
+            try:
+                conn.request(method, path, payload, headers)
+                response = conn.getresponse()
+                response.read()
+                return response.status
+            finally:
+                conn.close()
+
+        return request
+
+
+def print_case(label, result):
+    flag = f"  ✗ {result['errors']} errors" if result["errors"] else ""
+    print(
+        f"  {label:<24} p50 {result['p50_ms']:8.3f}  p95 {result['p95_ms']:8.3f}"
+        f"  p99 {result['p99_ms']:8.3f} ms  {result['throughput_rps']:8.0f} req/s{flag}"
+    )
+
+
+def run_size(rows, args):
+    db_path = scaled_db_copy(rows, args.seed)
+    server = load_server(db_path)
+    app = server.app
+    cases = build_cases(sample_values(db_path))
+
+    covered = {case[0] for case in cases}
+    missing = [route for route in api_routes(app) if route not in covered]
+    for route in missing:
+        print(f"✗ No benchmark case for {route}")
+
+    results = []
+
+    def record(mode, rule, label, method, path, result):
+        result.update(
+            {
+                "mode": mode,
+                "rows": rows,
+                "route": rule,
+                "label": label,
+                "method": method,
+                "path": path,
+            }
+        )
+        results.append(result)
+        print_case(label, result)
+
+    def iterations_for(rule):
+        if rule in HEAVY_ROUTES:
+            return max(args.iterations // 20, 5), 1
+        return args.iterations, args.warmup
+
+    print(f"\nFlask test client ({rows} entrants)")
+    client = app.test_client()
+    for rule, label, method, path, body in cases:
+        iterations, warmup = iterations_for(rule)
+        request = test_client_request(client, method, path, body)
+        record(
+            "test_client",
+            rule,
+            label,
+            method,
+            path,
+            run_case(request, iterations, warmup),
+        )
+
+    print(f"\nWSGI server, {args.concurrency} clients ({rows} entrants)")
+    with WSGIServer(app) as wsgi:
+        for rule, label, method, path, body in cases:
+            iterations, warmup = iterations_for(rule)
+            request = wsgi.request_factory(method, path, body)
+            record(
+                "wsgi",
+                rule,
+                label,
+                method,
+                path,
+                run_case(request, iterations, warmup, args.concurrency),
+            )
+
+    server.db_pool.close_all()
+    return results, missing
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def case_key(result):
+    return (result["mode"], result["rows"], result["label"])
+
+
+def compare(results, baseline, metric, threshold, min_delta_ms):
+    """
+    Cases whose metric grew by more than `threshold` times the baseline
+    and by at least min_delta_ms (sub-millisecond timings are noisy)
+    """
+    previous = {case_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get(case_key(result))
+        if before is None:
+            continue
+        old, new = before[metric], result[metric]
+        if new > old * threshold and new - old >= min_delta_ms:
+            regressions.append((result, old, new))
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000,100000",
+        help="comma-separated entrant counts (default: %(default)s)",
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="client threads against the WSGI server (default: %(default)s)",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--baseline", help="earlier JSON output to compare against")
+    parser.add_argument(
+        "--metric",
+        default="p95_ms",
+        choices=["mean_ms", "p50_ms", "p95_ms", "p99_ms"],
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="fail when metric > baseline x threshold (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.5,
+        help="ignore slowdowns smaller than this (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    print("=" * 70)
+    print("ENDPOINT BENCHMARK SUITE")
+    print(f"Sizes: {', '.join(map(str, sizes))} entrants   seed {args.seed}")
+    print("=" * 70)
+
+    results = []
+    uncovered = set()
+    for rows in sizes:
+        size_results, missing = run_size(rows, args)
+        results.extend(size_results)
+        uncovered.update(missing)
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "sizes": sizes,
+        "seed": args.seed,
+        "iterations": args.iterations,
+        "concurrency": args.concurrency,
+        "uncovered_routes": sorted(uncovered),
+        "results": results,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print("\n" + "=" * 70)
+    print(f"✓ Results written to {output}")
+
+    failed = any(result["errors"] for result in results)
+    if failed:
+        print("✗ Some requests returned errors")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(
+            results, baseline, args.metric, args.threshold, args.min_delta_ms
+        )
+        print(
+            f"Baseline {args.baseline} (revision {baseline.get('git_revision')}),"
+            f" {args.metric} threshold x{args.threshold}"
+        )
+        for result, old, new in regressions:
+            print(
+                f"  ✗ {result['mode']:<12} {result['rows']:>8}  {result['label']:<24}"
+                f" {old:8.3f} -> {new:8.3f} ms"
+            )
+        if regressions:
+            print(f"✗ {len(regressions)} regressions")
+            failed = True
+        else:
+            print("✓ No regressions")
+    print("=" * 70)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark profile assembly for /api/entrants/<id>:
+five queries + Python dicts (previous handler) vs one JSON1 query
+Usage: python benchmarks/bench_entrant_detail.py [children per table]
+"""
+
+import json
+import random
+import sqlite3
+import sys
+
+from bench_utils import load_server, measure, print_result, temp_db_copy
+
+
+def add_child_rows(db_path, per_table):
+    """Give every entrant `per_table` rows in each child table"""
+    conn = sqlite3.connect(db_path)
+    ids = [row[0] for row in conn.execute("SELECT id FROM lateral_entrants")]
+    for entrant_id in ids:
+        for n in range(per_table):
+            conn.execute(
+                "INSERT INTO professional_details (entrant_id, previous_company,"
+                " previous_position, industry_sector, years_experience, domain_expertise)"
+                " VALUES (?, ?, 'Director', 'Finance', ?, 'Public policy and markets')",
+                (entrant_id, f"Company {n}", 5 + n),
+            )
+            conn.execute(
+                "INSERT INTO education_details (entrant_id, degree_type, degree_name,"
+                " institution, year_of_completion) VALUES (?, 'Masters', 'MBA', 'IIM', ?)",
+                (entrant_id, 1990 + n),
+            )
+            conn.execute(
+                "INSERT INTO media_coverage (entrant_id, source_name, article_title,"
+                " publication_date, content_summary) VALUES (?, 'The Hindu', ?, ?, ?)",
+                (entrant_id, f"Article {n}", f"2021-0{n % 9 + 1}-15", "Summary " * 20),
+            )
+            conn.execute(
+                "INSERT INTO achievements (entrant_id, achievement_type,"
+                " achievement_title, achievement_description) VALUES (?, 'Policy', ?, ?)",
+                (entrant_id, f"Reform {n}", "Description " * 15),
+            )
+    conn.commit()
+    conn.close()
+    return ids
+
+
+def five_query_profile(conn, entrant_id):
+    """The handler as it was: base row, four child queries, dicts, json"""
+    conn.row_factory = sqlite3.Row
+    entrant = dict(
+        conn.execute(
+            "SELECT * FROM lateral_entrants WHERE id = ?", (entrant_id,)
+        ).fetchone()
+    )
+    for key, sql in [
+        (
+            "professional_details",
+            "SELECT * FROM professional_details WHERE entrant_id = ?",
+        ),
+        ("education", "SELECT * FROM education_details WHERE entrant_id = ?"),
+        (
+            "media_coverage",
+            "SELECT * FROM media_coverage WHERE entrant_id = ? ORDER BY publication_date DESC",
+        ),
+        ("achievements", "SELECT * FROM achievements WHERE entrant_id = ?"),
+    ]:
+        entrant[key] = [dict(row) for row in conn.execute(sql, (entrant_id,))]
+    return json.dumps(entrant)
+
+
+def main():
+    per_table = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    db_path = temp_db_copy()
+    ids = add_child_rows(db_path, per_table)
+    server = load_server(db_path)
+    client = server.app.test_client()
+    rng = random.Random(7)
+
+    print("=" * 70)
+    print(f"PROFILE DETAIL BENCHMARK ({per_table} rows per child table)")
+    print("=" * 70)
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    print_result(
+        "five queries + dicts + json.dumps",
+        measure(lambda: five_query_profile(conn, rng.choice(ids)), 2000),
+    )
+    query = server.profile_query(conn.cursor())
+    print_result(
+        "one JSON1 query",
+        measure(lambda: conn.execute(query, (rng.choice(ids),)).fetchone()[0], 2000),
+    )
+    print_result(
+        "GET /api/entrants/<id>",
+        measure(lambda: client.get(f"/api/entrants/{rng.choice(ids)}"), 2000),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/entrants paging with and without the filtered-count cache
+Usage: python benchmarks/bench_entrants_count.py [rows]
+"""
+
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+FILTERS = [
+    "",
+    "&batch_year=2021",
+    "&ministry=Finance",
+    "&search=Sharma",
+]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    db_path = scaled_db_copy(rows)
+    server = load_server(db_path)
+    client = server.app.test_client()
+
+    print("=" * 70)
+    print(f"FILTERED COUNT BENCHMARK ({rows} entrants, pages 1-20 of 50)")
+    print("=" * 70)
+
+    for filters in FILTERS:
+        pages = [f"/api/entrants?limit=50&offset={n * 50}{filters}" for n in range(20)]
+
+        def walk_uncached():
+            for url in pages:
+                server.count_cache.clear()
+                client.get(url)
+
+        def walk_cached():
+            for url in pages:
+                client.get(url)
+
+        print(f"\nfilters: {filters or '(none)'}")
+        print_result("count on every page", measure(walk_uncached, 20, 2))
+        print_result("count cache", measure(walk_cached, 20, 2))
+
+    cache = server.count_cache
+    print(f"\nCount cache: {cache.hits} hits, {cache.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/export: peak Python memory and time to first byte by table size
+Usage: python benchmarks/bench_export.py [rows ...]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from bench_utils import load_server, scaled_db_copy
+
+
+def consume(client, url):
+    """Stream the response; return (ttfb ms, total ms, bytes, peak MiB)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = client.get(url, buffered=False)
+    chunks = iter(response.response)
+    size = len(next(chunks))
+    ttfb = (time.perf_counter() - start) * 1000
+    for chunk in chunks:
+        size += len(chunk)
+    total = (time.perf_counter() - start) * 1000
+    response.close()
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return ttfb, total, size, peak
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+
+    results = []
+    for rows in sizes:
+        server = load_server(scaled_db_copy(rows))
+        client = server.app.test_client()
+        for export_format in ["csv", "ndjson", "json"]:
+            url = f"/api/export?format={export_format}"
+            results.append((rows, export_format, *consume(client, url)))
+        server.db_pool.close_all()
+
+    print("=" * 78)
+    print("EXPORT BENCHMARK")
+    print("=" * 78)
+    print(
+        f"{'rows':>10} {'format':>8} {'TTFB ms':>10} {'total ms':>10}"
+        f" {'MiB out':>10} {'peak MiB':>10}"
+    )
+    for rows, export_format, ttfb, total, size, peak in results:
+        print(
+            f"{rows:>10} {export_format:>8} {ttfb:>10.2f} {total:>10.0f}"
+            f" {size / 1048576:>10.1f} {peak:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark facet counts: /api/facets (bitmap index) vs the listing plus one
+GROUP BY query per facet, as the table grows
+Usage: python benchmarks/bench_facets.py [rows ...]
+"""
+
+import sqlite3
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+QUERIES = [
+    "limit=50",
+    "batch_year=2021&ministry=Finance&limit=50",
+    "position=Director&search=kumar&limit=50",
+]
+
+FACETS = ["batch_year", "position", "ministry", "state"]
+
+
+def group_by_facets(client, conn, query):
+    """The listing request plus a GROUP BY per facet, each ignoring its own filter"""
+    client.get(f"/api/entrants?{query}")
+    args = dict(part.split("=") for part in query.split("&"))
+    filters = {
+        "batch_year": ("batch_year = ?", args.get("batch_year")),
+        "position": ("position = ?", args.get("position")),
+        "ministry": (
+            "ministry LIKE ?",
+            args.get("ministry") and f"%{args['ministry']}%",
+        ),
+        "search": ("name LIKE ?", args.get("search") and f"%{args['search']}%"),
+    }
+    for facet in FACETS:
+        where = [
+            (sql, value)
+            for key, (sql, value) in filters.items()
+            if value and key != facet
+        ]
+        conn.execute(
+            f"SELECT {facet}, COUNT(*) FROM lateral_entrants"
+            f" WHERE 1=1{''.join(' AND ' + sql for sql, _ in where)} GROUP BY {facet}",
+            [value for _, value in where],
+        ).fetchall()
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+
+    print("=" * 70)
+    print("FACET COUNT BENCHMARK")
+    print("=" * 70)
+
+    for rows in sizes:
+        db_path = scaled_db_copy(rows)
+        server = load_server(db_path)
+        client = server.app.test_client()
+        conn = sqlite3.connect(db_path)
+        for query in QUERIES:
+            print(f"\n{query} ({rows} entrants)")
+            print_result(
+                "/api/facets",
+                measure(lambda: client.get(f"/api/facets?{query}"), 200, 10),
+            )
+            print_result(
+                "/api/entrants + 4 x GROUP BY",
+                measure(lambda: group_by_facets(client, conn, query), 50, 3),
+            )
+        conn.close()
+        print(f"\nFacet index builds: {server.facet_store.builds}")
+
+
+if __name__ == "__main__":
+    main()
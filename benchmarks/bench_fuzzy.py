@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark fuzzy name search: /api/search?mode=fuzzy (trigram index) vs a
+linear scan scoring every name with difflib, as the table grows
+Usage: python benchmarks/bench_fuzzy.py [rows ...]
+"""
+
+import difflib
+import sqlite3
+import sys
+import time
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+QUERIES = ["kumr", "sharmaa", "Rajesh Sharma", "priya agarwall"]
+
+
+def linear_scan(names, query):
+    """Score every name, keep the 50 best: the approach the index replaces"""
+    query = query.casefold()
+    scored = [
+        (difflib.SequenceMatcher(None, query, name.casefold()).ratio(), name)
+        for name in names
+    ]
+    scored.sort(reverse=True)
+    return scored[:50]
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+
+    print("=" * 70)
+    print("FUZZY NAME SEARCH BENCHMARK")
+    print("=" * 70)
+
+    for rows in sizes:
+        db_path = scaled_db_copy(rows)
+        server = load_server(db_path)
+        client = server.app.test_client()
+        conn = sqlite3.connect(db_path)
+        names = [row[0] for row in conn.execute("SELECT name FROM lateral_entrants")]
+        conn.close()
+
+        start = time.perf_counter()
+        client.get("/api/search?q=warmup&mode=fuzzy")
+        print(f"\nIndex built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        for query in QUERIES:
+            print(f"\n'{query}' ({rows} entrants)")
+            print_result(
+                "/api/search?mode=fuzzy",
+                measure(lambda: client.get(f"/api/search?q={query}&mode=fuzzy"), 200),
+            )
+            print_result(
+                "difflib scan",
+                measure(
+                    lambda: linear_scan(names, query), 5 if rows > 10_000 else 20, 1
+                ),
+            )
+        print(f"\nTrigram index builds: {server.fuzzy_store.builds}")
+
+
+if __name__ == "__main__":
+    main()
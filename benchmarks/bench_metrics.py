@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark request metrics overhead: endpoints with metrics on vs off
+Usage: python benchmarks/bench_metrics.py [rows]
+"""
+
+import os
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+ENDPOINTS = [
+    "/api/stats",
+    "/api/entrants?limit=50",
+    "/api/entrants?limit=50&fields=card",
+    "/api/entrants/1",
+    "/api/search?q=finance&limit=20",
+]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    db_path = scaled_db_copy(rows)
+
+    print("=" * 70)
+    print(f"REQUEST METRICS OVERHEAD ({rows} entrants)")
+    print("=" * 70)
+
+    clients = {}
+    for label, enabled in (("metrics off", "0"), ("metrics on", "1")):
+        os.environ["LATERAL_ENTRY_METRICS"] = enabled
+        clients[label] = load_server(db_path).app.test_client()
+    os.environ.pop("LATERAL_ENTRY_METRICS")
+
+    for endpoint in ENDPOINTS:
+        print(f"\n{endpoint}")
+        for label, client in clients.items():
+            print_result(label, measure(lambda: client.get(endpoint), 2000, 100))
+
+    scrape = clients["metrics on"].get("/api/metrics").get_data()
+    print(f"\n/api/metrics body: {len(scrape):,} bytes")
+    print_result(
+        "scrape",
+        measure(lambda: clients["metrics on"].get("/api/metrics"), 200, 10),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark deep pages of /api/entrants: offset pagination vs keyset cursors
+Usage: python benchmarks/bench_pagination.py [rows]
+"""
+
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+PAGE_SIZE = 50
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    db_path = scaled_db_copy(rows)
+    server = load_server(db_path)
+    client = server.app.test_client()
+
+    print("=" * 70)
+    print(f"PAGINATION BENCHMARK ({rows} entrants, {PAGE_SIZE} per page)")
+    print("=" * 70)
+
+    # Collect the cursor that starts each page by walking the whole listing
+    cursors = [""]
+    response = client.get("/api/entrants?limit=1000&cursor=").get_json()
+    while response["has_more"]:
+        cursors.append(response["next_cursor"])
+        response = client.get(
+            f"/api/entrants?limit=1000&cursor={response['next_cursor']}"
+        ).get_json()
+
+    for offset in [0, 1_000, rows // 2, rows - 1_000]:
+        if offset >= rows:
+            continue
+        print(f"\noffset {offset}")
+        result = measure(
+            lambda: client.get(f"/api/entrants?limit={PAGE_SIZE}&offset={offset}"),
+            iterations=50,
+            warmup=5,
+        )
+        print_result("offset mode", result)
+
+        cursor = cursors[offset // 1000]
+        result = measure(
+            lambda: client.get(f"/api/entrants?limit={PAGE_SIZE}&cursor={cursor}"),
+            iterations=200,
+        )
+        print_result("cursor mode", result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark field projection: payload size and latency, full rows vs card view
+Usage: python benchmarks/bench_projection.py [rows]
+"""
+
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+VIEWS = [
+    ("/api/entrants?limit=100", "/api/entrants?limit=100&fields=card"),
+    ("/api/entrants?limit=100&cursor=", "/api/entrants?limit=100&cursor=&fields=card"),
+    ("/api/batches/2021", "/api/batches/2021?fields=card"),
+    (
+        "/api/search?q=secretary&limit=100",
+        "/api/search?q=secretary&limit=100&select=card",
+    ),
+]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    server = load_server(scaled_db_copy(rows))
+    client = server.app.test_client()
+
+    print("=" * 70)
+    print(f"FIELD PROJECTION BENCHMARK ({rows} entrants)")
+    print("=" * 70)
+
+    for full, card in VIEWS:
+        full_bytes = len(client.get(full).data)
+        card_bytes = len(client.get(card).data)
+        print(f"\n{full}")
+        print(
+            f"  payload: {full_bytes:,} -> {card_bytes:,} bytes"
+            f" ({full_bytes / card_bytes:.1f}x smaller)"
+        )
+        print_result("full rows", measure(lambda: client.get(full), 200, 10))
+        print_result("fields=card", measure(lambda: client.get(card), 200, 10))
+
+
+if __name__ == "__main__":
+    main()
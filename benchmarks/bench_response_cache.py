@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark the versioned response cache: miss, hit and 304 revalidation
+Usage: python benchmarks/bench_response_cache.py [rows]
+"""
+
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+ENDPOINTS = [
+    "/api/stats",
+    "/api/batches",
+    "/api/ministries",
+    "/api/positions",
+    "/api/timeline",
+]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    server = load_server(scaled_db_copy(rows), response_cache=True)
+    client = server.app.test_client()
+
+    print("=" * 70)
+    print(f"RESPONSE CACHE BENCHMARK ({rows} entrants)")
+    print("=" * 70)
+
+    for endpoint in ENDPOINTS:
+        print(f"\n{endpoint}")
+
+        def miss():
+            server.response_cache.clear()
+            client.get(endpoint)
+
+        print_result("miss (query + serialize)", measure(miss, 50, 5))
+        print_result("hit", measure(lambda: client.get(endpoint), 500))
+
+        etag = client.get(endpoint).headers["ETag"]
+        print_result(
+            "304 revalidation",
+            measure(lambda: client.get(endpoint, headers={"If-None-Match": etag}), 500),
+        )
+
+    cache = server.response_cache
+    print(f"\nResponse cache: {cache.hits} hits, {cache.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/search and /api/entrants?search= (FTS5 index vs LIKE scan)
+Usage: python benchmarks/bench_search.py [rows]
+"""
+
+import sqlite3
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+QUERIES = ["Sharma 4217", "Vikram Nair", "Vik", "Finance"]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    db_path = scaled_db_copy(rows)
+    server = load_server(db_path)
+    client = server.app.test_client()
+
+    print("=" * 70)
+    print(f"SEARCH BENCHMARK ({rows} entrants)")
+    print("=" * 70)
+
+    conn = sqlite3.connect(db_path)
+    for q in QUERIES:
+        print(f'\n"{q}"')
+        like = measure(
+            lambda: conn.execute(
+                "SELECT * FROM lateral_entrants WHERE name LIKE ? OR ministry LIKE ?"
+                " OR department LIKE ? OR position LIKE ? ORDER BY batch_year DESC",
+                [f"%{q}%"] * 4,
+            ).fetchall(),
+            iterations=20,
+            warmup=2,
+        )
+        print_result("SQL: LIKE scan (previous search)", like)
+
+        match = server.fts_match_expression(q, server.SEARCH_FIELDS)
+        for label, limit in [("all matches", ""), ("LIMIT 20", " LIMIT 20")]:
+            fts = measure(
+                lambda: conn.execute(
+                    "SELECT e.* FROM lateral_entrants_fts"
+                    " JOIN lateral_entrants e ON e.id = lateral_entrants_fts.rowid"
+                    " WHERE lateral_entrants_fts MATCH ?"
+                    f" ORDER BY {server.SEARCH_RANK}{limit}",
+                    [match],
+                ).fetchall(),
+                iterations=50,
+                warmup=5,
+            )
+            print_result(f"SQL: FTS5 + bm25 ({label})", fts)
+
+        endpoint = measure(
+            lambda: client.get(f"/api/search?q={q}&limit=20"), iterations=200
+        )
+        print_result("GET /api/search?limit=20", endpoint)
+
+        entrants = measure(
+            lambda: client.get(f"/api/entrants?search={q}&limit=20"), iterations=50
+        )
+        print_result("GET /api/entrants?search=&limit=20", entrants)
+
+
+if __name__ == "__main__":
+    main()
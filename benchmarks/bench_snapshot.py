@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark snapshot mode: read endpoints served from SQLite vs from memory
+Usage: python benchmarks/bench_snapshot.py [rows]
+"""
+
+import random
+import sys
+import time
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+ENDPOINTS = [
+    "/api/entrants?limit=50",
+    "/api/entrants?limit=50&offset=5000",
+    "/api/entrants?limit=50&batch_year=2021&ministry=finance",
+    "/api/entrants?limit=50&cursor=&fields=card",
+    "/api/batches/2019?fields=card",
+]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    db_path = scaled_db_copy(rows)
+    ids = list(range(1, rows + 1))
+    random.seed(42)
+
+    print("=" * 70)
+    print(f"SNAPSHOT MODE BENCHMARK ({rows} entrants)")
+    print("=" * 70)
+
+    servers = {}
+    for mode in ("sql", "snapshot"):
+        server = load_server(db_path, snapshot=(mode == "snapshot"))
+        client = server.app.test_client()
+        if mode == "snapshot":
+            start = time.perf_counter()
+            server.current_snapshot()
+            print(f"\nSnapshot load: {(time.perf_counter() - start) * 1000:.0f} ms")
+        servers[mode] = client
+
+    for endpoint in ENDPOINTS + ["/api/entrants/<random id>"]:
+        print(f"\n{endpoint}")
+        for mode, client in servers.items():
+            if endpoint.endswith("<random id>"):
+                fn = lambda: client.get(f"/api/entrants/{random.choice(ids)}")
+            else:
+                fn = lambda: client.get(endpoint)
+            print_result(mode, measure(fn, 200, 10))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the static export: time for a full and an unchanged re-run, and
+bytes a static page downloads with the batches/, entrants/, pages/ and
+search/ shards vs the whole entrants.json, raw and precompressed, as the
+table grows
+Usage: python benchmarks/bench_static_export.py [rows ...]
+"""
+
+import contextlib
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+from bench_utils import load_exporter, scaled_db_copy
+
+
+def run_export(exporter):
+    """One exporter run with its report swallowed; returns seconds"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        exporter.main()
+    return time.perf_counter() - start
+
+
+def sizes_kb(path):
+    """KB of a file and of its .gz / .br siblings (None when missing)"""
+    sizes = [path.stat().st_size / 1024]
+    for extension in ["gz", "br"]:
+        sibling = Path(f"{path}.{extension}")
+        sizes.append(sibling.stat().st_size / 1024 if sibling.exists() else None)
+    return sizes
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+
+    print("=" * 70)
+    print("STATIC EXPORT BENCHMARK")
+    print("=" * 70)
+
+    for rows in sizes:
+        db_path = scaled_db_copy(rows)
+        output_dir = db_path.parent / "static"
+        exporter = load_exporter(db_path, output_dir)
+        full = run_export(exporter)
+        unchanged = run_export(exporter)
+
+        batches = json.loads((output_dir / "batches.json").read_text())
+        largest = max(batches, key=lambda batch: batch["count"])["batch_year"]
+        profiles = sorted(
+            (output_dir / "entrants").glob("*[0-9].json"),
+            key=lambda path: path.stat().st_size,
+        )
+        terms = sorted(
+            (output_dir / "search" / "terms").glob("*.json"),
+            key=lambda path: path.stat().st_size,
+        )
+
+        print(
+            f"\n{rows} entrants: export {full:.2f} s,"
+            f" unchanged re-run {unchanged:.2f} s"
+        )
+        print(f"  {'file':<34} {'KB':>10} {'.gz KB':>10} {'.br KB':>10}")
+        for label, path in [
+            ("entrants.json", output_dir / "entrants.json"),
+            (f"batch {largest} detail", output_dir / "batches" / f"{largest}.json"),
+            ("profile (median)", profiles[len(profiles) // 2]),
+            (f"listing limit={exporter.PAGE_SIZE}", output_dir / "pages" / "1.json"),
+            ("search meta", output_dir / "search" / "meta.json"),
+            ("search term shard (median)", terms[len(terms) // 2]),
+            ("search term shard (largest)", terms[-1]),
+            ("search doc chunk", output_dir / "search" / "docs" / "0.json"),
+        ]:
+            cells = [
+                f"{size:>10.1f}" if size else f"{'-':>10}" for size in sizes_kb(path)
+            ]
+            print(f"  {label:<34} {' '.join(cells)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark the stats endpoints: trigger-maintained summary tables vs
+GROUP BY over lateral_entrants, as the entrant table grows
+Usage: python benchmarks/bench_stats.py [rows ...]
+"""
+
+import shutil
+import sqlite3
+import sys
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+ENDPOINTS = ["/api/stats", "/api/batches", "/api/ministries", "/api/positions"]
+
+
+def without_stats_tables(db_path):
+    """Copy of the database with the summary tables dropped (GROUP BY path)"""
+    target = db_path.with_name("group_by.db")
+    shutil.copyfile(db_path, target)
+    conn = sqlite3.connect(target)
+    tables = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'stats_by_%'"
+    ).fetchall()
+    for (table,) in tables:
+        conn.execute(f"DROP TABLE {table}")
+    conn.commit()
+    conn.close()
+    return target
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+
+    print("=" * 70)
+    print("STATS ENDPOINT BENCHMARK")
+    print("=" * 70)
+
+    for rows in sizes:
+        db_path = scaled_db_copy(rows)
+        clients = {
+            "summary tables": load_server(db_path).app.test_client(),
+            "GROUP BY": load_server(without_stats_tables(db_path)).app.test_client(),
+        }
+        for endpoint in ENDPOINTS:
+            print(f"\n{endpoint} ({rows} entrants)")
+            for label, client in clients.items():
+                print_result(label, measure(lambda: client.get(endpoint), 100, 5))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark typeahead: /api/suggest (in-memory prefix index) vs /api/search
+for the same keystroke prefixes, as the table grows
+Usage: python benchmarks/bench_suggest.py [rows ...]
+"""
+
+import sys
+import time
+
+from bench_utils import load_server, measure, print_result, scaled_db_copy
+
+PREFIXES = ["k", "kum", "kumar", "fin", "ministry of"]
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+
+    print("=" * 70)
+    print("TYPEAHEAD BENCHMARK")
+    print("=" * 70)
+
+    for rows in sizes:
+        server = load_server(scaled_db_copy(rows))
+        client = server.app.test_client()
+        start = time.perf_counter()
+        index = server.suggest_store.current()
+        print(f"\nIndex ready after {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        for prefix in PREFIXES:
+            print(f"\n'{prefix}' ({rows} entrants)")
+            print_result(
+                "SuggestIndex.suggest", measure(lambda: index.suggest(prefix), 5000)
+            )
+            print_result(
+                "/api/suggest",
+                measure(lambda: client.get(f"/api/suggest?q={prefix}"), 1000),
+            )
+            print_result(
+                "/api/search",
+                measure(lambda: client.get(f"/api/search?q={prefix}&limit=8"), 100, 5),
+            )
+        server.suggest_store.close()
+
+
+if __name__ == "__main__":
+    main()
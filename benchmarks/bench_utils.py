@@ -0,0 +1,103 @@
+"""
+Shared helpers for the Lateral Entry Portal benchmarks
+"""
+
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+API_DIR = PROJECT_DIR / "api"
+SOURCE_DB = PROJECT_DIR / "database" / "lateral_entry.db"
+
+
+def temp_db_copy(source=SOURCE_DB):
+    """Copy the database to a temp dir so benchmarks never touch the real file"""
+    tmp_dir = tempfile.mkdtemp(prefix="lateral-entry-bench-")
+    target = Path(tmp_dir) / "lateral_entry.db"
+    shutil.copyfile(source, target)
+    return target
+
+
+def load_server(db_path, response_cache=False, snapshot=False):
+    """
+    Import api/server.py bound to the given database file.
+    The response cache is off unless asked for, so repeated requests
+    measure the query path rather than cache hits. snapshot turns on
+    the in-memory snapshot mode.
+    """
+    os.environ["LATERAL_ENTRY_DB"] = str(db_path)
+    if snapshot:
+        os.environ["LATERAL_ENTRY_SNAPSHOT"] = "1"
+    else:
+        os.environ.pop("LATERAL_ENTRY_SNAPSHOT", None)
+    if str(API_DIR) not in sys.path:
+        sys.path.insert(0, str(API_DIR))
+    sys.modules.pop("server", None)
+    import server
+
+    if not response_cache:
+        server.response_cache.maxsize = 0
+    return server
+
+
+def load_exporter(db_path, output_dir):
+    """Import data/export_static_json.py reading db_path, writing output_dir"""
+    if str(PROJECT_DIR / "data") not in sys.path:
+        sys.path.insert(0, str(PROJECT_DIR / "data"))
+    sys.modules.pop("export_static_json", None)
+    import export_static_json
+
+    export_static_json.DB_PATH = Path(db_path)
+    export_static_json.OUTPUT_DIR = Path(output_dir)
+    return export_static_json
+
+
+def measure(fn, iterations=1000, warmup=50):
+    """Run fn repeatedly and return latency percentiles in milliseconds"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentiles(samples)
+
+
+def percentiles(samples):
+    """Latency summary for a list of samples in milliseconds"""
+    samples = sorted(samples)
+    return {
+        "iterations": len(samples),
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "p99_ms": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+def print_result(label, result):
+    print(
+        f"  {label:<40} p50 {result['p50_ms']:8.3f} ms   "
+        f"p95 {result['p95_ms']:8.3f} ms   p99 {result['p99_ms']:8.3f} ms"
+    )
+
+
+def scaled_db_copy(rows, seed=42):
+    """
+    Temp copy of the database padded to `rows` entrants and migrated.
+    The real entrants are kept; the rest, with child rows, come from the
+    seeded generator in database/generate_synthetic_data.py.
+    """
+    if str(PROJECT_DIR / "database") not in sys.path:
+        sys.path.insert(0, str(PROJECT_DIR / "database"))
+    import generate_synthetic_data
+
+    target = temp_db_copy()
+    generate_synthetic_data.build_database(target, rows, seed)
+    return target
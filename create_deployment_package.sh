@@ -33,14 +33,42 @@ echo "Copying assets..."
 cp assets/js/main.js "$DEPLOY_DIR/assets/js/"
 cp assets/css/custom.css "$DEPLOY_DIR/assets/css/"
 
-# Copy JSON data files
+# Copy JSON data files (-p keeps mtimes, so up-to-date .gz/.br siblings are
+# not recompressed below)
 echo "Copying data files..."
-cp data/entrants.json "$DEPLOY_DIR/data/"
-cp data/stats.json "$DEPLOY_DIR/data/"
-cp data/batches.json "$DEPLOY_DIR/data/"
-cp data/batch-2019.json "$DEPLOY_DIR/data/"
-cp data/batch-2021.json "$DEPLOY_DIR/data/"
-cp data/batch-2022.json "$DEPLOY_DIR/data/"
+cp -p data/entrants.json "$DEPLOY_DIR/data/"
+cp -p data/stats.json "$DEPLOY_DIR/data/"
+cp -p data/batches.json "$DEPLOY_DIR/data/"
+cp -p data/batch-2019.json "$DEPLOY_DIR/data/"
+cp -p data/batch-2021.json "$DEPLOY_DIR/data/"
+cp -p data/batch-2022.json "$DEPLOY_DIR/data/"
+
+# index.json and the content-hashed files it points to (export_static_json.py);
+# serve data/*.<hash>.json with a long immutable Cache-Control, index.json with no-cache
+if [ -f data/index.json ]; then
+    cp -p data/index.json "$DEPLOY_DIR/data/"
+    python3 -c 'import json; print("\n".join(json.load(open("data/index.json"))["files"].values()))' |
+        while read -r FILE; do mkdir -p "$(dirname "$DEPLOY_DIR/data/$FILE")"; cp -p "data/$FILE" "$DEPLOY_DIR/data/$FILE"; done
+fi
+
+# Per-batch, per-entrant, listing-page and search-index shards (with their
+# .gz/.br siblings)
+for SHARD in batches entrants pages search; do
+    if [ -d "data/$SHARD" ]; then
+        cp -rp "data/$SHARD" "$DEPLOY_DIR/data/"
+    fi
+done
+
+# Precompressed siblings written by the exporter, then any still missing;
+# nginx serves them with gzip_static on / brotli_static on
+echo "Precompressing data files..."
+find "$DEPLOY_DIR/data" -maxdepth 1 -name '*.json' | while read -r FILE; do
+    for EXT in gz br; do
+        SOURCE="data/$(basename "$FILE").$EXT"
+        if [ -f "$SOURCE" ]; then cp -p "$SOURCE" "$DEPLOY_DIR/data/"; fi
+    done
+done
+python3 data/export_static_json.py --compress "$DEPLOY_DIR/data"
 
 # Copy analytics images
 echo "Copying analytics images..."
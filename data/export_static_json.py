@@ -2,99 +2,627 @@
 """
 Export Static JSON Files for Lateral Entry Portal Deployment
 Creates entrants.json, stats.json, and batches.json for static deployment
+Reads the stats_by_* summary tables from database/migrate.py, or the
+equivalent GROUP BY queries on a database that has not been migrated
+
+Each file is also published under a content-hashed name (entrants.<hash>.json)
+that can be cached forever; index.json maps every file to its current hashed
+name. Files whose content did not change since the last run are left alone.
+
+Static clients fetch only what a page needs from the shards:
+  batches/<year>.json   same document as /api/batches/<year>
+  entrants/<id>.json    same document as /api/entrants/<id> (with child tables)
+  pages/<n>.json        entrants.json's rows in the /api/entrants listing
+                        order, in pages of PAGE_SIZE, shaped like
+                        /api/entrants?limit=PAGE_SIZE&offset=...
+  search/               inverted index for search without a server (see
+                        export_search_index)
+
+Every published file gets precompressed .gz and .br siblings at maximum
+compression (nginx gzip_static / brotli_static serve them without
+compressing per request); .br needs the brotli package.
+
+All files are read from one database snapshot, rendered in parallel worker
+processes and renamed into place only once every file is ready (see
+Publisher), so the published files always agree with each other.
+Usage: python data/export_static_json.py [path/to/lateral_entry.db [output_dir]]
+       python data/export_static_json.py --compress <dir>   (siblings only)
 """
 
-import sqlite3
+import gzip
+import hashlib
 import json
+import os
+import sqlite3
+import sys
+import time
+import unicodedata
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-DB_PATH = "/home/ubuntu/projects/lateral-entry-portal/database/lateral_entry.db"
-OUTPUT_DIR = Path("/home/ubuntu/projects/lateral-entry-portal/data")
-
-
-def export_entrants():
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DB_PATH = Path(__file__).parent.parent / "database" / "lateral_entry.db"
+OUTPUT_DIR = Path(__file__).parent
+
+# Exporter state: content hash and published versions of every file
+MANIFEST_FILE = "export-manifest.json"
+# What clients read first: file name -> current content-hashed name
+INDEX_FILE = "index.json"
+HASH_LENGTH = 10
+# Files per worker task; one task per small file would cost more in
+# inter-process overhead than the serialization itself
+RENDER_BATCH = 64
+# Hashed versions kept per file, for clients still holding an older index.json
+KEEP_VERSIONS = 2
+# Entrants per listing shard in pages/, in the listing order of
+# /api/entrants (LISTING_ORDER in api/server.py)
+PAGE_SIZE = 100
+LISTING_ORDER = "batch_year DESC, COALESCE(date_of_appointment, '') DESC, id DESC"
+
+# Client-side search index: fields and ranking weights (name..position as
+# SEARCH_WEIGHTS in api/server.py), terms per shard file by leading
+# characters, documents per card-data chunk
+SEARCH_FIELDS = ["name", "ministry", "department", "position", "profile_summary"]
+SEARCH_WEIGHTS = [10.0, 4.0, 3.0, 2.0, 1.0]
+SEARCH_PREFIX_LENGTH = 2
+SEARCH_DOC_CHUNK = 500
+SEARCH_DOC_FIELDS = ["id", "name", "batch_year", "position", "ministry", "department"]
+# Posting integers are (document << FIELD_BITS) | bitmask of matching fields
+FIELD_BITS = len(SEARCH_FIELDS)
+
+
+# PRAGMA user_version database/migrate.py sets once the summary tables are
+# filled, as MIGRATED_VERSION in api/server.py
+MIGRATED_VERSION = 1
+
+# Summary tables read by the exporter and their key columns, as
+# STATS_TABLES in api/server.py
+STATS_TABLES = {
+    "stats_by_batch": ["batch_year"],
+    "stats_by_ministry": ["ministry"],
+    "stats_by_position": ["position"],
+    "stats_by_department": ["department"],
+    "stats_by_batch_position": ["batch_year", "position"],
+    "stats_by_batch_ministry": ["batch_year", "ministry"],
+}
+
+# Child tables embedded in profiles, as PROFILE_CHILDREN in api/server.py
+PROFILE_CHILDREN = [
+    ("professional_details", "professional_details", "id"),
+    ("education", "education_details", "id"),
+    ("media_coverage", "media_coverage", "publication_date DESC"),
+    ("achievements", "achievements", "id"),
+]
+
+
+def to_json(data, compact=False):
+    if compact:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def search_tokens(text):
+    """
+    Lowercase words with diacritics removed, as FTS5's unicode61 tokenizer
+    splits them. Step for step the same as API.searchTokens in
+    assets/js/main.js (lowercase, NFKD, drop marks, runs of letters, digits
+    and _), since its lookups must find the shard keys built from these.
+    """
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(
+        char if char == "_" or unicodedata.category(char)[0] in "LN" else " "
+        for char in text
+        if unicodedata.category(char)[0] != "M"
+    ).split()
+
+
+def gzip_bytes(body):
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(body):
+    return brotli.compress(body, quality=11, mode=brotli.MODE_TEXT)
+
+
+# Sibling extension -> compressor; .br only when brotli is installed
+COMPRESSORS = {"gz": gzip_bytes}
+if brotli is not None:
+    COMPRESSORS["br"] = brotli_bytes
+SIBLING_EXTENSIONS = ("gz", "br")
+
+
+def compress_file(paths):
+    """Compress the content of paths[0] once; write the siblings of every path"""
+    body = Path(paths[0]).read_bytes()
+    for extension, compress in COMPRESSORS.items():
+        compressed = compress(body)
+        for path in paths:
+            Path(f"{path}.{extension}").write_bytes(compressed)
+    return len(body)
+
+
+def compress_files(jobs):
+    """
+    Run compress_file over jobs (tuples of paths with the same content) in a
+    process pool; brotli at quality 11 is CPU-bound, so threads would not
+    help. Largest files go first so one big file does not finish last.
+    """
+    jobs = sorted(jobs, key=lambda paths: -Path(paths[0]).stat().st_size)
+    if len(jobs) < 2:
+        return sum(map(compress_file, jobs))
+    with ProcessPoolExecutor() as pool:
+        return sum(pool.map(compress_file, jobs, chunksize=16))
+
+
+def remove_file(path):
+    """Delete a published file and its compressed siblings"""
+    for name in [path] + [f"{path}.{ext}" for ext in SIBLING_EXTENSIONS]:
+        Path(name).unlink(missing_ok=True)
+
+
+def precompress_tree(directory):
+    """
+    Compress every *.json below directory whose siblings are missing or
+    older than it (for files not written by the exporter, e.g. in the
+    deployment package); returns the number of files compressed.
+    """
+    jobs = []
+    for path in sorted(Path(directory).rglob("*.json")):
+        if path.name == MANIFEST_FILE:
+            continue
+        mtime = path.stat().st_mtime
+        for extension in COMPRESSORS:
+            sibling = Path(f"{path}.{extension}")
+            if not sibling.exists() or sibling.stat().st_mtime < mtime:
+                jobs.append((str(path),))
+                break
+    compress_files(jobs)
+    return len(jobs)
+
+
+def render_file(output_dir, name, data, hashed, compact, previous):
+    """
+    Serialize one export file in a worker process: JSON, SHA-256 and the
+    compressed siblings, written under temporary names that
+    Publisher.finish renames into place. previous is the manifest's digest
+    for name; if the content still has it and its files exist, only
+    missing siblings are produced.
+    Returns (digest, size, target, unchanged, early, late) where early and
+    late are (temporary, final) pairs; late holds the plain name of a
+    hashed file, renamed after everything it may refer to.
+    """
+    output_dir = Path(output_dir)
+    body = to_json(data, compact)
+    digest = hashlib.sha256(body).hexdigest()
+    target = name
+    if hashed:
+        path = Path(name)
+        target = path.with_name(
+            f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}"
+        ).as_posix()
+    finals = [output_dir / target, output_dir / name] if hashed else [output_dir / name]
+    unchanged = digest == previous and all(path.exists() for path in finals)
+
+    compressed = {}
+    early, late = [], []
+    for path in finals:
+        # Siblings first, so a file never appears before its .gz/.br
+        outputs = []
+        for extension, compress in COMPRESSORS.items():
+            sibling = Path(f"{path}.{extension}")
+            if not unchanged or not sibling.exists():
+                if extension not in compressed:
+                    compressed[extension] = compress(body)
+                outputs.append((sibling, compressed[extension]))
+        if not unchanged:
+            outputs.append((path, body))
+
+        for final, content in outputs:
+            temporary = final.with_name(f".{final.name}.{os.getpid()}.tmp")
+            temporary.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_bytes(content)
+            pairs = late if hashed and path == finals[-1] else early
+            pairs.append((str(temporary), str(final)))
+    return digest, len(body), target, unchanged, early, late
+
+
+def render_files(output_dir, jobs):
+    """render_file for a batch of (name, data, hashed, compact, previous)"""
+    return [render_file(output_dir, *job) for job in jobs]
+
+
+def write_atomic(path, body):
+    """Write through a temporary file and rename it over path"""
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(body)
+    os.replace(temporary, path)
+
+
+class Publisher:
+    """
+    Writes export files into output_dir only when their content changes.
+
+    publish() hands each file to a process pool, which serializes it,
+    hashes it and writes it and its .gz/.br siblings under temporary
+    names. The manifest remembers each file's SHA-256; a file whose new
+    content hashes the same is not rewritten, so its mtime (and every cache
+    keyed on it) survives the run. Changed content goes under the plain
+    name and (unless hashed=False) under name.<hash>.json; hashed versions
+    beyond KEEP_VERSIONS are removed.
+
+    Nothing is visible until finish(): once every file has rendered, the
+    temporary files are renamed into place (os.replace, atomic per file),
+    hashed files and shards first, then plain names, then index.json, so a
+    client that resolves names through index.json always sees one export.
+    If anything fails first, abort() deletes the temporary files and the
+    previous export stays as it was. Files published by an earlier run but
+    not by this one (a deleted entrant, a page that no longer exists) are
+    removed last.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        manifest_path = self.output_dir / MANIFEST_FILE
+        self.manifest = {"files": {}}
+        if manifest_path.exists():
+            self.manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        self.written = []
+        self.unchanged = []
+        self.removed = []
+        self.compressed = 0
+        # Worker processes rendering the files
+        self.workers = os.cpu_count() or 1
+        self._pool = None
+        # name -> [future, position in its batch, hashed], in publish order
+        self._jobs = {}
+        # Jobs not yet submitted, up to RENDER_BATCH
+        self._batch = []
+        # (name, build, hashed, compact) rendered once the jobs are done
+        self._deferred = []
+
+    def publish(self, name, data, hashed=True, compact=False):
+        """
+        Queue data to be written as JSON to name (and its hashed name).
+        name may be a path below output_dir, e.g. "batches/2021.json".
+        """
+        previous = self.manifest["files"].get(name, {}).get("sha256")
+        self._jobs[name] = [None, len(self._batch), hashed]
+        self._batch.append((name, data, hashed, compact, previous))
+        if len(self._batch) >= RENDER_BATCH:
+            self._submit()
+
+    def _submit(self):
+        if not self._batch:
+            return
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        future = self._pool.submit(render_files, str(self.output_dir), self._batch)
+        for job in self._batch:
+            self._jobs[job[0]][0] = future
+        self._batch = []
+
+    def _result(self, name):
+        future, position, _ = self._jobs[name]
+        return future.result()[position]
+
+    def defer(self, name, build, hashed=True, compact=False):
+        """
+        Publish build()'s result in finish(), after every queued file has
+        rendered, for files that refer to other files' versions
+        """
+        self._deferred.append((name, build, hashed, compact))
+
+    def version(self, name):
+        """Short content hash of a published file (waits for it to render)"""
+        self._submit()
+        return self._result(name)[0][:HASH_LENGTH]
+
+    def abort(self):
+        """Drop every queued file and delete whatever was already rendered"""
+        futures = {job[0] for job in self._jobs.values() if job[0] is not None}
+        for future in futures:
+            future.cancel()
+        for future in futures:
+            if not future.cancelled() and future.exception() is None:
+                for result in future.result():
+                    for temporary, _ in result[4] + result[5]:
+                        Path(temporary).unlink(missing_ok=True)
+        self._jobs = {}
+        self._batch = []
+        self._deferred = []
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def finish(self):
+        """
+        Wait for every file, rename them into place, write index.json and
+        the manifest, then remove stale files
+        """
+        try:
+            self._submit()
+            results = {name: self._result(name) for name in self._jobs}
+            for name, build, hashed, compact in self._deferred:
+                previous = self.manifest["files"].get(name, {}).get("sha256")
+                results[name] = render_file(
+                    self.output_dir, name, build(), hashed, compact, previous
+                )
+                self._jobs[name] = [None, 0, hashed]
+        except BaseException:
+            self.abort()
+            raise
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+        early, late, stale = [], [], []
+        for name, (digest, size, target, unchanged, first, last) in results.items():
+            early += first
+            late += last
+            self.compressed += bool(first or last)
+            if unchanged:
+                self.unchanged.append(name)
+                continue
+            self.written.append(name)
+            old = self.manifest["files"].get(name, {}).get("versions", [])
+            entry = {"sha256": digest, "bytes": size, "versions": []}
+            if self._jobs[name][2]:
+                versions = [target] + [v for v in old if v != target]
+                stale += versions[KEEP_VERSIONS:]
+                entry["path"] = target
+                entry["versions"] = versions[:KEEP_VERSIONS]
+            else:
+                stale += old
+            self.manifest["files"][name] = entry
+
+        for name in sorted(set(self.manifest["files"]) - set(results)):
+            entry = self.manifest["files"].pop(name)
+            stale += [name] + entry.get("versions", [])
+            self.removed.append(name)
+
+        index = {
+            "files": {
+                name: entry["path"]
+                for name, entry in sorted(self.manifest["files"].items())
+                if "path" in entry
+            },
+            "page_size": PAGE_SIZE,
+        }
+        path = self.output_dir / INDEX_FILE
+        current = (
+            hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else None
+        )
+        *_, first, last = render_file(
+            self.output_dir, INDEX_FILE, index, False, False, current
+        )
+        self.compressed += bool(first)
+
+        for temporary, final in early + late + first:
+            os.replace(temporary, final)
+        self._jobs = {}
+        self._deferred = []
+
+        # Exporter state only; not served, so not compressed
+        body = to_json(self.manifest)
+        path = self.output_dir / MANIFEST_FILE
+        if not path.exists() or path.read_bytes() != body:
+            write_atomic(path, body)
+
+        for name in stale:
+            remove_file(self.output_dir / name)
+
+
+def export_entrants(cursor, publisher):
     """Export all entrants to JSON"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    cursor.execute("""
+    select = """
         SELECT id, name, batch_year, position, department, ministry, 
                state, profile_summary, educational_background, 
                previous_experience, date_of_appointment, current_status, 
                verified_source
         FROM lateral_entrants
-        ORDER BY batch_year DESC, name ASC
-    """)
+    """
+    cursor.execute(f"{select} ORDER BY batch_year DESC, name ASC")
 
     entrants = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    publisher.publish("entrants.json", entrants)
+    print(f"✓ Exported {len(entrants)} entrants to entrants.json")
 
-    output_file = OUTPUT_DIR / "entrants.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(entrants, f, indent=2, ensure_ascii=False)
-
-    print(f"✓ Exported {len(entrants)} entrants to {output_file}")
-    return len(entrants)
+    # Listing shards: page n holds rows (n - 1) * PAGE_SIZE .. n * PAGE_SIZE of
+    # the API listing, so a static page and an API page at one offset agree
+    cursor.execute(f"{select} ORDER BY {LISTING_ORDER}")
+    entrants = [dict(row) for row in cursor.fetchall()]
+    total = len(entrants)
+    pages = max(1, -(-total // PAGE_SIZE))
+    for page in range(1, pages + 1):
+        offset = (page - 1) * PAGE_SIZE
+        publisher.publish(
+            f"pages/{page}.json",
+            {
+                "entrants": entrants[offset : offset + PAGE_SIZE],
+                "total": total,
+                "limit": PAGE_SIZE,
+                "offset": offset,
+                "has_more": offset + PAGE_SIZE < total,
+            },
+        )
+    print(f"✓ Exported {pages} listing pages of {PAGE_SIZE} to pages/")
+    return total
+
+
+def export_profiles(cursor, publisher):
+    """Export one file per entrant with its child tables (as /api/entrants/<id>)"""
+    cursor.execute("SELECT * FROM lateral_entrants ORDER BY id")
+    profiles = {row["id"]: dict(row) for row in cursor.fetchall()}
+    for profile in profiles.values():
+        for key, _, _ in PROFILE_CHILDREN:
+            profile[key] = []
+
+    # One query per child table rather than one per entrant
+    for key, table, order in PROFILE_CHILDREN:
+        cursor.execute(f"SELECT * FROM {table} ORDER BY entrant_id, {order}")
+        for row in cursor.fetchall():
+            if row["entrant_id"] in profiles:
+                profiles[row["entrant_id"]][key].append(dict(row))
+
+    # Thousands of small files: published under their plain names only, so
+    # index.json stays small; clients revalidate them instead
+    for entrant_id, profile in profiles.items():
+        publisher.publish(f"entrants/{entrant_id}.json", profile, hashed=False)
+    print(f"✓ Exported {len(profiles)} profiles to entrants/")
+    return len(profiles)
+
+
+def export_search_index(cursor, publisher):
+    """
+    Export an inverted index over SEARCH_FIELDS for static search.
+
+    Documents are numbered in listing order. Each term's postings are
+    integers (document << FIELD_BITS | fields the term occurs in), sorted
+    and delta-encoded so they stay small as JSON. Terms are sharded by their
+    first SEARCH_PREFIX_LENGTH characters into search/terms/<prefix>.json,
+    so a query word loads one shard (a shorter word, the shards it
+    prefixes). Card fields of the ranked documents come from
+    search/docs/<n>.json chunks of SEARCH_DOC_CHUNK documents.
+    search/meta.json lists the shards with their content versions.
+    """
+    cursor.execute(f"""
+        SELECT {", ".join(dict.fromkeys(SEARCH_DOC_FIELDS + SEARCH_FIELDS))}
+        FROM lateral_entrants
+        ORDER BY batch_year DESC, name ASC, id ASC
+    """)
+    rows = cursor.fetchall()
+    # Documents arrive in increasing order, so each posting list stays
+    # sorted and a term seen twice in one document only updates its last item
+    postings = {}
+    for doc, row in enumerate(rows):
+        for bit, field in enumerate(SEARCH_FIELDS):
+            for token in search_tokens(row[field] or ""):
+                items = postings.get(token)
+                if items is None:
+                    items = postings[token] = array("q")
+                if items and items[-1] >> FIELD_BITS == doc:
+                    items[-1] |= 1 << bit
+                else:
+                    items.append(doc << FIELD_BITS | 1 << bit)
+
+    shards = {}
+    for token in sorted(postings):
+        items = postings[token]
+        deltas = [items[0]] + [b - a for a, b in zip(items, items[1:])]
+        shards.setdefault(token[:SEARCH_PREFIX_LENGTH], {})[token] = deltas
+
+    for prefix, terms in shards.items():
+        publisher.publish(
+            f"search/terms/{prefix}.json", {"terms": terms}, hashed=False, compact=True
+        )
+    chunks = range(-(-len(rows) // SEARCH_DOC_CHUNK))
+    for n in chunks:
+        chunk = rows[n * SEARCH_DOC_CHUNK : (n + 1) * SEARCH_DOC_CHUNK]
+        publisher.publish(
+            f"search/docs/{n}.json",
+            [[row[field] for field in SEARCH_DOC_FIELDS] for row in chunk],
+            hashed=False,
+            compact=True,
+        )
+
+    # meta.json carries every shard's content version, known once they render
+    def meta():
+        return {
+            "documents": len(rows),
+            "fields": SEARCH_FIELDS,
+            "weights": SEARCH_WEIGHTS,
+            "field_bits": FIELD_BITS,
+            "prefix_length": SEARCH_PREFIX_LENGTH,
+            "doc_chunk": SEARCH_DOC_CHUNK,
+            "doc_fields": SEARCH_DOC_FIELDS,
+            "terms": {
+                prefix: publisher.version(f"search/terms/{prefix}.json")
+                for prefix in shards
+            },
+            "docs": [publisher.version(f"search/docs/{n}.json") for n in chunks],
+        }
+
+    publisher.defer("search/meta.json", meta, compact=True)
+    print(
+        f"✓ Exported search index: {len(postings)} terms in {len(shards)} shards,"
+        f" {len(rows)} documents"
+    )
+    return len(postings)
+
+
+def stats_tables(cursor):
+    """
+    FROM-clause source for each summary table: the table itself, or an
+    equivalent GROUP BY over lateral_entrants on a database that has not
+    been migrated yet (as stats_tables in api/server.py)
+    """
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] >= MIGRATED_VERSION:
+        return {table: table for table in STATS_TABLES}
+    return {
+        table: (
+            f"(SELECT {', '.join(keys)}, COUNT(*) as count"
+            f" FROM lateral_entrants GROUP BY {', '.join(keys)})"
+        )
+        for table, keys in STATS_TABLES.items()
+    }
 
 
-def export_stats():
-    """Export statistics to JSON"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
+def export_stats(cursor, publisher):
+    """Export statistics to JSON (from the stats_by_* summary tables)"""
     stats = {}
+    tables = stats_tables(cursor)
 
     # Total appointees
-    cursor.execute("SELECT COUNT(*) as total FROM lateral_entrants")
+    cursor.execute(
+        f"SELECT COALESCE(SUM(count), 0) as total FROM {tables['stats_by_batch']}"
+    )
     stats["total_appointees"] = cursor.fetchone()["total"]
 
     # By batch
-    cursor.execute("""
-        SELECT batch_year, COUNT(*) as count 
-        FROM lateral_entrants 
-        GROUP BY batch_year 
+    cursor.execute(f"""
+        SELECT batch_year, count
+        FROM {tables['stats_by_batch']}
         ORDER BY batch_year
     """)
     stats["by_batch"] = [dict(row) for row in cursor.fetchall()]
 
     # By ministry
-    cursor.execute("""
-        SELECT ministry, COUNT(*) as count 
-        FROM lateral_entrants 
+    cursor.execute(f"""
+        SELECT ministry, count
+        FROM {tables['stats_by_ministry']}
         WHERE ministry IS NOT NULL AND ministry != ''
-        GROUP BY ministry 
-        ORDER BY count DESC
+        ORDER BY count DESC, ministry
     """)
     stats["by_ministry"] = [dict(row) for row in cursor.fetchall()]
 
     # By position
-    cursor.execute("""
-        SELECT position, COUNT(*) as count 
-        FROM lateral_entrants 
-        GROUP BY position 
-        ORDER BY count DESC
+    cursor.execute(f"""
+        SELECT position, count
+        FROM {tables['stats_by_position']}
+        ORDER BY count DESC, position
     """)
     stats["by_position"] = [dict(row) for row in cursor.fetchall()]
 
     # By department
-    cursor.execute("""
-        SELECT department, COUNT(*) as count 
-        FROM lateral_entrants 
+    cursor.execute(f"""
+        SELECT department, count
+        FROM {tables['stats_by_department']}
         WHERE department IS NOT NULL AND department != ''
-        GROUP BY department 
-        ORDER BY count DESC
+        ORDER BY count DESC, department
     """)
     stats["by_department"] = [dict(row) for row in cursor.fetchall()]
 
-    conn.close()
-
-    output_file = OUTPUT_DIR / "stats.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(stats, f, indent=2, ensure_ascii=False)
-
-    print(f"✓ Exported statistics to {output_file}")
+    publisher.publish("stats.json", stats)
+    print("✓ Exported statistics to stats.json")
     print(f"  - Total appointees: {stats['total_appointees']}")
     print(f"  - Batches: {len(stats['by_batch'])}")
     print(f"  - Ministries: {len(stats['by_ministry'])}")
@@ -103,16 +631,12 @@ def export_stats():
     return stats
 
 
-def export_batches():
+def export_batches(cursor, publisher):
     """Export batch information to JSON"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT batch_year, COUNT(*) as count 
-        FROM lateral_entrants 
-        GROUP BY batch_year 
+    tables = stats_tables(cursor)
+    cursor.execute(f"""
+        SELECT batch_year, count
+        FROM {tables['stats_by_batch']}
         ORDER BY batch_year
     """)
 
@@ -142,15 +666,62 @@ def export_batches():
         if year in batch_metadata:
             batch.update(batch_metadata[year])
 
-    conn.close()
-
-    output_file = OUTPUT_DIR / "batches.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(batches, f, indent=2, ensure_ascii=False)
-
-    print(f"✓ Exported batch information to {output_file}")
+    # Per-batch detail files with the statistics of /api/batches/<year>
+    for batch in batches:
+        year = batch["batch_year"]
+        cursor.execute(
+            """
+            SELECT * FROM lateral_entrants
+            WHERE batch_year = ?
+            ORDER BY position, name
+        """,
+            (year,),
+        )
+        entrants = [dict(row) for row in cursor.fetchall()]
+
+        cursor.execute(
+            f"""
+            SELECT
+                b.count as total,
+                (SELECT COUNT(*) FROM {tables['stats_by_batch_position']}
+                 WHERE batch_year = b.batch_year AND position IS NOT NULL)
+                    as positions,
+                (SELECT COUNT(*) FROM {tables['stats_by_batch_ministry']}
+                 WHERE batch_year = b.batch_year AND ministry IS NOT NULL)
+                    as ministries
+            FROM {tables['stats_by_batch']} b
+            WHERE b.batch_year = ?
+        """,
+            (year,),
+        )
+        statistics = dict(cursor.fetchone())
+
+        cursor.execute(
+            f"""
+            SELECT position, count
+            FROM {tables['stats_by_batch_position']}
+            WHERE batch_year = ?
+            ORDER BY count DESC, position
+        """,
+            (year,),
+        )
+        by_position = [dict(row) for row in cursor.fetchall()]
+
+        publisher.publish(
+            f"batches/{year}.json",
+            {
+                "batch_year": year,
+                "statistics": statistics,
+                "by_position": by_position,
+                "entrants": entrants,
+            },
+        )
+
+    publisher.publish("batches.json", batches)
+    print("✓ Exported batch information to batches.json")
     for batch in batches:
         print(f"  - {batch['batch_year']}: {batch['count']} appointees")
+    print(f"✓ Exported {len(batches)} batch detail files to batches/")
 
     return batches
 
@@ -163,25 +734,77 @@ def main():
 
     # Create output directory if it doesn't exist
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    publisher = Publisher(OUTPUT_DIR)
 
-    # Export all data
-    total = export_entrants()
-    print()
-    stats = export_stats()
-    print()
-    batches = export_batches()
+    # Every stage reads inside one transaction, so all files come from the
+    # same snapshot even while a populate script writes to the database.
+    # The stages only query and queue files; serialization happens in the
+    # publisher's worker processes, so the snapshot is held briefly.
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN")
+        started = time.perf_counter()
+        try:
+            total = export_entrants(cursor, publisher)
+            print()
+            export_profiles(cursor, publisher)
+            print()
+            export_search_index(cursor, publisher)
+            print()
+            stats = export_stats(cursor, publisher)
+            print()
+            batches = export_batches(cursor, publisher)
+            print()
+        finally:
+            cursor.execute("COMMIT")
+            conn.close()
+        print(
+            f"✓ Read everything from one snapshot in"
+            f" {time.perf_counter() - started:.2f} s"
+        )
+        publisher.finish()
+    except BaseException:
+        publisher.abort()
+        raise
+
+    extensions = ", ".join(f".{ext}" for ext in COMPRESSORS)
+    processes = "process" if publisher.workers == 1 else "processes"
+    print(
+        f"✓ Serialized and precompressed {publisher.compressed} files"
+        f" ({extensions}) in {publisher.workers} worker {processes}"
+    )
+    if brotli is None:
+        print("  - brotli not installed (pip install brotli): no .br siblings")
 
     print()
     print("=" * 60)
     print("EXPORT COMPLETE")
     print("=" * 60)
-    print(f"Files created in: {OUTPUT_DIR}")
-    print("- entrants.json")
-    print("- stats.json")
-    print("- batches.json")
+    print(f"Files in: {OUTPUT_DIR}")
+    for name in publisher.written:
+        if "/" not in name:
+            print(f"- {name} (updated)")
+    for name in publisher.unchanged:
+        if "/" not in name:
+            print(f"- {name} (unchanged)")
+    shards = [name for name in publisher.written if "/" in name]
+    print(f"- {len(shards)} shard files updated, {len(publisher.removed)} removed")
+    print(f"- {INDEX_FILE} (current hashed names)")
     print()
     print("Ready for deployment!")
 
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["--compress"]:
+        if len(sys.argv) != 3:
+            sys.exit("Usage: python data/export_static_json.py --compress <dir>")
+        count = precompress_tree(sys.argv[2])
+        print(f"✓ Precompressed {count} files in {sys.argv[2]}")
+        sys.exit(0)
+    if len(sys.argv) > 1:
+        DB_PATH = Path(sys.argv[1])
+    if len(sys.argv) > 2:
+        OUTPUT_DIR = Path(sys.argv[2])
     main()
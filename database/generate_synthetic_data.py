@@ -0,0 +1,642 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic data for the Lateral Entry Portal database
+Fills lateral_entrants and every child table with realistic-looking rows so
+the API and static export can be exercised at 10k, 100k or 1M entrants
+Usage: python database/generate_synthetic_data.py <rows> <output.db> [seed]
+"""
+
+import bisect
+import itertools
+import random
+import sqlite3
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import migrate
+
+SCHEMA_PATH = Path(__file__).parent / "lateral_entry_schema.sql"
+
+# Entrants generated per executemany() round
+CHUNK_SIZE = 5_000
+
+# Batch -> (share of entrants, position weights, appointment window).
+# Shares and positions follow the real 2019/2021/2023 batches.
+BATCHES = {
+    2019: (9, {"Joint Secretary": 9}, ("2019-09-01", "2019-11-30")),
+    2021: (
+        31,
+        {"Joint Secretary": 3, "Director": 19, "Deputy Secretary": 9},
+        ("2021-10-01", "2022-02-28"),
+    ),
+    2023: (
+        25,
+        {"Joint Secretary": 3, "Director": 15, "Deputy Secretary": 7},
+        ("2023-06-01", "2024-03-31"),
+    ),
+}
+
+# (ministry, departments, category), most frequent first; picked with a
+# Zipf-like weight by rank, so Finance dominates and the tail is long
+MINISTRIES = [
+    (
+        "Ministry of Finance",
+        ["Economic Affairs", "Financial Services", "Revenue", "Expenditure"],
+        "Finance & Banking",
+    ),
+    (
+        "Ministry of Education",
+        ["School Education & Literacy", "Higher Education"],
+        "Education",
+    ),
+    (
+        "Ministry of Statistics and Programme Implementation",
+        ["Statistics & Programme Implementation"],
+        "Public Policy",
+    ),
+    (
+        "Ministry of Commerce and Industry",
+        ["Commerce", "Promotion of Industry and Internal Trade"],
+        "Finance & Banking",
+    ),
+    (
+        "Ministry of Agriculture and Farmers Welfare",
+        ["Agriculture & Farmers Welfare", "Agricultural Research and Education"],
+        "Agriculture",
+    ),
+    (
+        "Ministry of Health and Family Welfare",
+        ["Health & Family Welfare", "Health Research"],
+        "Healthcare",
+    ),
+    ("Ministry of Law and Justice", ["Legal Affairs", "Justice"], "Legal Affairs"),
+    ("Ministry of Power", ["Power"], "Energy & Environment"),
+    ("Ministry of Civil Aviation", ["Civil Aviation"], "Infrastructure"),
+    ("Ministry of Heavy Industries", ["Heavy Industries"], "Infrastructure"),
+    (
+        "Ministry of Road Transport and Highways",
+        ["Road Transport & Highways"],
+        "Infrastructure",
+    ),
+    (
+        "Ministry of Electronics and Information Technology",
+        ["Electronics and Information Technology"],
+        "Technology & Innovation",
+    ),
+    (
+        "Ministry of Environment, Forest and Climate Change",
+        ["Environment Forest and Climate Change"],
+        "Energy & Environment",
+    ),
+    (
+        "Ministry of Ports, Shipping and Waterways",
+        ["Ports Shipping and Waterways"],
+        "Infrastructure",
+    ),
+    (
+        "Ministry of Consumer Affairs, Food and Public Distribution",
+        ["Food & Public Distribution", "Consumer Affairs"],
+        "Public Policy",
+    ),
+    ("Ministry of Corporate Affairs", ["Corporate Affairs"], "Legal Affairs"),
+    (
+        "Ministry of Housing and Urban Affairs",
+        ["Housing and Urban Affairs"],
+        "Infrastructure",
+    ),
+    (
+        "Ministry of Jal Shakti",
+        ["Water Resources", "Drinking Water and Sanitation"],
+        "Infrastructure",
+    ),
+    ("Ministry of Mines", ["Mines"], "Energy & Environment"),
+    (
+        "Ministry of New and Renewable Energy",
+        ["New and Renewable Energy"],
+        "Energy & Environment",
+    ),
+    ("Ministry of Rural Development", ["Rural Development"], "Public Policy"),
+    (
+        "Ministry of Skill Development and Entrepreneurship",
+        ["Skill Development & Entrepreneurship"],
+        "Human Resources",
+    ),
+    ("Ministry of Steel", ["Steel"], "Infrastructure"),
+    (
+        "Ministry of Chemicals and Fertilizers",
+        ["Chemicals and Petrochemicals", "Pharmaceuticals"],
+        "Healthcare",
+    ),
+    (
+        "Ministry of Petroleum and Natural Gas",
+        ["Petroleum and Natural Gas"],
+        "Energy & Environment",
+    ),
+    (
+        "Ministry of Home Affairs",
+        ["Home Affairs", "Border Management"],
+        "Public Policy",
+    ),
+    (
+        "Ministry of Personnel, Public Grievances and Pensions",
+        ["Personnel and Training"],
+        "Human Resources",
+    ),
+    (
+        "Ministry of Telecommunications",
+        ["Telecommunications"],
+        "Technology & Innovation",
+    ),
+    ("Ministry of Textiles", ["Textiles"], "Public Policy"),
+    ("Ministry of Tourism", ["Tourism"], "Public Policy"),
+]
+
+# The real data spells the same department several ways; a share of
+# synthetic rows does too, so filters and groupings see the same mess
+SPELLING_VARIANTS = [(" & ", " and "), (" and ", " & ")]
+VARIANT_RATE = 0.15
+
+STATES = {
+    "Delhi": 30,
+    "Maharashtra": 14,
+    "Karnataka": 10,
+    "Uttar Pradesh": 8,
+    "Tamil Nadu": 7,
+    "West Bengal": 5,
+    "Telangana": 5,
+    "Gujarat": 4,
+    "Haryana": 4,
+    "Kerala": 3,
+    "Rajasthan": 3,
+    "Bihar": 2,
+    "Punjab": 2,
+    "Odisha": 2,
+    "Madhya Pradesh": 1,
+}
+STATE_RATE = 0.6
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Ajay", "Amit", "Ananya", "Anil", "Anjali", "Arjun",
+    "Arun", "Deepa", "Dinesh", "Gaurav", "Harish", "Ishaan", "Kavita", "Kavya",
+    "Kiran", "Lakshmi", "Manish", "Meera", "Mohan", "Neha", "Nikhil", "Pooja",
+    "Pradeep", "Priya", "Rahul", "Rajesh", "Ramesh", "Ravi", "Rohit", "Sanjay",
+    "Saurabh", "Shalini", "Shreya", "Sneha", "Sunil", "Sunita", "Suresh",
+    "Swati", "Tarun", "Uma", "Varun", "Vikram", "Vinod", "Vivek", "Yash",
+]  # fmt: skip
+LAST_NAMES = [
+    "Agarwal", "Banerjee", "Bhat", "Chopra", "Das", "Desai", "Ghosh", "Goel",
+    "Gupta", "Iyer", "Jain", "Joshi", "Kapoor", "Khan", "Kulkarni", "Kumar",
+    "Malhotra", "Menon", "Mishra", "Mukherjee", "Nair", "Pandey", "Patel",
+    "Pillai", "Rao", "Reddy", "Saxena", "Sen", "Sharma", "Singh", "Sinha",
+    "Srinivasan", "Tiwari", "Trivedi", "Varma", "Verma", "Yadav",
+]  # fmt: skip
+
+COMPANIES = [
+    "Tata Consultancy Services", "Infosys", "ICICI Bank", "HDFC Bank",
+    "State Bank of India", "Larsen & Toubro", "Reliance Industries", "Wipro",
+    "KPMG India", "Deloitte India", "EY India", "McKinsey & Company",
+    "World Bank", "Asian Development Bank", "NITI Aayog", "IIT Delhi",
+    "Mahindra & Mahindra", "NTPC", "ONGC", "CRISIL", "NABARD", "SEBI",
+]  # fmt: skip
+SECTORS = [
+    "Banking", "Consulting", "Energy", "Finance", "Healthcare", "Infrastructure",
+    "Information Technology", "Law", "Manufacturing", "Research", "Telecom",
+]  # fmt: skip
+EXPERTISE = [
+    "public finance", "capital markets", "digital infrastructure", "taxation",
+    "renewable energy", "agricultural economics", "public health systems",
+    "education policy", "regulatory reform", "logistics", "data analytics",
+    "corporate law", "urban planning", "trade policy", "supply chains",
+]  # fmt: skip
+DEGREES = [
+    ("PhD", "PhD", 1),
+    ("Master's", "MBA", 4),
+    ("Master's", "M.Tech", 2),
+    ("Master's", "MA Economics", 2),
+    ("Master's", "LLM", 1),
+    ("Bachelor's", "B.Tech", 4),
+    ("Bachelor's", "B.Com", 2),
+    ("Bachelor's", "LLB", 1),
+    ("Bachelor's", "MBBS", 1),
+]
+INSTITUTIONS = [
+    "IIT Delhi", "IIT Bombay", "IIT Madras", "IIT Kanpur", "IIM Ahmedabad",
+    "IIM Bangalore", "IIM Calcutta", "Delhi University", "JNU",
+    "National Law School of India University", "AIIMS Delhi",
+    "London School of Economics", "Harvard University", "University of Oxford",
+]  # fmt: skip
+MEDIA_SOURCES = [
+    "Times of India", "The Hindu", "Economic Times", "Hindustan Times",
+    "Indian Express", "Business Standard", "Mint", "PIB",
+]  # fmt: skip
+NEWS_TYPES = {"Appointment": 5, "Interview": 2, "Achievement": 2, "Opinion": 1}
+ACHIEVEMENT_TYPES = ["Policy", "Innovation", "Reform", "Implementation"]
+PLATFORMS = {"LinkedIn": 6, "Twitter": 3, "Medium": 1}
+STATUSES = {
+    "Active": 5,
+    "Active - Extended Term": 3,
+    "Completed Term": 2,
+    "Did not join": 1,
+}
+
+# Child rows per entrant: weights for 0, 1, 2, ... rows.
+# Media coverage is long-tailed: most entrants get none, a few get many.
+CHILD_COUNTS = {
+    "professional_details": (1, 4, 3, 2),
+    "education_details": (0, 3, 5, 2),
+    "media_coverage": (10, 5, 2, 1, 1, 0.5, 0.5, 0.25, 0.25),
+    "social_media_profiles": (4, 4, 2),
+    "achievements": (4, 3, 2, 1, 0.5),
+    "contact_info": (1, 4),
+    "entrant_categories": (1, 6, 2),
+}
+
+SENTENCES = [
+    "{name} joined the {department} department as {position} in {year}.",
+    "Before the appointment, {first} spent {years} years in {sector}, most "
+    "recently with {company}.",
+    "Their work focuses on {expertise} and {expertise2}.",
+    "At the {ministry_short} ministry they lead work on {expertise}.",
+    "{first} has advised state governments and multilateral agencies on "
+    "{expertise2}.",
+    "They hold degrees from {institution} and have published on {expertise}.",
+]
+
+ENTRANT_COLUMNS = [
+    "id",
+    "name",
+    "batch_year",
+    "position",
+    "department",
+    "ministry",
+    "state",
+    "photo_url",
+    "profile_summary",
+    "educational_background",
+    "previous_experience",
+    "date_of_appointment",
+    "retirement_date",
+    "created_at",
+    "updated_at",
+]
+# Added to older databases by the update_* scripts; filled in when present
+OPTIONAL_COLUMNS = [
+    "appointment_type",
+    "extension_date",
+    "current_status",
+    "verified_source",
+]
+
+CHILD_INSERTS = {
+    "professional_details": """INSERT INTO professional_details (entrant_id,
+        previous_company, previous_position, industry_sector, years_experience,
+        domain_expertise, achievements) VALUES (?, ?, ?, ?, ?, ?, ?)""",
+    "education_details": """INSERT INTO education_details (entrant_id,
+        degree_type, degree_name, institution, specialization,
+        year_of_completion, university_rank) VALUES (?, ?, ?, ?, ?, ?, ?)""",
+    "media_coverage": """INSERT INTO media_coverage (entrant_id, source_name,
+        article_title, article_url, publication_date, news_type,
+        content_summary) VALUES (?, ?, ?, ?, ?, ?, ?)""",
+    "social_media_profiles": """INSERT INTO social_media_profiles (entrant_id,
+        platform, profile_url, follower_count, verified) VALUES (?, ?, ?, ?, ?)""",
+    "achievements": """INSERT INTO achievements (entrant_id, achievement_type,
+        achievement_title, achievement_description, impact_measure,
+        recognition_received) VALUES (?, ?, ?, ?, ?, ?)""",
+    "contact_info": """INSERT INTO contact_info (entrant_id, email, phone,
+        official_address, personal_address) VALUES (?, ?, ?, ?, ?)""",
+    "entrant_categories": """INSERT INTO entrant_categories (entrant_id,
+        category_id) VALUES (?, ?)""",
+}
+
+
+class WeightedChoice:
+    """Pick from values with fixed weights (cumulative weights + bisect)"""
+
+    def __init__(self, weights):
+        if isinstance(weights, dict):
+            weights = list(weights.items())
+        self.values = [value for value, _ in weights]
+        self.cumulative = list(itertools.accumulate(weight for _, weight in weights))
+
+    def __call__(self, rng):
+        point = rng.random() * self.cumulative[-1]
+        return self.values[bisect.bisect_right(self.cumulative, point)]
+
+
+def zipf_weights(values, exponent=1.1):
+    return [(value, 1 / (rank**exponent)) for rank, value in enumerate(values, 1)]
+
+
+def add_days(day, days):
+    return (date.fromisoformat(day) + timedelta(days=days)).isoformat()
+
+
+class SyntheticEntrants:
+    """
+    Deterministic stream of entrants and their child rows.
+
+    Every value comes from one random.Random(seed), so the same seed,
+    starting id and row count always produce the same database.
+    """
+
+    def __init__(self, seed=42, category_ids=None, optional_columns=(), taken=()):
+        self.rng = random.Random(seed)
+        # (name, batch_year) -> times used; some databases enforce uniqueness
+        self.name_counts = dict.fromkeys(taken, 1)
+        self.category_ids = category_ids or {}
+        self.all_categories = sorted(self.category_ids.values())
+        self.optional_columns = [c for c in OPTIONAL_COLUMNS if c in optional_columns]
+        self.batch = WeightedChoice({year: spec[0] for year, spec in BATCHES.items()})
+        self.positions = {
+            year: WeightedChoice(spec[1]) for year, spec in BATCHES.items()
+        }
+        self.ministry = WeightedChoice(zipf_weights(MINISTRIES))
+        self.state = WeightedChoice(STATES)
+        self.degree = WeightedChoice([(d[:2], d[2]) for d in DEGREES])
+        self.news_type = WeightedChoice(NEWS_TYPES)
+        self.platform = WeightedChoice(PLATFORMS)
+        self.status = WeightedChoice(STATUSES)
+        self.child_counts = {
+            table: WeightedChoice(list(enumerate(weights)))
+            for table, weights in CHILD_COUNTS.items()
+        }
+        self.columns = ENTRANT_COLUMNS + self.optional_columns
+
+    def words(self, pool, low, high):
+        return ", ".join(self.rng.sample(pool, self.rng.randint(low, high)))
+
+    def appointment(self, year):
+        start, end = BATCHES[year][2]
+        span = (date.fromisoformat(end) - date.fromisoformat(start)).days
+        return add_days(start, self.rng.randint(0, span))
+
+    def summary(self, context):
+        # Mostly 2-3 sentences, occasionally a long profile
+        count = min(
+            int(self.rng.lognormvariate(0.9, 0.5)) + 1,
+            len(SENTENCES),
+        )
+        sentences = self.rng.sample(SENTENCES, count)
+        return " ".join(sentence.format(**context) for sentence in sentences)
+
+    def entrant(self, entrant_id):
+        """One lateral_entrants row (a tuple in self.columns order) and its children"""
+        rng = self.rng
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        if rng.random() < 0.3:
+            name = f"{first} {rng.choice('ABCDEGHJKLMNPRSV')}. {last}"
+        else:
+            name = f"{first} {last}"
+        year = self.batch(rng)
+        used = self.name_counts.get((name, year), 0)
+        self.name_counts[(name, year)] = used + 1
+        if used:
+            name = f"{name} {used + 1}"
+        position = self.positions[year](rng)
+        ministry, departments, category = self.ministry(rng)
+        department = rng.choice(departments)
+        if rng.random() < VARIANT_RATE:
+            old, new = rng.choice(SPELLING_VARIANTS)
+            department = department.replace(old, new)
+        state = self.state(rng) if rng.random() < STATE_RATE else None
+        appointed = self.appointment(year) if rng.random() < 0.9 else None
+        years = rng.randint(8, 30)
+        context = {
+            "name": name,
+            "first": first,
+            "position": position,
+            "department": department,
+            "ministry_short": ministry.replace("Ministry of ", ""),
+            "year": year,
+            "years": years,
+            "sector": rng.choice(SECTORS).lower(),
+            "company": rng.choice(COMPANIES),
+            "expertise": rng.choice(EXPERTISE),
+            "expertise2": rng.choice(EXPERTISE),
+            "institution": rng.choice(INSTITUTIONS),
+        }
+        created = f"{appointed or f'{year}-01-01'} 09:00:00"
+        row = [
+            entrant_id,
+            name,
+            year,
+            position,
+            department,
+            ministry,
+            state,
+            None,
+            self.summary(context),
+            f"{self.degree(rng)[1]}, {context['institution']}",
+            f"{years} years in {context['sector']}; {self.words(COMPANIES, 1, 3)}",
+            appointed,
+            add_days(appointed, 3 * 365) if appointed else None,
+            created,
+            created,
+        ]
+        if self.optional_columns:
+            status = self.status(rng) if appointed else "Did not join"
+            extra = {
+                "appointment_type": rng.choice(["contract", "deputation"]),
+                "extension_date": (
+                    add_days(appointed, 3 * 365 + rng.randint(0, 60))
+                    if status == "Active - Extended Term"
+                    else None
+                ),
+                "current_status": status,
+                "verified_source": f"DoPT notification {year}/{entrant_id % 97 + 1}",
+            }
+            row.extend(extra[column] for column in self.optional_columns)
+        return tuple(row), self.children(entrant_id, context, appointed, category)
+
+    def children(self, entrant_id, context, appointed, category):
+        """{table: [rows]} for one entrant"""
+        rng = self.rng
+        count = {table: choice(rng) for table, choice in self.child_counts.items()}
+        slug = context["name"].lower().replace(".", "").replace(" ", "-")
+        since = appointed or f"{context['year']}-06-01"
+        rows = {}
+        rows["professional_details"] = [
+            (
+                entrant_id,
+                rng.choice(COMPANIES),
+                rng.choice(["Director", "Vice President", "Partner", "Head", "Lead"]),
+                rng.choice(SECTORS),
+                rng.randint(2, 15),
+                self.words(EXPERTISE, 1, 3),
+                self.words(EXPERTISE, 0, 2) or None,
+            )
+            for _ in range(count["professional_details"])
+        ]
+        rows["education_details"] = []
+        for n in range(count["education_details"]):
+            degree_type, degree_name = self.degree(rng)
+            rows["education_details"].append(
+                (
+                    entrant_id,
+                    degree_type,
+                    degree_name,
+                    rng.choice(INSTITUTIONS),
+                    rng.choice(EXPERTISE),
+                    context["year"] - context["years"] - 2 * n,
+                    rng.randint(1, 50) if rng.random() < 0.2 else None,
+                )
+            )
+        rows["media_coverage"] = []
+        for n in range(count["media_coverage"]):
+            source = rng.choice(MEDIA_SOURCES)
+            rows["media_coverage"].append(
+                (
+                    entrant_id,
+                    source,
+                    f"{context['name']} on {rng.choice(EXPERTISE)}",
+                    f"https://news.example.org/{slug}-{entrant_id}-{n}",
+                    add_days(since, rng.randint(0, 900)),
+                    self.news_type(rng),
+                    " ".join(
+                        rng.choice(SENTENCES).format(**context)
+                        for _ in range(rng.randint(1, 4))
+                    ),
+                )
+            )
+        rows["social_media_profiles"] = [
+            (
+                entrant_id,
+                platform,
+                f"https://{platform.lower()}.com/{slug}-{entrant_id}",
+                int(rng.paretovariate(1.2) * 200),
+                rng.random() < 0.1,
+            )
+            for platform in rng.sample(list(PLATFORMS), count["social_media_profiles"])
+        ]
+        rows["achievements"] = [
+            (
+                entrant_id,
+                rng.choice(ACHIEVEMENT_TYPES),
+                f"{rng.choice(ACHIEVEMENT_TYPES)} in {rng.choice(EXPERTISE)}",
+                self.summary(context),
+                f"{rng.randint(2, 60)}% improvement" if rng.random() < 0.5 else None,
+                None,
+            )
+            for _ in range(count["achievements"])
+        ]
+        rows["contact_info"] = [
+            (
+                entrant_id,
+                f"{slug}.{entrant_id}@gov.example.in",
+                None,
+                f"{context['department']}, New Delhi",
+                None,
+            )
+            for _ in range(count["contact_info"])
+        ]
+        category_ids = [self.category_ids.get(category)] + rng.sample(
+            self.all_categories, min(2, len(self.all_categories))
+        )
+        rows["entrant_categories"] = [
+            (entrant_id, category_id)
+            for category_id in dict.fromkeys(
+                category_ids[: count["entrant_categories"]]
+            )
+            if category_id is not None
+        ]
+        return rows
+
+
+def drop_entrant_triggers(conn):
+    """
+    Drop the triggers on lateral_entrants and its child tables so bulk
+    inserts skip the per-row FTS, stats_by_* and change_log upkeep;
+    migrate.migrate() recreates them from the schema and rebuilds the
+    derived tables in one pass afterwards. Generated rows are the baseline,
+    so they are not recorded as changes.
+    """
+    tables = ["lateral_entrants", *CHILD_INSERTS]
+    triggers = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+        f" AND tbl_name IN ({', '.join('?' * len(tables))})",
+        tables,
+    ).fetchall()
+    for (name,) in triggers:
+        conn.execute(f"DROP TRIGGER {name}")
+
+
+def populate(conn, rows, seed=42):
+    """
+    Append `rows` synthetic entrants (ids after the current maximum) and
+    their child rows with bulk executemany() inserts. Returns the new ids.
+    """
+    entrant_columns = {
+        row[1] for row in conn.execute("PRAGMA table_info(lateral_entrants)")
+    }
+    category_ids = dict(conn.execute("SELECT category_name, id FROM categories"))
+    taken = conn.execute("SELECT name, batch_year FROM lateral_entrants").fetchall()
+    generator = SyntheticEntrants(seed, category_ids, entrant_columns, taken)
+    first_id = conn.execute(
+        "SELECT COALESCE(MAX(id), 0) + 1 FROM lateral_entrants"
+    ).fetchone()[0]
+    entrant_sql = "INSERT INTO lateral_entrants ({}) VALUES ({})".format(
+        ", ".join(generator.columns), ", ".join("?" * len(generator.columns))
+    )
+
+    ids = range(first_id, first_id + rows)
+    for start in range(0, rows, CHUNK_SIZE):
+        entrants = []
+        children = {table: [] for table in CHILD_INSERTS}
+        for entrant_id in ids[start : start + CHUNK_SIZE]:
+            row, child_rows = generator.entrant(entrant_id)
+            entrants.append(row)
+            for table, table_rows in child_rows.items():
+                children[table].extend(table_rows)
+        conn.executemany(entrant_sql, entrants)
+        for table, sql in CHILD_INSERTS.items():
+            conn.executemany(sql, children[table])
+    return list(ids)
+
+
+def build_database(db_path, rows, seed=42):
+    """
+    Bring db_path up to `rows` entrants: a new file gets the schema first,
+    an existing one keeps its rows and is padded with synthetic ones.
+    Ends with migrate.migrate() so the search index and stats tables match.
+    """
+    db_path = Path(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA synchronous = OFF")
+        has_schema = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'lateral_entrants'"
+        ).fetchone()
+        if not has_schema:
+            conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+        existing = conn.execute("SELECT COUNT(*) FROM lateral_entrants").fetchone()[0]
+        drop_entrant_triggers(conn)
+        ids = populate(conn, max(rows - existing, 0), seed)
+        conn.commit()
+    finally:
+        conn.close()
+    print(f"✓ Generated {len(ids)} synthetic entrants (seed {seed})")
+    migrate.migrate(db_path)
+    return ids
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+    rows = int(sys.argv[1])
+    db_path = Path(sys.argv[2])
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 42
+    if db_path.resolve() == migrate.DB_PATH.resolve():
+        print("✗ Refusing to write synthetic rows into the real database")
+        sys.exit(1)
+
+    print("=" * 70)
+    print(f"GENERATING SYNTHETIC DATA ({rows} entrants)")
+    print(f"Database: {db_path}")
+    print("=" * 70)
+    build_database(db_path, rows, seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,9 @@ CREATE TABLE IF NOT EXISTS lateral_entrants (
     date_of_appointment DATE,
     retirement_date DATE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ministry_id INTEGER REFERENCES ministries(id), -- canonical ministry (see ministries)
+    department_id INTEGER REFERENCES departments(id) -- canonical department
 );
 
 -- Detailed professional information
@@ -105,9 +107,31 @@ CREATE TABLE IF NOT EXISTS departments (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     department_name VARCHAR(255) NOT NULL UNIQUE,
     ministry VARCHAR(255),
+    description TEXT,
+    ministry_id INTEGER REFERENCES ministries(id)
+);
+
+-- Canonical ministries
+CREATE TABLE IF NOT EXISTS ministries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ministry_name VARCHAR(255) NOT NULL UNIQUE,
     description TEXT
 );
 
+-- Every spelling of a ministry or department seen in lateral_entrants (and
+-- each canonical name itself), mapped to its canonical row. database/migrate.py
+-- groups spellings that differ only in case, punctuation, '&' vs 'and' or a
+-- 'Ministry of' / 'Department of' prefix.
+CREATE TABLE IF NOT EXISTS ministry_aliases (
+    alias VARCHAR(255) PRIMARY KEY COLLATE NOCASE,
+    ministry_id INTEGER NOT NULL REFERENCES ministries(id)
+);
+
+CREATE TABLE IF NOT EXISTS department_aliases (
+    alias VARCHAR(255) PRIMARY KEY COLLATE NOCASE,
+    department_id INTEGER NOT NULL REFERENCES departments(id)
+);
+
 -- Linking entrants to categories
 CREATE TABLE IF NOT EXISTS entrant_categories (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -148,9 +172,334 @@ CREATE INDEX IF NOT EXISTS idx_batch_year ON lateral_entrants(batch_year);
 CREATE INDEX IF NOT EXISTS idx_department ON lateral_entrants(department);
 CREATE INDEX IF NOT EXISTS idx_ministry ON lateral_entrants(ministry);
 CREATE INDEX IF NOT EXISTS idx_name ON lateral_entrants(name);
+CREATE INDEX IF NOT EXISTS idx_ministry_aliases_ministry ON ministry_aliases(ministry_id);
+CREATE INDEX IF NOT EXISTS idx_department_aliases_department ON department_aliases(department_id);
 CREATE INDEX IF NOT EXISTS idx_professional_entrant ON professional_details(entrant_id);
 CREATE INDEX IF NOT EXISTS idx_education_entrant ON education_details(entrant_id);
 CREATE INDEX IF NOT EXISTS idx_media_entrant ON media_coverage(entrant_id);
 CREATE INDEX IF NOT EXISTS idx_social_entrant ON social_media_profiles(entrant_id);
 CREATE INDEX IF NOT EXISTS idx_achievements_entrant ON achievements(entrant_id);
-CREATE INDEX IF NOT EXISTS idx_contact_entrant ON contact_info(entrant_id);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_contact_entrant ON contact_info(entrant_id);
+
+-- Full-text search index over entrant name, ministry, department and position
+-- External-content FTS5 table: rows live in lateral_entrants, triggers keep it in sync
+CREATE VIRTUAL TABLE IF NOT EXISTS lateral_entrants_fts USING fts5(
+    name,
+    ministry,
+    department,
+    position,
+    content='lateral_entrants',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_fts_insert AFTER INSERT ON lateral_entrants BEGIN
+    INSERT INTO lateral_entrants_fts (rowid, name, ministry, department, position)
+    VALUES (new.id, new.name, new.ministry, new.department, new.position);
+END;
+
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_fts_delete AFTER DELETE ON lateral_entrants BEGIN
+    INSERT INTO lateral_entrants_fts (lateral_entrants_fts, rowid, name, ministry, department, position)
+    VALUES ('delete', old.id, old.name, old.ministry, old.department, old.position);
+END;
+
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_fts_update
+AFTER UPDATE OF name, ministry, department, position ON lateral_entrants BEGIN
+    INSERT INTO lateral_entrants_fts (lateral_entrants_fts, rowid, name, ministry, department, position)
+    VALUES ('delete', old.id, old.name, old.ministry, old.department, old.position);
+    INSERT INTO lateral_entrants_fts (rowid, name, ministry, department, position)
+    VALUES (new.id, new.name, new.ministry, new.department, new.position);
+END;
+
+-- Listing order of /api/entrants (batch_year DESC, date DESC, id DESC) for keyset pagination
+-- id is the rowid, which SQLite appends to every index entry
+CREATE INDEX IF NOT EXISTS idx_entrants_listing
+ON lateral_entrants(batch_year, COALESCE(date_of_appointment, ''));
+
+-- Indexes on ministry_id / department_id are created by database/migrate.py
+-- (ADDED_INDEXES): an older database lacks those columns until it migrates,
+-- and this script has to run on it unchanged
+
+-- Export order of /api/export, so streaming starts without a full sort
+CREATE INDEX IF NOT EXISTS idx_export_order ON lateral_entrants(batch_year, name);
+
+-- Summary tables behind /api/stats, /api/batches, /api/ministries and /api/positions
+-- One row per distinct value (or pair) with its entrant count, kept current by the
+-- triggers below; rows whose count drops to zero are removed. Keys may be NULL, so
+-- the triggers match rows with IS instead of relying on UNIQUE conflicts.
+
+-- Entrants per batch
+CREATE TABLE IF NOT EXISTS stats_by_batch (
+    batch_year INTEGER,
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_by_batch ON stats_by_batch(batch_year);
+
+-- Entrants per ministry
+CREATE TABLE IF NOT EXISTS stats_by_ministry (
+    ministry VARCHAR(255),
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_by_ministry ON stats_by_ministry(ministry);
+
+-- Entrants per position
+CREATE TABLE IF NOT EXISTS stats_by_position (
+    position VARCHAR(255),
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_by_position ON stats_by_position(position);
+
+-- Entrants per department
+CREATE TABLE IF NOT EXISTS stats_by_department (
+    department VARCHAR(255),
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_by_department ON stats_by_department(department);
+
+-- Entrants per state
+CREATE TABLE IF NOT EXISTS stats_by_state (
+    state VARCHAR(100),
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_by_state ON stats_by_state(state);
+
+-- Entrants per (batch, position): distinct positions per batch, batches per position
+CREATE TABLE IF NOT EXISTS stats_by_batch_position (
+    batch_year INTEGER,
+    position VARCHAR(255),
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_by_batch_position ON stats_by_batch_position(batch_year, position);
+
+-- Entrants per (batch, ministry): distinct ministries per batch
+CREATE TABLE IF NOT EXISTS stats_by_batch_ministry (
+    batch_year INTEGER,
+    ministry VARCHAR(255),
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_by_batch_ministry ON stats_by_batch_ministry(batch_year, ministry);
+
+-- Entrants per (ministry, position): distinct positions per ministry
+CREATE TABLE IF NOT EXISTS stats_by_ministry_position (
+    ministry VARCHAR(255),
+    position VARCHAR(255),
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_by_ministry_position ON stats_by_ministry_position(ministry, position);
+
+-- Batches of each position for /api/positions
+CREATE INDEX IF NOT EXISTS idx_stats_by_position_batch ON stats_by_batch_position(position, batch_year);
+
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_stats_insert AFTER INSERT ON lateral_entrants BEGIN
+    INSERT INTO stats_by_batch (batch_year, count)
+    SELECT new.batch_year, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_batch WHERE batch_year IS new.batch_year);
+    UPDATE stats_by_batch SET count = count + 1 WHERE batch_year IS new.batch_year;
+    INSERT INTO stats_by_ministry (ministry, count)
+    SELECT new.ministry, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_ministry WHERE ministry IS new.ministry);
+    UPDATE stats_by_ministry SET count = count + 1 WHERE ministry IS new.ministry;
+    INSERT INTO stats_by_position (position, count)
+    SELECT new.position, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_position WHERE position IS new.position);
+    UPDATE stats_by_position SET count = count + 1 WHERE position IS new.position;
+    INSERT INTO stats_by_department (department, count)
+    SELECT new.department, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_department WHERE department IS new.department);
+    UPDATE stats_by_department SET count = count + 1 WHERE department IS new.department;
+    INSERT INTO stats_by_state (state, count)
+    SELECT new.state, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_state WHERE state IS new.state);
+    UPDATE stats_by_state SET count = count + 1 WHERE state IS new.state;
+    INSERT INTO stats_by_batch_position (batch_year, position, count)
+    SELECT new.batch_year, new.position, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_batch_position WHERE batch_year IS new.batch_year AND position IS new.position);
+    UPDATE stats_by_batch_position SET count = count + 1 WHERE batch_year IS new.batch_year AND position IS new.position;
+    INSERT INTO stats_by_batch_ministry (batch_year, ministry, count)
+    SELECT new.batch_year, new.ministry, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_batch_ministry WHERE batch_year IS new.batch_year AND ministry IS new.ministry);
+    UPDATE stats_by_batch_ministry SET count = count + 1 WHERE batch_year IS new.batch_year AND ministry IS new.ministry;
+    INSERT INTO stats_by_ministry_position (ministry, position, count)
+    SELECT new.ministry, new.position, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_ministry_position WHERE ministry IS new.ministry AND position IS new.position);
+    UPDATE stats_by_ministry_position SET count = count + 1 WHERE ministry IS new.ministry AND position IS new.position;
+END;
+
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_stats_delete AFTER DELETE ON lateral_entrants BEGIN
+    UPDATE stats_by_batch SET count = count - 1 WHERE batch_year IS old.batch_year;
+    DELETE FROM stats_by_batch WHERE batch_year IS old.batch_year AND count <= 0;
+    UPDATE stats_by_ministry SET count = count - 1 WHERE ministry IS old.ministry;
+    DELETE FROM stats_by_ministry WHERE ministry IS old.ministry AND count <= 0;
+    UPDATE stats_by_position SET count = count - 1 WHERE position IS old.position;
+    DELETE FROM stats_by_position WHERE position IS old.position AND count <= 0;
+    UPDATE stats_by_department SET count = count - 1 WHERE department IS old.department;
+    DELETE FROM stats_by_department WHERE department IS old.department AND count <= 0;
+    UPDATE stats_by_state SET count = count - 1 WHERE state IS old.state;
+    DELETE FROM stats_by_state WHERE state IS old.state AND count <= 0;
+    UPDATE stats_by_batch_position SET count = count - 1 WHERE batch_year IS old.batch_year AND position IS old.position;
+    DELETE FROM stats_by_batch_position WHERE batch_year IS old.batch_year AND position IS old.position AND count <= 0;
+    UPDATE stats_by_batch_ministry SET count = count - 1 WHERE batch_year IS old.batch_year AND ministry IS old.ministry;
+    DELETE FROM stats_by_batch_ministry WHERE batch_year IS old.batch_year AND ministry IS old.ministry AND count <= 0;
+    UPDATE stats_by_ministry_position SET count = count - 1 WHERE ministry IS old.ministry AND position IS old.position;
+    DELETE FROM stats_by_ministry_position WHERE ministry IS old.ministry AND position IS old.position AND count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_stats_update
+AFTER UPDATE OF batch_year, ministry, position, department, state ON lateral_entrants BEGIN
+    UPDATE stats_by_batch SET count = count - 1 WHERE batch_year IS old.batch_year;
+    DELETE FROM stats_by_batch WHERE batch_year IS old.batch_year AND count <= 0;
+    UPDATE stats_by_ministry SET count = count - 1 WHERE ministry IS old.ministry;
+    DELETE FROM stats_by_ministry WHERE ministry IS old.ministry AND count <= 0;
+    UPDATE stats_by_position SET count = count - 1 WHERE position IS old.position;
+    DELETE FROM stats_by_position WHERE position IS old.position AND count <= 0;
+    UPDATE stats_by_department SET count = count - 1 WHERE department IS old.department;
+    DELETE FROM stats_by_department WHERE department IS old.department AND count <= 0;
+    UPDATE stats_by_state SET count = count - 1 WHERE state IS old.state;
+    DELETE FROM stats_by_state WHERE state IS old.state AND count <= 0;
+    UPDATE stats_by_batch_position SET count = count - 1 WHERE batch_year IS old.batch_year AND position IS old.position;
+    DELETE FROM stats_by_batch_position WHERE batch_year IS old.batch_year AND position IS old.position AND count <= 0;
+    UPDATE stats_by_batch_ministry SET count = count - 1 WHERE batch_year IS old.batch_year AND ministry IS old.ministry;
+    DELETE FROM stats_by_batch_ministry WHERE batch_year IS old.batch_year AND ministry IS old.ministry AND count <= 0;
+    UPDATE stats_by_ministry_position SET count = count - 1 WHERE ministry IS old.ministry AND position IS old.position;
+    DELETE FROM stats_by_ministry_position WHERE ministry IS old.ministry AND position IS old.position AND count <= 0;
+    INSERT INTO stats_by_batch (batch_year, count)
+    SELECT new.batch_year, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_batch WHERE batch_year IS new.batch_year);
+    UPDATE stats_by_batch SET count = count + 1 WHERE batch_year IS new.batch_year;
+    INSERT INTO stats_by_ministry (ministry, count)
+    SELECT new.ministry, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_ministry WHERE ministry IS new.ministry);
+    UPDATE stats_by_ministry SET count = count + 1 WHERE ministry IS new.ministry;
+    INSERT INTO stats_by_position (position, count)
+    SELECT new.position, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_position WHERE position IS new.position);
+    UPDATE stats_by_position SET count = count + 1 WHERE position IS new.position;
+    INSERT INTO stats_by_department (department, count)
+    SELECT new.department, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_department WHERE department IS new.department);
+    UPDATE stats_by_department SET count = count + 1 WHERE department IS new.department;
+    INSERT INTO stats_by_state (state, count)
+    SELECT new.state, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_state WHERE state IS new.state);
+    UPDATE stats_by_state SET count = count + 1 WHERE state IS new.state;
+    INSERT INTO stats_by_batch_position (batch_year, position, count)
+    SELECT new.batch_year, new.position, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_batch_position WHERE batch_year IS new.batch_year AND position IS new.position);
+    UPDATE stats_by_batch_position SET count = count + 1 WHERE batch_year IS new.batch_year AND position IS new.position;
+    INSERT INTO stats_by_batch_ministry (batch_year, ministry, count)
+    SELECT new.batch_year, new.ministry, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_batch_ministry WHERE batch_year IS new.batch_year AND ministry IS new.ministry);
+    UPDATE stats_by_batch_ministry SET count = count + 1 WHERE batch_year IS new.batch_year AND ministry IS new.ministry;
+    INSERT INTO stats_by_ministry_position (ministry, position, count)
+    SELECT new.ministry, new.position, 0 WHERE NOT EXISTS (SELECT 1 FROM stats_by_ministry_position WHERE ministry IS new.ministry AND position IS new.position);
+    UPDATE stats_by_ministry_position SET count = count + 1 WHERE ministry IS new.ministry AND position IS new.position;
+END;
+
+-- First/last appointment per batch (MIN/MAX seek) for /api/batches
+CREATE INDEX IF NOT EXISTS idx_batch_appointment ON lateral_entrants(batch_year, date_of_appointment);
+
+-- Recent appointments for /api/stats (date DESC, then id)
+CREATE INDEX IF NOT EXISTS idx_appointment_recent ON lateral_entrants(date_of_appointment DESC);
+
+-- Keep ministry_id / department_id in step with the free-text columns. A known
+-- spelling resolves through its alias; a new one gets its own canonical row,
+-- which the next database/migrate.py run merges with any equivalent spelling.
+-- Rows whose ids already match are left alone, so the update does not reach
+-- change_log as an extra 'U' (see lateral_entrants_changes_update).
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_dimensions_insert AFTER INSERT ON lateral_entrants BEGIN
+    INSERT OR IGNORE INTO ministries (ministry_name)
+    SELECT new.ministry WHERE new.ministry IS NOT NULL AND NOT EXISTS (SELECT 1 FROM ministry_aliases WHERE alias = new.ministry);
+    INSERT OR IGNORE INTO ministry_aliases (alias, ministry_id)
+    SELECT new.ministry, id FROM ministries WHERE ministry_name = new.ministry;
+    INSERT OR IGNORE INTO departments (department_name)
+    SELECT new.department WHERE new.department IS NOT NULL AND NOT EXISTS (SELECT 1 FROM department_aliases WHERE alias = new.department);
+    INSERT OR IGNORE INTO department_aliases (alias, department_id)
+    SELECT new.department, id FROM departments WHERE department_name = new.department;
+    UPDATE lateral_entrants SET
+        ministry_id = (SELECT ministry_id FROM ministry_aliases WHERE alias = new.ministry),
+        department_id = (SELECT department_id FROM department_aliases WHERE alias = new.department)
+    WHERE id = new.id
+      AND (ministry_id IS NOT (SELECT ministry_id FROM ministry_aliases WHERE alias = new.ministry)
+           OR department_id IS NOT (SELECT department_id FROM department_aliases WHERE alias = new.department));
+END;
+
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_dimensions_update
+AFTER UPDATE OF ministry, department ON lateral_entrants BEGIN
+    INSERT OR IGNORE INTO ministries (ministry_name)
+    SELECT new.ministry WHERE new.ministry IS NOT NULL AND NOT EXISTS (SELECT 1 FROM ministry_aliases WHERE alias = new.ministry);
+    INSERT OR IGNORE INTO ministry_aliases (alias, ministry_id)
+    SELECT new.ministry, id FROM ministries WHERE ministry_name = new.ministry;
+    INSERT OR IGNORE INTO departments (department_name)
+    SELECT new.department WHERE new.department IS NOT NULL AND NOT EXISTS (SELECT 1 FROM department_aliases WHERE alias = new.department);
+    INSERT OR IGNORE INTO department_aliases (alias, department_id)
+    SELECT new.department, id FROM departments WHERE department_name = new.department;
+    UPDATE lateral_entrants SET
+        ministry_id = (SELECT ministry_id FROM ministry_aliases WHERE alias = new.ministry),
+        department_id = (SELECT department_id FROM department_aliases WHERE alias = new.department)
+    WHERE id = new.id
+      AND (ministry_id IS NOT (SELECT ministry_id FROM ministry_aliases WHERE alias = new.ministry)
+           OR department_id IS NOT (SELECT department_id FROM department_aliases WHERE alias = new.department));
+END;
+
+-- Change-data capture for /api/changes: one row per insert, update or delete on
+-- lateral_entrants and the child tables the API serves, in commit order. seq is
+-- AUTOINCREMENT so it only grows, even after old entries are deleted; a client
+-- that has applied everything up to seq N asks for changes since N.
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name VARCHAR(64) NOT NULL,
+    row_id INTEGER NOT NULL,
+    entrant_id INTEGER,
+    op CHAR(1) NOT NULL, -- I, U or D
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_changes_insert AFTER INSERT ON lateral_entrants BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('lateral_entrants', new.id, new.id, 'I');
+END;
+
+-- ministry_id / department_id are derived from the text columns; updates that only
+-- fill or re-point them (the dimension triggers, database/migrate.py) are not changes
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_changes_update AFTER UPDATE ON lateral_entrants
+WHEN NOT (old.ministry IS new.ministry AND old.department IS new.department
+          AND (old.ministry_id IS NOT new.ministry_id OR old.department_id IS NOT new.department_id)) BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('lateral_entrants', new.id, new.id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS lateral_entrants_changes_delete AFTER DELETE ON lateral_entrants BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('lateral_entrants', old.id, old.id, 'D');
+END;
+
+CREATE TRIGGER IF NOT EXISTS professional_details_changes_insert AFTER INSERT ON professional_details BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('professional_details', new.id, new.entrant_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS professional_details_changes_update AFTER UPDATE ON professional_details BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('professional_details', new.id, new.entrant_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS professional_details_changes_delete AFTER DELETE ON professional_details BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('professional_details', old.id, old.entrant_id, 'D');
+END;
+
+CREATE TRIGGER IF NOT EXISTS education_details_changes_insert AFTER INSERT ON education_details BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('education_details', new.id, new.entrant_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS education_details_changes_update AFTER UPDATE ON education_details BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('education_details', new.id, new.entrant_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS education_details_changes_delete AFTER DELETE ON education_details BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('education_details', old.id, old.entrant_id, 'D');
+END;
+
+CREATE TRIGGER IF NOT EXISTS media_coverage_changes_insert AFTER INSERT ON media_coverage BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('media_coverage', new.id, new.entrant_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS media_coverage_changes_update AFTER UPDATE ON media_coverage BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('media_coverage', new.id, new.entrant_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS media_coverage_changes_delete AFTER DELETE ON media_coverage BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('media_coverage', old.id, old.entrant_id, 'D');
+END;
+
+CREATE TRIGGER IF NOT EXISTS achievements_changes_insert AFTER INSERT ON achievements BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('achievements', new.id, new.entrant_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS achievements_changes_update AFTER UPDATE ON achievements BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('achievements', new.id, new.entrant_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS achievements_changes_delete AFTER DELETE ON achievements BEGIN
+    INSERT INTO change_log (table_name, row_id, entrant_id, op) VALUES ('achievements', old.id, old.entrant_id, 'D');
+END;
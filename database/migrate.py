@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Bring an existing Lateral Entry Portal database up to the current schema
+Applies lateral_entry_schema.sql (idempotent) and backfills derived tables
+Usage: python database/migrate.py [path/to/lateral_entry.db]
+"""
+
+import re
+import sqlite3
+import sys
+from collections import Counter
+from pathlib import Path
+
+DB_PATH = Path(__file__).parent / "lateral_entry.db"
+SCHEMA_PATH = Path(__file__).parent / "lateral_entry_schema.sql"
+
+
+# Columns added to existing tables after their first release; CREATE TABLE IF
+# NOT EXISTS leaves old tables alone, so these are added before the schema runs
+ADDED_COLUMNS = [
+    ("lateral_entrants", "ministry_id", "INTEGER REFERENCES ministries(id)"),
+    ("lateral_entrants", "department_id", "INTEGER REFERENCES departments(id)"),
+    ("departments", "ministry_id", "INTEGER REFERENCES ministries(id)"),
+]
+
+
+def add_columns(conn):
+    """ALTER TABLE ... ADD COLUMN for columns an older database lacks"""
+    added = 0
+    for table, column, definition in ADDED_COLUMNS:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if existing and column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            added += 1
+    print(f"✓ Columns added ({added})")
+
+
+# Indexes on the added columns; not in the schema script, which also runs
+# on databases that do not have these columns yet. Ministry / department
+# filters of /api/entrants: equality on the canonical id, then the listing
+# order, so a filtered page sorts index entries, not rows
+ADDED_INDEXES = [
+    (
+        "idx_entrants_ministry_listing",
+        "lateral_entrants(ministry_id, batch_year, COALESCE(date_of_appointment, ''))",
+    ),
+    (
+        "idx_entrants_department_listing",
+        "lateral_entrants(department_id, batch_year, COALESCE(date_of_appointment, ''))",
+    ),
+]
+
+
+def add_indexes(conn):
+    """CREATE INDEX for indexes on columns added by add_columns"""
+    for name, definition in ADDED_INDEXES:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+    print(f"✓ Indexes on added columns ({len(ADDED_INDEXES)})")
+
+
+# Triggers whose definition changed after their first release; CREATE
+# TRIGGER IF NOT EXISTS keeps an old definition, so these are dropped and
+# apply_schema creates them again
+REPLACED_TRIGGERS = [
+    "lateral_entrants_dimensions_insert",
+    "lateral_entrants_dimensions_update",
+]
+
+
+def drop_replaced_triggers(conn):
+    """DROP TRIGGER for triggers the schema now defines differently"""
+    for name in REPLACED_TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    print(f"✓ Triggers replaced ({len(REPLACED_TRIGGERS)})")
+
+
+def apply_schema(conn):
+    """Create any tables, indexes and triggers missing from the database"""
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    print("✓ Schema applied")
+
+
+def rebuild_search_index(conn):
+    """Repopulate the FTS5 index from lateral_entrants"""
+    conn.execute(
+        "INSERT INTO lateral_entrants_fts (lateral_entrants_fts) VALUES ('rebuild')"
+    )
+    conn.execute(
+        "INSERT INTO lateral_entrants_fts (lateral_entrants_fts) VALUES ('optimize')"
+    )
+    count = conn.execute("SELECT COUNT(*) FROM lateral_entrants").fetchone()[0]
+    print(f"✓ Search index rebuilt ({count} entrants)")
+
+
+def rebuild_stats_tables(conn):
+    """Recount the trigger-maintained stats_by_* summary tables from scratch"""
+    tables = [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master"
+            " WHERE type = 'table' AND name LIKE 'stats\\_by\\_%' ESCAPE '\\'"
+            " ORDER BY name"
+        )
+    ]
+    for table in tables:
+        keys = ", ".join(
+            row[1]
+            for row in conn.execute(f"PRAGMA table_info({table})")
+            if row[1] != "count"
+        )
+        conn.execute(f"DELETE FROM {table}")
+        conn.execute(
+            f"INSERT INTO {table} ({keys}, count)"
+            f" SELECT {keys}, COUNT(*) FROM lateral_entrants GROUP BY {keys}"
+        )
+    print(f"✓ Stats tables rebuilt ({len(tables)} tables)")
+
+
+# lateral_entrants text column -> (dimension table, name column, alias table, key)
+DIMENSIONS = {
+    "ministry": ("ministries", "ministry_name", "ministry_aliases", "ministry_id"),
+    "department": (
+        "departments",
+        "department_name",
+        "department_aliases",
+        "department_id",
+    ),
+}
+
+_DIMENSION_PREFIX = re.compile(r"^(ministry|department)(of|for)")
+
+
+def dimension_key(text):
+    """
+    Spellings with the same key name the same ministry or department:
+    'Department of Health & Family Welfare' and 'Health and Family Welfare'
+    both give 'healthandfamilywelfare'
+    """
+    key = re.sub(r"[^a-z0-9]", "", text.casefold().replace("&", "and"))
+    return _DIMENSION_PREFIX.sub("", key) or key
+
+
+def canonical_spelling(spellings):
+    """Most used spelling; ties prefer 'and' over '&', then the longest"""
+    return min(
+        spellings,
+        key=lambda text: (-spellings[text], "&" in text, -len(text), text),
+    )
+
+
+def rebuild_dimension(conn, column):
+    """
+    Group every spelling of a ministry/department by dimension_key, keep one
+    canonical row per group (the oldest existing row, else one named after
+    the most used spelling), record each spelling as an alias and point
+    lateral_entrants at the canonical ids.
+    """
+    table, name_column, alias_table, key = DIMENSIONS[column]
+
+    spellings = Counter(
+        dict(
+            conn.execute(
+                f"SELECT {column}, COUNT(*) FROM lateral_entrants"
+                f" WHERE {column} IS NOT NULL GROUP BY {column}"
+            )
+        )
+    )
+    if column == "ministry":
+        for (text,) in conn.execute(
+            "SELECT ministry FROM departments WHERE ministry IS NOT NULL"
+        ):
+            spellings[text] += 0
+
+    # Existing rows: the first row of each key is canonical, later ones merge in
+    canonical = {}
+    merged = {}
+    for row_id, name in conn.execute(
+        f"SELECT id, {name_column} FROM {table} ORDER BY id"
+    ):
+        group = canonical.setdefault(dimension_key(name), row_id)
+        if group != row_id:
+            merged[row_id] = group
+    aliases = {
+        alias.casefold(): merged.get(row_id, row_id)
+        for alias, row_id in conn.execute(f"SELECT alias, {key} FROM {alias_table}")
+    }
+
+    # Spellings no alias or row covers yet become new canonical rows
+    new_groups = {}
+    for text, count in spellings.items():
+        if text.casefold() not in aliases and dimension_key(text) not in canonical:
+            new_groups.setdefault(dimension_key(text), Counter())[text] = count
+    for group_key, group in new_groups.items():
+        cursor = conn.execute(
+            f"INSERT INTO {table} ({name_column}) VALUES (?)",
+            (canonical_spelling(group),),
+        )
+        canonical[group_key] = cursor.lastrowid
+
+    for old_id, new_id in merged.items():
+        conn.execute(
+            f"UPDATE {alias_table} SET {key} = ? WHERE {key} = ?", (new_id, old_id)
+        )
+        if column == "ministry":
+            conn.execute(
+                "UPDATE departments SET ministry_id = ? WHERE ministry_id = ?",
+                (new_id, old_id),
+            )
+        conn.execute(
+            f"INSERT OR IGNORE INTO {alias_table} (alias, {key})"
+            f" SELECT {name_column}, ? FROM {table} WHERE id = ?",
+            (new_id, old_id),
+        )
+        conn.execute(f"DELETE FROM {table} WHERE id = ?", (old_id,))
+
+    names = conn.execute(f"SELECT {name_column} FROM {table}").fetchall()
+    conn.executemany(
+        f"INSERT OR IGNORE INTO {alias_table} (alias, {key}) VALUES (?, ?)",
+        [
+            (text, canonical[dimension_key(text)])
+            for text in list(spellings) + [name for (name,) in names]
+            if text.casefold() not in aliases
+        ],
+    )
+    # Only rows whose id changes, so a re-run adds nothing to the change log
+    resolved = (
+        f"(SELECT {key} FROM {alias_table} WHERE alias = lateral_entrants.{column})"
+    )
+    conn.execute(
+        f"UPDATE lateral_entrants SET {key} = {resolved} WHERE {key} IS NOT {resolved}"
+    )
+
+    rows = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    alias_count = conn.execute(f"SELECT COUNT(*) FROM {alias_table}").fetchone()[0]
+    return rows, alias_count
+
+
+def rebuild_dimensions(conn):
+    """Backfill ministry_id / department_id through the canonical dimension tables"""
+    for column, (table, _, _, _) in DIMENSIONS.items():
+        rows, aliases = rebuild_dimension(conn, column)
+        print(
+            f"✓ {table.capitalize()} normalized ({rows} canonical, {aliases} spellings)"
+        )
+
+    # A department belongs to the ministry its seed row names, else to the
+    # ministry most of its entrants are listed under
+    conn.execute(
+        "UPDATE departments SET ministry_id = COALESCE("
+        " (SELECT ministry_id FROM ministry_aliases WHERE alias = departments.ministry),"
+        " (SELECT ministry_id FROM lateral_entrants"
+        "  WHERE department_id = departments.id AND ministry_id IS NOT NULL"
+        "  GROUP BY ministry_id ORDER BY COUNT(*) DESC, ministry_id LIMIT 1))"
+    )
+
+
+# PRAGMA user_version once every step has run; api/server.py reads the
+# search index, summary and dimension tables only from then on
+MIGRATED_VERSION = 1
+
+
+def mark_migrated(conn):
+    """Record that the derived tables are populated"""
+    conn.execute(f"PRAGMA user_version = {MIGRATED_VERSION}")
+    print(f"✓ Marked as migrated (user_version {MIGRATED_VERSION})")
+
+
+MIGRATION_STEPS = [
+    add_columns,
+    add_indexes,
+    drop_replaced_triggers,
+    apply_schema,
+    rebuild_search_index,
+    rebuild_stats_tables,
+    rebuild_dimensions,
+    mark_migrated,
+]
+
+
+def migrate(db_path=DB_PATH):
+    print("=" * 70)
+    print("MIGRATING DATABASE")
+    print(f"Database: {db_path}")
+    print("=" * 70)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        for step in MIGRATION_STEPS:
+            step(conn)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"✗ Error: {e}")
+        raise
+    finally:
+        conn.close()
+
+    print("=" * 70)
+    print("✓ Migration complete")
+
+
+if __name__ == "__main__":
+    migrate(sys.argv[1] if len(sys.argv) > 1 else DB_PATH)
@@ -0,0 +1,29 @@
+"""Shared fixtures: the API on a throwaway copy of the database"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+API_DIR = PROJECT_DIR / "api"
+
+
+@pytest.fixture(params=["sql", "snapshot"])
+def client(request, tmp_path, monkeypatch):
+    """Test client on a copy of the database, with and without snapshot mode"""
+    db_path = tmp_path / "lateral_entry.db"
+    shutil.copyfile(PROJECT_DIR / "database" / "lateral_entry.db", db_path)
+    monkeypatch.setenv("LATERAL_ENTRY_DB", str(db_path))
+    if request.param == "snapshot":
+        monkeypatch.setenv("LATERAL_ENTRY_SNAPSHOT", "1")
+    else:
+        monkeypatch.delenv("LATERAL_ENTRY_SNAPSHOT", raising=False)
+    monkeypatch.syspath_prepend(str(API_DIR))
+    sys.modules.pop("server", None)
+    import server
+
+    server.response_cache.maxsize = 0
+    yield server.app.test_client()
+    server.db_pool.close_all()
@@ -0,0 +1,39 @@
+"""
+?fields= / ?exclude= projections: the card preset covers what
+createEntrantCard renders, and an empty projection is a 400, not a 500
+Run: python -m pytest tests
+"""
+
+import pytest
+
+CARD_FIELDS = [
+    "id",
+    "name",
+    "batch_year",
+    "position",
+    "department",
+    "ministry",
+    "date_of_appointment",
+]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/entrants?fields=name&exclude=name",
+        "/api/entrants?cursor=&fields=name&exclude=name",
+        "/api/batches/2021?fields=name&exclude=name",
+        "/api/search?q=kumar&select=name&exclude=name",
+    ],
+)
+def test_empty_projection_is_rejected(client, url):
+    response = client.get(url)
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_card_preset_has_appointment_date(client):
+    response = client.get("/api/entrants?limit=5&fields=card")
+    assert response.status_code == 200
+    for entrant in response.get_json()["entrants"]:
+        assert set(entrant) == set(CARD_FIELDS)
@@ -0,0 +1,38 @@
+"""
+/api/entrants rejects a limit below 1 instead of failing to build next_cursor,
+and an offset that is not an integer; a negative offset starts at 0
+Run: python -m pytest tests
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize("limit", ["0", "-5", "ten"])
+@pytest.mark.parametrize("pagination", ["cursor=", "offset=0"])
+def test_invalid_limit_is_rejected(client, limit, pagination):
+    response = client.get(f"/api/entrants?{pagination}&limit={limit}")
+    assert response.status_code == 400
+    assert "limit" in response.get_json()["error"]
+
+
+def test_cursor_pages_with_limit_one(client):
+    response = client.get("/api/entrants?cursor=&limit=1")
+    assert response.status_code == 200
+    page = response.get_json()
+    assert len(page["entrants"]) == 1
+    assert page["has_more"] and page["next_cursor"]
+
+
+def test_invalid_offset_is_rejected(client):
+    response = client.get("/api/entrants?offset=abc")
+    assert response.status_code == 400
+    assert "offset" in response.get_json()["error"]
+
+
+def test_negative_offset_starts_at_first_page(client):
+    first = client.get("/api/entrants?limit=3").get_json()
+    response = client.get("/api/entrants?limit=3&offset=-5")
+    assert response.status_code == 200
+    page = response.get_json()
+    assert page["offset"] == 0
+    assert [e["id"] for e in page["entrants"]] == [e["id"] for e in first["entrants"]]
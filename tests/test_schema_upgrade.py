@@ -0,0 +1,63 @@
+"""
+The schema script runs on an unmigrated database (data_manager.py and
+init_database.py apply it on every start) without changing what the API
+returns before database/migrate.py has run
+Run: python -m pytest tests
+"""
+
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+API_DIR = PROJECT_DIR / "api"
+SCHEMA_PATH = PROJECT_DIR / "database" / "lateral_entry_schema.sql"
+
+URLS = [
+    "/api/search?q=kumar",
+    "/api/entrants?search=kumar",
+    "/api/entrants?ministry=Finance",
+    "/api/stats",
+]
+
+
+def responses(db_path, monkeypatch):
+    monkeypatch.setenv("LATERAL_ENTRY_DB", str(db_path))
+    monkeypatch.delenv("LATERAL_ENTRY_SNAPSHOT", raising=False)
+    monkeypatch.syspath_prepend(str(API_DIR))
+    sys.modules.pop("server", None)
+    import server
+
+    server.response_cache.maxsize = 0
+    client = server.app.test_client()
+    try:
+        results = {url: client.get(url).get_json() for url in URLS}
+        results["/api/stats"].pop("last_updated")
+        return results
+    finally:
+        server.db_pool.close_all()
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """An unmigrated copy of the database, and one with the schema applied"""
+    plain = tmp_path / "plain.db"
+    schema = tmp_path / "schema.db"
+    shutil.copyfile(PROJECT_DIR / "database" / "lateral_entry.db", plain)
+    shutil.copyfile(plain, schema)
+    conn = sqlite3.connect(schema)
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.close()
+    return plain, schema
+
+
+def test_schema_script_keeps_unmigrated_results(databases, monkeypatch):
+    plain, schema = databases
+    before = responses(plain, monkeypatch)
+    after = responses(schema, monkeypatch)
+    assert before["/api/search?q=kumar"]["count"] > 0
+    for url in URLS:
+        assert after[url] == before[url], url